@@ -1,9 +1,15 @@
 from .randomise import random_from_all_available_valid, random_vehicle_first, all_available_valid_finish_check, all_max_moves_finish_check
 from .heuristics import check_useful_move, free_carter, all_max_moves
 from .depth_first import DepthFirst
+from .move_pruning import MovePruning, get_interaction_graph
 from .breadth_first import BreadthFirst
+from .bidirectional import Bidirectional, is_goal_state, iter_goal_state_keys
 from .steprefiner import StepRefiner
 from .a_star import AStar, num_blocking_vehicles, num_two_blocking_vehicles
+from .ida_star import IDAStar
+from .beam_search import BeamSearch
+from .tablebase import Tablebase, get_state_space_bound
+from .pattern_database import PatternDatabase, get_relevant_vehicles
 
 
 __all__ = [
@@ -16,8 +22,19 @@ __all__ = [
     'all_max_moves',
     'DepthFirst',
     'BreadthFirst',
+    'MovePruning',
+    'get_interaction_graph',
+    'Bidirectional',
+    'is_goal_state',
+    'iter_goal_state_keys',
     'StepRefiner',
     'AStar',
+    'IDAStar',
+    'BeamSearch',
+    'Tablebase',
+    'get_state_space_bound',
+    'PatternDatabase',
+    'get_relevant_vehicles',
     'num_blocking_vehicles',
     'num_two_blocking_vehicles'
 ]
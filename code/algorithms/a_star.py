@@ -1,10 +1,12 @@
 import numpy as np
 import heapq
-import random
+import math
+import time
 from typing import Callable
 
-from code.classes import Board, CARTER_NAME, Mover, Direction, Game, Orientation
+from code.classes import Board, BucketQueue, CARTER_NAME, Mover, Direction, Orientation, PathTable, SeenStates, Vehicle
 from code.algorithms import free_carter, all_max_moves
+from .move_pruning import MovePruning
 
 
 def num_blocking_vehicles(state: Board) -> int:
@@ -14,7 +16,7 @@ def num_blocking_vehicles(state: Board) -> int:
     carter_row_num = state.vehicles[CARTER_NAME].start_row
     carter_row = state.locations[carter_row_num]
 
-    col_in_front_of_carter = state.vehicles[CARTER_NAME].location[-1][0] + 1
+    col_in_front_of_carter = state.vehicles[CARTER_NAME].front[0] + 1
 
     return len({
         carter_row[i]
@@ -23,6 +25,51 @@ def num_blocking_vehicles(state: Board) -> int:
     })
 
 
+def blocks_carter(state: Board, vehicle: Vehicle) -> bool:
+    """
+    Checks if a vehicle covers a square in the row of Carter in front of Carter.
+    """
+    carter = state.vehicles[CARTER_NAME]
+
+    if vehicle.is_carter:
+        return False
+
+    if vehicle.orientation == Orientation.HORIZONTAL:
+        return vehicle.lane == carter.lane and vehicle.offset > carter.offset
+
+    return (
+        vehicle.lane >= carter.offset + carter.length
+        and vehicle.offset <= carter.lane < vehicle.offset + vehicle.length
+    )
+
+
+def update_num_blocking_vehicles(state: Board, move: tuple[str, int], value: int) -> int:
+    """
+    Incremental form of 'num_blocking_vehicles': updates the value of the parent state
+    for the child state 'state' that was reached with 'move'.
+
+    Only the moved vehicle can start or stop blocking Carter, unless Carter itself
+    moved, then its row is counted again.
+    """
+    vehicle_name, steps = move
+
+    if vehicle_name == CARTER_NAME:
+        return num_blocking_vehicles(state)
+
+    vehicle = state.vehicles[vehicle_name]
+    blocks_after = blocks_carter(state, vehicle)
+
+    # the moved vehicle before the move
+    vehicle.offset -= steps
+    blocks_before = blocks_carter(state, vehicle)
+    vehicle.offset += steps
+
+    return value + blocks_after - blocks_before
+
+
+num_blocking_vehicles.update = update_num_blocking_vehicles
+
+
 def num_two_blocking_vehicles(state: Board) -> int:
     """
     Counts the number of vehicles directly blocking Carter in the front and the
@@ -31,11 +78,11 @@ def num_two_blocking_vehicles(state: Board) -> int:
     mover = Mover(state)
     carter_row_num = state.vehicles[CARTER_NAME].start_row
     carter_row: np.ndarray[object] = state.locations[carter_row_num]
-    col_in_front_of_carter = state.vehicles[CARTER_NAME].location[-1][0] + 1
+    col_in_front_of_carter = state.vehicles[CARTER_NAME].front[0] + 1
 
     # Set of unique vehicle names in front of Carter
     vehicles_first_degree = {
-        carter_row[i]
+        state.get_vehicle_name(carter_row[i])
         for i in range(col_in_front_of_carter, state.size)
         if carter_row[i] != 0
     }
@@ -50,6 +97,81 @@ def num_two_blocking_vehicles(state: Board) -> int:
     return len(vehicles_first_degree) + vehicles_second_degree_counter
 
 
+def get_two_blocking_term(state: Board, vehicle: Vehicle) -> int:
+    """
+    Gets the part of 'num_two_blocking_vehicles' of a single vehicle: 0 if it does not
+    block Carter, otherwise 1 plus 1 for every direction in which it cannot move.
+    """
+    if not blocks_carter(state, vehicle):
+        return 0
+
+    if vehicle.orientation == Orientation.HORIZONTAL:
+        lane_squares = state.locations[vehicle.lane]
+    else:
+        lane_squares = state.locations[:, vehicle.lane]
+
+    back = vehicle.offset - 1
+    front = vehicle.offset + vehicle.length
+
+    return (
+        1
+        + (back < 0 or lane_squares[back] != 0)
+        + (front >= state.size or lane_squares[front] != 0)
+    )
+
+
+def update_num_two_blocking_vehicles(state: Board, move: tuple[str, int], value: int) -> int:
+    """
+    Incremental form of 'num_two_blocking_vehicles': updates the value of the parent
+    state for the child state 'state' that was reached with 'move'.
+
+    A move only changes the squares the moved vehicle covered before and after the
+    move, so only the terms (see 'get_two_blocking_term') of the moved vehicle and the
+    vehicles next to those squares can change. Their terms are taken out for the parent
+    state (by moving the vehicle back for a moment) and added for the child state. If
+    Carter moved all vehicles in its row are counted again.
+    """
+    vehicle_name, steps = move
+
+    if vehicle_name == CARTER_NAME:
+        return num_two_blocking_vehicles(state)
+
+    vehicle = state.vehicles[vehicle_name]
+    offsets = range(
+        min(vehicle.offset, vehicle.offset - steps),
+        max(vehicle.offset, vehicle.offset - steps) + vehicle.length,
+    )
+
+    if vehicle.orientation == Orientation.HORIZONTAL:
+        changed_squares = [(vehicle.lane, offset) for offset in offsets]
+    else:
+        changed_squares = [(offset, vehicle.lane) for offset in offsets]
+
+    # the vehicles on the squares next to the changed squares
+    names = {vehicle_name}
+
+    for row, col in changed_squares:
+        for neighbour_row, neighbour_col in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+            if 0 <= neighbour_row < state.size and 0 <= neighbour_col < state.size:
+                cell_value = state.locations[neighbour_row, neighbour_col]
+
+                if cell_value != 0:
+                    names.add(state.get_vehicle_name(cell_value))
+
+    affected = [state.vehicles[name] for name in names]
+    terms_after = sum(get_two_blocking_term(state, other) for other in affected)
+
+    # the terms before the move
+    state.shift_vehicle(vehicle, -steps)
+    terms_before = sum(get_two_blocking_term(state, other) for other in affected)
+    state.shift_vehicle(vehicle, steps)
+
+    return value + terms_after - terms_before
+
+
+num_two_blocking_vehicles.update = update_num_two_blocking_vehicles
+
+
 class AStar:
     """
     This class explores Board configurations by performing a A* algorithm, starting
@@ -57,96 +179,391 @@ class AStar:
     Board states and an archive of seen Board states. It generates child states for
     valid moves and continues the search by selecting states with the lowest score
     based on depth and heuristics until a solution is found.
+
+    Queued Board states are only a state key and heuristic value in a bucket queue (see
+    'BucketQueue'), ties are broken by the largest depth. The states are expanded on a
+    single board. The moves leading to a state are stored as a single parent reference
+    per state in the path table and only rebuilt for the solution. In the lazy mode
+    (see 'run') children are queued as their parent state key and move instead, and
+    only stored when they are popped.
+
+    If the heuristic has an incremental form (an 'update' attribute, see
+    'update_num_blocking_vehicles'), the value of a child is updated from the value of
+    its parent and the move instead of calculated from scratch.
+
+    With a weight above 1 the search is a weighted A*: the heuristic counts 'weight'
+    times in the score, which finds a solution sooner at the cost of its length. See
+    'run_anytime' for a search that keeps improving the solution.
     """
-    def __init__(self, initial_state: Board, heuristic: Callable[[Board], int]=None) -> None:
+    def __init__(
+            self,
+            initial_state: Board,
+            heuristic: Callable[[Board], int]=None,
+            weight: float=1.0
+        ) -> None:
         """
         Initializes the A* algorithm with a specified Board state, setting up a
         queue of Board states where the input Board serves as the initial state.
         """
-        self.queue = []
+        self.queue = BucketQueue()
         self.heuristic = heuristic
+        self.weight = weight
+        self.initial_state = initial_state
+        self.board = initial_state.copy()
 
-        # add the input board with its score, depth, and empty move history to the heap queue
-        heapq.heappush(self.queue, (self.heuristic(initial_state), 0, random.random(), initial_state, []))
+        start_key = initial_state.get_state_key()
+        heuristic_value = self.heuristic(initial_state)
+
+        # add the state key and heuristic value of the input board with its score and
+        # depth to the bucket queue
+        self.queue.push(self.weight * heuristic_value, 0, (start_key, heuristic_value))
         self.max_queue_size = 1
 
-        self.seen_states: set[tuple[tuple[object]]] = set()
+        self.seen_states = SeenStates()
+        self.seen_states.add(initial_state)
+        self.depths: dict[int, int] = {start_key: 0}
+        self.path_table = PathTable(start_key)
+        self.move_pruning: MovePruning | None = None
+        self.lazy = False
         self.solution = None
         self.moves: list[tuple[str, int]] = []
 
+        # the solutions found by 'run_anytime'
+        self.num_expansions = 0
+        self.bound = math.inf
+        self.solutions: list[tuple[int, float, float, int]] = []
+
     def build_children(
             self,
             next_state: Board,
             depth: int,
-            current_moves: list[tuple[str, int]],
-            max_moves: bool
+            state_key: int,
+            max_moves: bool,
+            heuristic_value: int | None = None
         ) -> None:
         """
         Generates all possible child states from the picked Board state and adds them
-        to the heap queue of states if not seen earlier. Each child state represents
+        to the bucket queue of states if not seen earlier. Each child state represents
         the Board configuration after a valid move by a Vehicle.
+
+        The heuristic value of the picked state is passed to the incremental form of
+        the heuristic, if it has one.
+
+        A seen state that is reached with fewer moves than before gets the picked state
+        as its new parent and is added to the queue again with its lower depth.
+
+        With move pruning (see 'MovePruning') the moves that only change the order of
+        independent moves are not generated. A state that was already expanded is
+        added to the queue again when it is reached at the same depth with fewer
+        pruned vehicles.
         """
         mover = Mover(next_state)
+        update = getattr(self.heuristic, 'update', None) if heuristic_value is not None else None
 
         if max_moves:
             possible_moves: list[tuple[str, int]] = all_max_moves(next_state)
         else:
             possible_moves: list[tuple[str, int]] = mover.get_all_available_moves()
 
-        # add a new board instance to the heap queue for each unseen valid move
-        for move in possible_moves:
+        if self.move_pruning is not None:
+            possible_moves = self.move_pruning.filter_moves(possible_moves, state_key)
 
-            # create new board as child_state
-            data: list[tuple[str, Orientation, int, int, int]] = []
-            for vehicle in next_state.vehicles.values():
-                data.append((vehicle.name, vehicle.orientation, vehicle.location[0][0], vehicle.location[0][1], vehicle.length))
+        # only queue the parent, the move and the value of the child, the child is
+        # stored when it is popped
+        if self.lazy and update is not None:
+            for move in mover.iter_children(possible_moves):
 
-            child_state = Game.setup_board(Board(next_state.size), data)
+                # skip children that were already stored with as few moves
+                if self.move_pruning is None and self.depths.get(next_state.get_state_key(), math.inf) <= depth + 1:
+                    continue
 
-            new_mover = Mover(child_state)
+                child_value = update(next_state, move, heuristic_value)
+                score = depth + 1 + self.weight * child_value
+                self.queue.push(score, depth + 1, (state_key, move, child_value))
 
-            # make the valid move in the state
-            new_mover.move_vehicle(move)
+            if len(self.queue) > self.max_queue_size:
+                self.max_queue_size = len(self.queue)
 
-            # https://www.geeksforgeeks.org/how-to-fix-the-typeerror-unhashable-type-numpy-ndarray/
-            if tuple(map(tuple, child_state.locations)) not in self.seen_states:
-                self.seen_states.add(tuple(map(tuple, child_state.locations)))
+            return
 
-                if len(self.seen_states) % 50000 == 0:
-                    print(f'Number of seen states: {len(self.seen_states)}, Number of moves made: {len(current_moves) + 1}')
+        # expand the children in place and only queue the state keys of the unseen ones
+        for move in mover.iter_children(possible_moves):
+            child_key = self.reach_state(next_state, depth + 1, state_key, move)
 
-                # add the state with its score to the heap queue
-                score = depth + 1 + self.heuristic(child_state)
-                heapq.heappush(self.queue, (score, depth + 1, random.random(), child_state, current_moves + [move]))
+            if child_key is None:
+                continue
 
-                # keep track of statistics
-                if len(self.queue) > self.max_queue_size:
-                    self.max_queue_size = len(self.queue)
+            # add the state with its score to the bucket queue
+            if update is not None:
+                child_value = update(next_state, move, heuristic_value)
+            else:
+                child_value = self.heuristic(next_state)
+
+            score = depth + 1 + self.weight * child_value
+            self.queue.push(score, depth + 1, (child_key, child_value))
 
-    def run(self, max_moves: bool=False) -> None:
+            # keep track of statistics
+            if len(self.queue) > self.max_queue_size:
+                self.max_queue_size = len(self.queue)
+
+    def reach_state(
+            self,
+            next_state: Board,
+            depth: int,
+            state_key: int,
+            move: tuple[str, int]
+        ) -> int | None:
+        """
+        Stores the child state 'next_state', reached from the state with the state key
+        with the move, if it was not seen before or reached with fewer moves than before.
+
+        Returns the state key of the child if it has to be queued, None otherwise.
+        """
+        if self.seen_states.add(next_state) or depth < self.depths[next_state.get_state_key()]:
+            child_key = next_state.get_state_key()
+            self.depths[child_key] = depth
+            self.path_table.add(child_key, state_key, move)
+
+            if self.move_pruning is not None:
+                self.move_pruning.add(child_key, depth, move)
+
+            if len(self.seen_states) % 50000 == 0:
+                print(f'Number of seen states: {len(self.seen_states)}, Number of moves made: {depth}')
+
+            return child_key
+
+        if self.move_pruning is not None and self.move_pruning.merge(next_state.get_state_key(), depth, move):
+            return next_state.get_state_key()
+
+        return None
+
+    def run(self, max_moves: bool=False, move_pruning: bool=False, lazy: bool=False) -> None:
         """
         Runs the algorithm until all possible Board states are visited or a solution
         is found.
+
+        If move_pruning == True:
+            - moves that only change the order of independent moves are not generated
+              (see 'MovePruning')
+
+        If lazy == True:
+            - the children of an expanded state are queued as their parent state key,
+              move and heuristic value, which the incremental form of the heuristic
+              gives from the parent's value and the move, so their score is exact
+            - a child is only checked against the seen states and stored (its depth,
+              seen state and parent reference) when it is popped
+            - falls back to the regular mode if the heuristic has no incremental form
+
+        NB.
+        The lazy mode only stores the children that are popped before the solution is
+        found, but a state can be queued once for every move leading to it.
         """
+        if move_pruning:
+            self.move_pruning = MovePruning(self.initial_state, reopen=True)
+
+        self.lazy = lazy and getattr(self.heuristic, 'update', None) is not None
+        current_state = self.board
+        mover = Mover(current_state)
+
+        # the state the board is in, siblings of lazy entries are popped one after
+        # another and share the parent state
+        board_key = None
+
         while self.queue:
 
-            # pop the state with the lowest score; pick randomly if tied
-            score, depth, random_boundary, current_state, move_history = heapq.heappop(self.queue)
+            # pop the state with the lowest score; pick the deepest if tied
+            score, depth, entry = self.queue.pop()
+
+            if len(entry) == 3:
+
+                # build the child of a lazy entry from its parent and move
+                parent_key, move, heuristic_value = entry
+
+                if board_key != parent_key:
+                    current_state.set_state_key(parent_key)
+
+                mover.apply_move(move)
+                board_key = parent_key
+                state_key = self.reach_state(current_state, depth, parent_key, move)
+
+                if state_key is None:
+                    mover.undo_move(move)
+                    continue
+
+            else:
+                state_key, heuristic_value = entry
+
+                # skip states that were reached with fewer moves after they were queued
+                if depth > self.depths[state_key]:
+                    continue
+
+                if board_key != state_key:
+                    current_state.set_state_key(state_key)
+
+            board_key = state_key
 
             # make the final move when carter can finish the game in one move
             if free_carter(current_state):
                 steps: int = free_carter(current_state)
-                mover = Mover(current_state)
                 move = (CARTER_NAME, steps)
 
                 mover.move_vehicle(move)
-                move_history.append(move)
 
                 self.solution = current_state
-                self.moves: list[tuple[str, int]] = move_history
+                self.moves: list[tuple[str, int]] = self.path_table.get_moves(state_key) + [move]
 
                 break
 
-            self.build_children(current_state, depth, move_history, max_moves)
+            self.build_children(current_state, depth, state_key, max_moves, heuristic_value)
 
         self.solution = current_state
+
+    def run_anytime(
+            self,
+            max_moves: bool=False,
+            weight: float=3.0,
+            weight_step: float=0.5,
+            time_budget: float | None = None,
+            max_expansions: int | None = None
+        ) -> None:
+        """
+        Runs Anytime Repairing A* (ARA*): a weighted A* with 'weight' finds a first
+        solution quickly, then the weight is lowered by 'weight_step' and the search
+        continues, reusing the states it already reached, to find shorter solutions.
+        This stops when the solution is proven to be the shortest or when the budget
+        (seconds or expanded states) runs out, self.moves is then the best solution
+        found so far.
+
+        Every solution is appended to self.solutions with:
+            - the number of moves
+            - the bound: the solution is at most this many times as long as the
+              shortest solution
+            - the seconds since the start
+            - the number of expanded states
+
+        States are stored as state keys with their depth (the fewest moves found to
+        them) and are expanded on a single board. A state reached with fewer moves
+        after it was expanded in the current round is kept aside, and searched again
+        in the next round with the lower weight.
+
+        NB.
+        The bound only holds for a heuristic that never overestimates the number of
+        moves, like 'num_blocking_vehicles'.
+        """
+        start_time = time.time()
+        board = self.initial_state.copy()
+        mover = Mover(board)
+        start_key = board.get_state_key()
+
+        depths: dict[int, int] = {start_key: 0}
+        heuristic_values: dict[int, int] = {start_key: self.heuristic(board)}
+        path_table = PathTable(start_key)
+
+        # the number of moves of the best solution, and the state carter finishes from
+        best = math.inf
+        best_key = None
+
+        open_states = {start_key}
+        inconsistent: set[int] = set()
+
+        def out_of_budget() -> bool:
+            return (
+                time_budget is not None and time.time() - start_time >= time_budget
+                or max_expansions is not None and self.num_expansions >= max_expansions
+            )
+
+        while True:
+            queue = [
+                (depths[key] + weight * heuristic_values[key], depths[key], key)
+                for key in open_states
+            ]
+            heapq.heapify(queue)
+            closed: set[int] = set()
+
+            # search until no queued state can lead to a better solution
+            while queue and queue[0][0] + 1 < best and not out_of_budget():
+                _, depth, state_key = heapq.heappop(queue)
+
+                # skip entries of states that were reached with fewer moves later
+                if state_key in closed or depth != depths[state_key]:
+                    continue
+
+                open_states.discard(state_key)
+                closed.add(state_key)
+                board.set_state_key(state_key)
+                self.num_expansions += 1
+
+                if free_carter(board):
+                    if depth + 1 < best:
+                        best = depth + 1
+                        best_key = state_key
+
+                    continue
+
+                if max_moves:
+                    possible_moves = all_max_moves(board)
+                else:
+                    possible_moves = mover.get_all_available_moves()
+
+                for move in mover.iter_children(possible_moves):
+                    child_key = board.get_state_key()
+
+                    if depths.get(child_key, math.inf) <= depth + 1:
+                        continue
+
+                    depths[child_key] = depth + 1
+                    path_table.add(child_key, state_key, move)
+
+                    if child_key not in heuristic_values:
+                        heuristic_values[child_key] = self.heuristic(board)
+
+                    if child_key in closed:
+                        inconsistent.add(child_key)
+                    else:
+                        open_states.add(child_key)
+                        heapq.heappush(queue, (depth + 1 + weight * heuristic_values[child_key], depth + 1, child_key))
+
+                # keep track of statistics
+                if len(queue) > self.max_queue_size:
+                    self.max_queue_size = len(queue)
+
+            open_states |= inconsistent
+            inconsistent = set()
+
+            # states on the path may have been reached with fewer moves since
+            if best_key is not None:
+                moves = path_table.get_moves(best_key)
+                best = len(moves) + 1
+
+            # the shortest any solution can be, from the states that are not searched yet
+            lower_bound = min(
+                (depths[key] + heuristic_values[key] + 1 for key in open_states),
+                default=math.inf,
+            )
+            bound = min(weight, best / lower_bound) if best < math.inf else math.inf
+            bound = max(bound, 1.0)
+
+            if best_key is not None and (not self.solutions or best < self.solutions[-1][0] or bound < self.bound):
+                self.bound = bound
+                self.moves = moves
+                self.solutions.append((best, bound, time.time() - start_time, self.num_expansions))
+
+                print(f'Solution: {best} moves, at most {bound:.2f} times the shortest')
+
+            if bound == 1.0 or out_of_budget() or (not open_states and best_key is None):
+                break
+
+            weight = max(weight - weight_step, 1.0)
+
+        if best_key is None:
+            print('No solution found')
+
+            return
+
+        # make the final move when carter can finish the game in one move
+        board.set_state_key(best_key)
+        move = (CARTER_NAME, free_carter(board))
+        mover.move_vehicle(move)
+
+        self.moves.append(move)
+        self.solution = board
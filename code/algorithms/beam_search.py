@@ -0,0 +1,200 @@
+import heapq
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable
+
+from code.classes import Board, CARTER_NAME, FingerprintSet, Mover, PathTable
+from .heuristics import free_carter, all_max_moves
+
+
+class BeamSearch:
+    """
+    This class solves a Board by performing a beam search: a Breadth First Search that
+    only keeps the 'width' best states of every layer, according to a heuristic
+    (lowest first, ties are broken randomly).
+
+    Only the states that are kept take memory: their state keys in the beam, a parent
+    reference in the path table and a 64-bit fingerprint in the seen filter (see
+    'FingerprintSet'), so memory is bounded by 'width' times the depth of the search.
+    Children that were kept in an earlier layer are skipped. Two states with the same
+    fingerprint only skip a state and never make a solution invalid.
+
+    The search does not guarantee the shortest solution, a wider beam gives shorter
+    solutions at the cost of time and memory. See 'run_parallel' to try several widths
+    at once.
+    """
+    def __init__(
+            self,
+            initial_state: Board,
+            heuristic: Callable[[Board], int],
+            width: int=1000
+        ) -> None:
+        """
+        Initializes the beam search with a copy of the specified Board state, a
+        heuristic and the number of states kept per layer.
+        """
+        self.initial_state = initial_state.copy()
+        self.heuristic = heuristic
+        self.width = width
+        self.seen = FingerprintSet()
+
+        # keep track of statistics
+        self.num_seen_states = 0
+        self.max_queue_size = 1
+
+        self.solution = None
+        self.moves: list[tuple[str, int]] = []
+
+    def run(self, max_moves: bool=False, max_depth: int | None = None) -> None:
+        """
+        Runs the algorithm until a solution is found, the beam is empty or 'max_depth'
+        layers are searched.
+
+        If the heuristic has an incremental form (see 'AStar'), the value of a child is
+        updated from the value of its parent.
+        """
+        board = self.initial_state.copy()
+        mover = Mover(board)
+        start_key = board.get_state_key()
+
+        path_table = PathTable(start_key)
+        seen = self.seen = FingerprintSet()
+        seen.add(start_key)
+        update = getattr(self.heuristic, 'update', None)
+
+        if free_carter(board):
+            self.finish(board, mover, path_table, start_key)
+
+            return
+
+        beam = [(self.heuristic(board), start_key)]
+        depth = 0
+
+        while beam and (max_depth is None or depth < max_depth):
+            candidates = []
+
+            for heuristic_value, state_key in beam:
+                board.set_state_key(state_key)
+
+                if max_moves:
+                    possible_moves = all_max_moves(board)
+                else:
+                    possible_moves = mover.get_all_available_moves()
+
+                for move in mover.iter_children(possible_moves):
+                    child_key = board.get_state_key()
+
+                    if child_key in seen:
+                        continue
+
+                    # make the final move when carter can finish the game in one move
+                    if free_carter(board):
+                        path_table.add(child_key, state_key, move)
+                        self.finish(board, mover, path_table, child_key)
+
+                        return
+
+                    if update is not None:
+                        child_value = update(board, move, heuristic_value)
+                    else:
+                        child_value = self.heuristic(board)
+
+                    candidates.append((child_value, random.random(), child_key, state_key, move))
+
+            if len(candidates) > self.max_queue_size:
+                self.max_queue_size = len(candidates)
+
+            # keep the best children, a state reached from several parents is kept once
+            heapq.heapify(candidates)
+            beam = []
+
+            while candidates and len(beam) < self.width:
+                child_value, _, child_key, state_key, move = heapq.heappop(candidates)
+
+                if not seen.add(child_key):
+                    continue
+
+                path_table.add(child_key, state_key, move)
+                beam.append((child_value, child_key))
+
+            depth += 1
+            self.num_seen_states += len(beam)
+
+            print(f'Number of seen states: {self.num_seen_states}, Number of moves made: {depth}')
+
+        print('No solution found')
+
+    def finish(self, board: Board, mover: Mover, path_table: PathTable, state_key: int) -> None:
+        """
+        Stores the solution that ends in the state with the state key, after the final
+        move of carter.
+        """
+        board.set_state_key(state_key)
+        move = (CARTER_NAME, free_carter(board))
+        mover.move_vehicle(move)
+
+        self.moves = path_table.get_moves(state_key) + [move]
+        self.solution = board
+
+    def run_parallel(
+            self,
+            widths: list[int],
+            max_moves: bool=False,
+            max_depth: int | None = None,
+            processes: int | None = None
+        ) -> None:
+        """
+        Runs a beam search for every width in a separate process and keeps the
+        shortest solution. The width of that search is stored in self.width.
+
+        NB.
+        The heuristic is sent to the processes, so it has to be defined at the top
+        level of a module (like 'num_blocking_vehicles').
+        """
+        with ProcessPoolExecutor(processes) as executor:
+            results = list(executor.map(
+                run_beam_search,
+                [self.initial_state] * len(widths),
+                [self.heuristic] * len(widths),
+                widths,
+                [max_moves] * len(widths),
+                [max_depth] * len(widths),
+            ))
+
+        solved = [
+            (len(moves), width, moves)
+            for width, moves in zip(widths, results)
+            if moves
+        ]
+
+        if not solved:
+            print('No solution found')
+
+            return
+
+        _, self.width, self.moves = min(solved)
+
+        board = self.initial_state.copy()
+        mover = Mover(board)
+
+        for move in self.moves:
+            mover.apply_move(move)
+
+        self.solution = board
+
+
+def run_beam_search(
+        initial_state: Board,
+        heuristic: Callable[[Board], int],
+        width: int,
+        max_moves: bool,
+        max_depth: int | None
+    ) -> list[tuple[str, int]]:
+    """
+    Runs a beam search with the width and returns the moves of the solution, empty
+    when no solution was found. Used by 'BeamSearch.run_parallel'.
+    """
+    beam_search = BeamSearch(initial_state, heuristic, width)
+    beam_search.run(max_moves, max_depth)
+
+    return beam_search.moves
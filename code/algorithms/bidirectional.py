@@ -0,0 +1,254 @@
+from typing import Iterator
+
+from code.classes import Board, Mover, CARTER_NAME, Orientation, PathTable
+
+
+def is_goal_state(board: Board) -> bool:
+    """
+    Checks if the front of carter is on the last column of the board.
+    """
+    carter = board.vehicles[CARTER_NAME]
+
+    return carter.offset + carter.length == board.size
+
+
+def iter_goal_state_keys(board: Board) -> Iterator[int]:
+    """
+    Yields the state keys of all goal states of the board: all placements of
+    the vehicles on their lanes with the front of carter on the last column.
+
+    Carter is fixed at the exit, the other vehicles are placed one by one in
+    the order of the state key layout (see 'Board.get_key_layout'):
+        - a vehicle can be on any offset in its lane, as long as it stays
+          behind the vehicles in front of it in the same lane
+        - and does not cover a square that is covered by a vehicle placed
+          before it (tracked as a bitmask of the whole board)
+    """
+    layout = board.get_key_layout()
+    vehicles = [board.vehicles[name] for name, *_ in layout]
+
+    # For every vehicle the squares it covers at every relative offset
+    placements: list[list[tuple[int, int]]] = []
+
+    for vehicle, (name, min_offset, radix, weight) in zip(vehicles, layout):
+        offsets = range(radix)
+
+        if name == CARTER_NAME:
+            offsets = [board.size - vehicle.length - min_offset]
+
+            # Carter can never reach the exit if a vehicle is in front of it
+            if offsets[0] >= radix:
+                return
+
+        step = 1 if vehicle.orientation == Orientation.HORIZONTAL else board.size
+        lane_start = (
+            vehicle.lane * board.size
+            if vehicle.orientation == Orientation.HORIZONTAL
+            else vehicle.lane
+        )
+        cells = sum(1 << (i * step) for i in range(vehicle.length))
+
+        placements.append([
+            (relative_offset, cells << (lane_start + (min_offset + relative_offset) * step))
+            for relative_offset in offsets
+        ])
+
+    # For every vehicle its lane mates placed before it, and whether they are behind it
+    lane_mates: list[list[tuple[int, bool]]] = [
+        [
+            (j, other.offset < vehicle.offset)
+            for j, other in enumerate(vehicles[:i])
+            if other.orientation == vehicle.orientation and other.lane == vehicle.lane
+        ]
+        for i, vehicle in enumerate(vehicles)
+    ]
+
+    relative_offsets = [0] * len(vehicles)
+
+    def place(i: int, occupied: int, key: int) -> Iterator[int]:
+        if i == len(vehicles):
+            yield key
+
+            return
+
+        weight = layout[i][3]
+
+        for relative_offset, cells in placements[i]:
+            if occupied & cells:
+                continue
+
+            # Lane mates keep their order, so the relative offsets never decrease
+            if any(
+                relative_offsets[j] > relative_offset
+                if behind
+                else relative_offsets[j] < relative_offset
+                for j, behind in lane_mates[i]
+            ):
+                continue
+
+            relative_offsets[i] = relative_offset
+
+            yield from place(i + 1, occupied | cells, key + relative_offset * weight)
+
+    yield from place(0, 0, 0)
+
+
+class Bidirectional:
+    """
+    This class solves a Board by performing a Breadth First Search from the initial
+    Board state and from the set of goal states at the same time, until the two
+    searches meet.
+
+    Every move is reversible, so searching backwards from the goal states uses the
+    same moves as searching forwards. Each step the side with the smallest layer is
+    expanded by a whole layer, which keeps both searches at about half the depth of
+    the solution.
+    """
+    def __init__(self, initial_state: Board) -> None:
+        """
+        Initializes the bidirectional search with a specified Board state.
+
+        The goal states are only enumerated once the backward search is cheaper than
+        the forward search.
+        """
+        self.initial_state = initial_state
+        self.max_queue_size = 1
+        self.num_seen_states = 0
+
+        self.solution = None
+        self.moves: list[tuple[str, int]] = []
+
+    def expand_layer(
+            self,
+            board: Board,
+            mover: Mover,
+            layer: list[int],
+            depth: int,
+            seen: dict[int, int],
+            parents: dict,
+            other_seen: dict[int, int] | None,
+            forwards: bool
+        ) -> tuple[list[int], tuple[int, int] | None]:
+        """
+        Generates the next layer of one side of the search. Parents are stored as the
+        state the child was reached from and the move, backwards the move is reversed
+        so it leads from the child to its parent.
+
+        Returns the next layer and the shortest meeting found (total number of moves
+        and state key), checking the seen states of the other side, or the goal states
+        themselves while they are not enumerated yet ('other_seen' is None).
+        """
+        next_layer: list[int] = []
+        meeting: tuple[int, int] | None = None
+
+        for state_key in layer:
+            board.set_state_key(state_key)
+
+            for move in mover.iter_children(mover.get_all_available_moves()):
+                child_key = board.get_state_key()
+
+                if child_key in seen:
+                    continue
+
+                seen[child_key] = depth + 1
+
+                if forwards:
+                    parents.add(child_key, state_key, move)
+                else:
+                    parents[child_key] = (state_key, (move[0], -move[1]))
+
+                next_layer.append(child_key)
+
+                if other_seen is None:
+                    other_depth = 0 if is_goal_state(board) else None
+                else:
+                    other_depth = other_seen.get(child_key)
+
+                if other_depth is not None:
+                    total = depth + 1 + other_depth
+
+                    if meeting is None or total < meeting[0]:
+                        meeting = (total, child_key)
+
+        self.num_seen_states += len(next_layer)
+
+        # keep track of statistics
+        if len(next_layer) > self.max_queue_size:
+            self.max_queue_size = len(next_layer)
+
+        return next_layer, meeting
+
+    def run(self) -> None:
+        """
+        Runs the algorithm until the forward and backward search meet, or until one of
+        them has visited all reachable Board states.
+        """
+        board = self.initial_state.copy()
+        mover = Mover(board)
+        start_key = board.get_state_key()
+
+        if is_goal_state(board):
+            self.solution = board
+
+            return
+
+        forward_layer = [start_key]
+        forward_depth = 0
+        forward_seen: dict[int, int] = {start_key: 0}
+        forward_parents = PathTable(start_key)
+
+        goal_state_keys = iter_goal_state_keys(board)
+        goal_layer: list[int] = []
+        backward_layer: list[int] | None = None
+        backward_depth = 0
+        backward_seen: dict[int, int] | None = None
+        backward_parents: dict[int, tuple[int, tuple[str, int]]] = {}
+
+        meeting = None
+
+        while meeting is None:
+
+            # enumerate the goal states once there are fewer than forward states
+            if backward_layer is None:
+                for state_key in goal_state_keys:
+                    goal_layer.append(state_key)
+
+                    if len(goal_layer) > len(forward_layer):
+                        break
+                else:
+                    backward_layer = goal_layer
+                    backward_seen = dict.fromkeys(goal_layer, 0)
+                    self.num_seen_states += len(goal_layer)
+
+            if backward_layer is not None and len(backward_layer) < len(forward_layer):
+                backward_layer, meeting = self.expand_layer(
+                    board, mover, backward_layer, backward_depth,
+                    backward_seen, backward_parents, forward_seen, False
+                )
+                backward_depth += 1
+                layer = backward_layer
+            else:
+                forward_layer, meeting = self.expand_layer(
+                    board, mover, forward_layer, forward_depth,
+                    forward_seen, forward_parents, backward_seen, True
+                )
+                forward_depth += 1
+                layer = forward_layer
+
+            print(f'Number of seen states: {self.num_seen_states}, Number of moves made: {forward_depth + backward_depth}')
+
+            if not layer:
+                print('No solution found')
+
+                return
+
+        # the moves from the start to the meeting state, then on to the goal state
+        _, state_key = meeting
+        self.moves = forward_parents.get_moves(state_key)
+
+        while state_key in backward_parents:
+            state_key, move = backward_parents[state_key]
+            self.moves.append(move)
+
+        board.set_state_key(state_key)
+        self.solution = board
@@ -1,9 +1,32 @@
-import queue
+import os
+import shutil
+import tempfile
+from array import array
+from typing import Callable, Iterator
 
 import numpy as np
 
-from code.classes import Board, Mover, CARTER_NAME, Game, Orientation
+from code.classes import Board, LayerQueue, Mover, CARTER_NAME, PathTable, SeenStates, StateFile
+from code.classes.layer_queue import WORD_BITS, WORD_MASK
+from code.classes.state_file import CHUNK_SIZE
 from .heuristics import free_carter, all_max_moves, check_useful_move
+from .move_pruning import MovePruning
+
+
+class BreadthFirstFrontierError(ValueError):
+    def __init__(self):
+        super().__init__(
+            'Frontier search needs reversible moves, it cannot be combined '
+            'with max_moves, useful_move or move_pruning'
+        )
+
+
+class BreadthFirstDiskBudgetError(ValueError):
+    def __init__(self, size: int, max_disk: int):
+        super().__init__(
+            f'External search needs {size} bytes on disk, more than the '
+            f'budget of {max_disk} bytes'
+        )
 
 
 class BreadthFirst:
@@ -12,6 +35,15 @@ class BreadthFirst:
     Search algorithm, starting from an initial Board state. It maintains a queue and
     archive of Board states, generates child states for valid moves, and continues the
     search until a solution is found.
+
+    Queued Board states are only their state key, packed in arrays per layer (see
+    'LayerQueue'), and are expanded on a single board. The moves leading to a state are
+    stored as a single parent reference per state in the path table and only rebuilt
+    for the solution.
+
+    The frontier mode (see 'run_frontier') does not keep the seen states or the path
+    table at all, only the last three layers of the search. The external mode (see
+    'run_external') keeps the layers in files on disk instead of in memory.
     """
     def __init__(self, initial_state: Board) -> None:
         """
@@ -19,17 +51,25 @@ class BreadthFirst:
         setting up a queue of Board states where the input Board serves as the initial
         state.
         """
-        self.queue = queue.Queue()
-        self.queue.put((initial_state, []))
+        start_key = initial_state.get_state_key()
+
+        self.initial_state = initial_state
+        self.board = initial_state.copy()
+        self.queue = LayerQueue(StateFile.get_key_size(initial_state))
+        self.queue.push(start_key)
         self.max_queue_size = 1
 
-        self.seen_states: set[tuple[tuple[object]]] = set()
+        self.seen_states = SeenStates()
+        self.num_seen_states = 0
+        self.path_table = PathTable(start_key)
+        self.move_pruning: MovePruning | None = None
         self.solution = None
         self.moves: list[tuple[str, int]] = []
 
     def build_children(
             self, next_state: Board,
-            move_history: list[tuple[str, int]],
+            state_key: int,
+            depth: int,
             max_moves: bool,
             useful_move: bool
         ) -> None:
@@ -39,6 +79,9 @@ class BreadthFirst:
         Board configuration after a valid move by a Vehicle. Also accepts heuristics for
         max_moves (only the largest possible moves) and useful_move (checks if more moves
         become available).
+
+        With move pruning (see 'MovePruning') the moves that only change the order of
+        independent moves are not generated.
         """
         mover = Mover(next_state)
 
@@ -47,55 +90,88 @@ class BreadthFirst:
         else:
             possible_moves: list[tuple[str, int]] = mover.get_all_available_moves()
 
-        # add a new board instance to the queue for each unseen valid move
-        for move in possible_moves:
-
-            if useful_move and not check_useful_move(next_state, move[0], move[1]):
-                continue
+        if useful_move:
+            possible_moves = [
+                move
+                for move in possible_moves
+                if check_useful_move(next_state, move[0], move[1])
+            ]
 
-            # create new board as child_state
-            data: list[tuple[str, Orientation, int, int, int]] = []
-            for vehicle in next_state.vehicles.values():
-                data.append((vehicle.name, vehicle.orientation, vehicle.location[0][0], vehicle.location[0][1], vehicle.length))
+        if self.move_pruning is not None:
+            possible_moves = self.move_pruning.filter_moves(possible_moves, state_key)
 
-            child_state = Game.setup_board(Board(next_state.size), data)
+        # expand the children in place and only queue the state keys of the unseen ones
+        for move in mover.iter_children(possible_moves):
+            if self.seen_states.add(next_state):
+                child_key = next_state.get_state_key()
 
-            new_mover = Mover(child_state)
+                self.path_table.add(child_key, state_key, move)
 
-            # make the valid move in the new board instance
-            new_mover.move_vehicle(move)
-
-            # https://www.geeksforgeeks.org/how-to-fix-the-typeerror-unhashable-type-numpy-ndarray/
-            if tuple(map(tuple, child_state.locations)) not in self.seen_states:
-                self.seen_states.add(tuple(map(tuple, child_state.locations)))
-                self.queue.put((child_state, move_history + [move]))
+                if self.move_pruning is not None:
+                    self.move_pruning.add(child_key, depth + 1, move)
+                self.queue.push(child_key)
 
                 if len(self.seen_states) % 50000 == 0:
-                    print(f'Number of seen states: {len(self.seen_states)}, Number of moves made: {len(move_history) + 1}')
+                    print(f'Number of seen states: {len(self.seen_states)}, Number of moves made: {depth + 1}')
 
                 # keep track of statistics
-                if self.queue.qsize() > self.max_queue_size:
-                    self.max_queue_size = self.queue.qsize()
+                if len(self.queue) > self.max_queue_size:
+                    self.max_queue_size = len(self.queue)
+
+            elif self.move_pruning is not None:
+                self.move_pruning.merge(next_state.get_state_key(), depth + 1, move)
 
     def run(self,
             finish: np.ndarray=None,
             max_moves: bool=False,
-            useful_move: bool=False
+            useful_move: bool=False,
+            frontier: bool=False,
+            external: bool=False,
+            move_pruning: bool=False
         ) -> None:
         """
         Runs the algorithm until all possible Board states are visited or a solution
         is found.
         Solution is is_finished method unless a np.ndarray is given.
+
+        If frontier == True:
+            - runs the frontier mode instead (see 'run_frontier'), which cannot be
+              combined with max_moves or useful_move
+
+        If external == True:
+            - runs the external mode instead (see 'run_external') with the default
+              budgets, which cannot be combined with max_moves or useful_move
+
+        If move_pruning == True:
+            - moves that only change the order of independent moves are not generated
+              (see 'MovePruning'), only in the regular mode
         """
-        while not self.queue.empty():
-            next_state, move_history = self.queue.get()
+        if frontier or external:
+            if max_moves or useful_move or move_pruning:
+                raise BreadthFirstFrontierError()
+
+            if external:
+                self.run_external(finish)
+            else:
+                self.run_frontier(finish)
+
+            return
+
+        if move_pruning:
+            self.move_pruning = MovePruning(self.initial_state)
+
+        next_state = self.board
+
+        while self.queue:
+            state_key, depth = self.queue.pop()
+            next_state.set_state_key(state_key)
 
             if np.any(finish):
 
                 # stop if we find the finish
                 if np.array_equal(next_state.locations, finish):
                     self.solution = next_state
-                    self.moves: list[tuple[str, int]] = move_history
+                    self.moves: list[tuple[str, int]] = self.path_table.get_moves(state_key)
 
                     break
 
@@ -108,14 +184,410 @@ class BreadthFirst:
                     move = (CARTER_NAME, steps)
 
                     mover.move_vehicle(move)
-                    move_history.append(move)
 
                     self.solution = next_state
-                    self.moves: list[tuple[str, int]] = move_history
+                    self.moves: list[tuple[str, int]] = self.path_table.get_moves(state_key) + [move]
 
                     break
 
-            self.build_children(next_state, move_history, max_moves, useful_move)
+            self.build_children(next_state, state_key, depth, max_moves, useful_move)
+
+        self.num_seen_states = len(self.seen_states)
 
         if not self.solution:
             print('No solution found')
+
+    def run_frontier(self, finish: np.ndarray=None) -> None:
+        """
+        Runs the algorithm layer by layer, only keeping the previous, current and next
+        layer of state keys.
+
+        Every move can be reversed, so all neighbours of a state in the current layer
+        are in the previous, current or next layer. Checking these three layers is
+        enough to never expand a state twice, so no global archive of seen states is
+        needed and memory only grows with the width of the search.
+
+        States are checked for the solution when they are generated. Since no parents
+        are stored, the moves are rebuilt afterwards by 'reconstruct_moves'.
+        """
+        board = self.initial_state.copy()
+        mover = Mover(board)
+        start_key = board.get_state_key()
+
+        if np.any(finish):
+            is_goal = lambda: np.array_equal(board.locations, finish)
+        else:
+            is_goal = lambda: bool(free_carter(board))
+
+        result = self.search_frontier(board, mover, start_key, is_goal)
+
+        if result is None:
+            print('No solution found')
+
+            return
+
+        goal_key, depth = result
+        self.moves = self.reconstruct_moves(board, mover, start_key, goal_key, depth)
+
+        board.set_state_key(goal_key)
+
+        # make the final move when carter can finish the game in one move
+        if not np.any(finish):
+            move = (CARTER_NAME, free_carter(board))
+
+            mover.move_vehicle(move)
+            self.moves.append(move)
+
+        self.solution = board
+
+    def search_frontier(
+            self,
+            board: Board,
+            mover: Mover,
+            start_key: int,
+            is_goal: Callable[[], bool]
+        ) -> tuple[int, int] | None:
+        """
+        Searches layer by layer from the state with 'start_key' until 'is_goal' is True
+        for the state of 'board'. Returns the state key and depth of the goal state, or
+        None if the goal cannot be reached.
+        """
+        board.set_state_key(start_key)
+
+        if is_goal():
+            return start_key, 0
+
+        previous: set[int] = set()
+        current = {start_key}
+        depth = 0
+
+        while current:
+            next_layer, goal_key = self.expand_layer(board, mover, previous, current, is_goal)
+            depth += 1
+
+            if goal_key is not None:
+                return goal_key, depth
+
+            self.num_seen_states += len(next_layer)
+            print(f'Number of seen states: {self.num_seen_states}, Number of moves made: {depth}')
+
+            # keep track of statistics
+            if len(next_layer) > self.max_queue_size:
+                self.max_queue_size = len(next_layer)
+
+            previous, current = current, next_layer
+
+        return None
+
+    def expand_layer(
+            self,
+            board: Board,
+            mover: Mover,
+            previous: set[int],
+            current: set[int],
+            is_goal: Callable[[], bool] | None = None
+        ) -> tuple[set[int], int | None]:
+        """
+        Generates the next layer from the current layer: all children of the current
+        layer that are not in the previous, current or next layer.
+
+        If 'is_goal' is given, every new child is checked when it is generated and the
+        expansion stops at the first goal state. Returns the next layer and the state
+        key of the goal state (None if no goal state was found).
+        """
+        next_layer: set[int] = set()
+
+        for state_key in current:
+            board.set_state_key(state_key)
+
+            for move in mover.iter_children(mover.get_all_available_moves()):
+                child_key = board.get_state_key()
+
+                if (
+                    child_key in next_layer
+                    or child_key in current
+                    or child_key in previous
+                ):
+                    continue
+
+                if is_goal and is_goal():
+                    return next_layer, child_key
+
+                next_layer.add(child_key)
+
+        return next_layer, None
+
+    def get_layer(
+            self,
+            board: Board,
+            mover: Mover,
+            start_key: int,
+            depth: int
+        ) -> set[int]:
+        """
+        Gets the state keys of all states exactly 'depth' moves away from the state
+        with 'start_key'.
+        """
+        previous: set[int] = set()
+        current = {start_key}
+
+        for _ in range(depth):
+            previous, current = current, self.expand_layer(board, mover, previous, current)[0]
+
+        return current
+
+    def reconstruct_moves(
+            self,
+            board: Board,
+            mover: Mover,
+            start_key: int,
+            goal_key: int,
+            depth: int
+        ) -> list[tuple[str, int]]:
+        """
+        Rebuilds the moves between two states 'depth' moves apart by divide and
+        conquer.
+
+        The states halfway the start and goal state are both 'depth // 2' moves away
+        from the start state and the remaining moves away from the goal state, so they
+        are found by intersecting a layer searched from each side. Searching half the
+        depth from both sides is much cheaper than searching the full depth again.
+        The moves before and after the middle state are rebuilt the same way, until the
+        states are one move apart.
+        """
+        if depth == 0:
+            return []
+
+        if depth == 1:
+            board.set_state_key(start_key)
+
+            for move in mover.iter_children(mover.get_all_available_moves()):
+                if board.get_state_key() == goal_key:
+                    return [move]
+
+        middle = depth // 2
+        middle_key = min(
+            self.get_layer(board, mover, start_key, middle)
+            & self.get_layer(board, mover, goal_key, depth - middle)
+        )
+
+        return (
+            self.reconstruct_moves(board, mover, start_key, middle_key, middle)
+            + self.reconstruct_moves(board, mover, middle_key, goal_key, depth - middle)
+        )
+
+    def run_external(
+            self,
+            finish: np.ndarray=None,
+            directory: str | None = None,
+            max_memory: int=8_000_000,
+            max_disk: int | None = None
+        ) -> None:
+        """
+        Runs the frontier mode with the layers stored on disk instead of in memory,
+        for state spaces that do not fit in memory.
+
+        Every layer is a state file (see 'StateFile') in the directory, a temporary
+        directory that is removed afterwards if none is given. The children of the
+        current layer are collected in memory as packed 64-bit words, one word per
+        state (more on boards whose state keys do not fit in 64 bits), until they take
+        'max_memory' bytes. Then they are sorted, their duplicates are removed and they
+        are written to a run file. When the layer is expanded, the runs are merged into
+        the next layer and the states of the previous and current layer are removed
+        while merging (delayed duplicate detection).
+
+        All layers stay on disk, so the moves are rebuilt from the goal state back to
+        the start state one layer at a time (see 'reconstruct_moves_external'). The
+        files may take at most 'max_disk' bytes, by default the free space on the disk
+        of the directory at the start. A BreadthFirstDiskBudgetError is raised before a
+        run is written that does not fit, or when a merged layer does not fit.
+        """
+        if directory is None:
+            with tempfile.TemporaryDirectory() as tmp_directory:
+                self.run_external(finish, tmp_directory, max_memory, max_disk)
+
+            return
+
+        os.makedirs(directory, exist_ok=True)
+
+        if max_disk is None:
+            max_disk = shutil.disk_usage(directory).free
+
+        board = self.initial_state.copy()
+        mover = Mover(board)
+        start_key = board.get_state_key()
+        key_size = StateFile.get_key_size(board)
+
+        # the number of words of a state key, and of the children that fit in memory
+        num_words = max((key_size + 7) // 8, 1)
+        max_words = max(max_memory // 8, num_words)
+
+        if np.any(finish):
+            is_goal = lambda: np.array_equal(board.locations, finish)
+        else:
+            is_goal = lambda: bool(free_carter(board))
+
+        layers = [StateFile.write(os.path.join(directory, 'layer_0.bin'), key_size, [start_key])]
+        disk_size = layers[0].get_size()
+
+        board.set_state_key(start_key)
+        goal_key = start_key if is_goal() else None
+
+        while goal_key is None and len(layers[-1]):
+            depth = len(layers)
+            runs: list[StateFile] = []
+            children = array('Q')
+
+            for state_key in layers[-1]:
+                board.set_state_key(state_key)
+
+                for _ in mover.iter_children(mover.get_all_available_moves()):
+                    child_key = board.get_state_key()
+
+                    # goal states are never stored, so a goal state is always new
+                    if is_goal():
+                        goal_key = child_key
+
+                        break
+
+                    if num_words == 1:
+                        children.append(child_key)
+                    else:
+                        children.extend(
+                            child_key >> (WORD_BITS * i) & WORD_MASK
+                            for i in reversed(range(num_words))
+                        )
+
+                    if len(children) >= max_words:
+                        runs.append(self.write_run(directory, key_size, depth, len(runs), children, num_words, disk_size, max_disk))
+                        disk_size += runs[-1].get_size()
+                        children = array('Q')
+
+                if goal_key is not None:
+                    break
+
+            if goal_key is None:
+                runs.append(self.write_run(directory, key_size, depth, len(runs), children, num_words, disk_size, max_disk))
+                disk_size += runs[-1].get_size()
+
+                layers.append(StateFile.merge(
+                    os.path.join(directory, f'layer_{depth}.bin'),
+                    runs,
+                    layers[-2:],
+                ))
+                disk_size = self.check_disk_size(disk_size + layers[-1].get_size(), max_disk)
+
+                self.num_seen_states += len(layers[-1])
+                print(f'Number of seen states: {self.num_seen_states}, Number of moves made: {depth}')
+
+                # keep track of statistics
+                if len(layers[-1]) > self.max_queue_size:
+                    self.max_queue_size = len(layers[-1])
+
+            for run in runs:
+                disk_size -= run.get_size()
+                run.remove()
+
+        if goal_key is None:
+            print('No solution found')
+
+            return
+
+        # the goal state is one move further than the last layer, unless it is the start
+        if goal_key == start_key:
+            layers = []
+
+        self.moves = self.reconstruct_moves_external(board, mover, goal_key, layers)
+
+        board.set_state_key(goal_key)
+
+        # make the final move when carter can finish the game in one move
+        if not np.any(finish):
+            move = (CARTER_NAME, free_carter(board))
+
+            mover.move_vehicle(move)
+            self.moves.append(move)
+
+        self.solution = board
+
+    @staticmethod
+    def write_run(
+            directory: str,
+            key_size: int,
+            depth: int,
+            index: int,
+            children: array,
+            num_words: int,
+            disk_size: int,
+            max_disk: int
+        ) -> StateFile:
+        """
+        Sorts the children collected in memory, removes their duplicates and writes
+        them to a run file of the layer, if the run fits in the disk budget.
+
+        The children are rows of 'num_words' words with the most significant word
+        first, so sorting the rows sorts the state keys.
+        """
+        rows = np.unique(np.frombuffer(children, dtype=np.uint64).reshape(-1, num_words), axis=0)
+        BreadthFirst.check_disk_size(disk_size + len(rows) * key_size, max_disk)
+
+        def iter_keys() -> Iterator[int]:
+            for start in range(0, len(rows), CHUNK_SIZE):
+                for row in rows[start:start + CHUNK_SIZE].tolist():
+                    key = 0
+
+                    for word in row:
+                        key = key << WORD_BITS | word
+
+                    yield key
+
+        return StateFile.write(
+            os.path.join(directory, f'layer_{depth}_run_{index}.bin'),
+            key_size,
+            iter_keys(),
+        )
+
+    @staticmethod
+    def check_disk_size(disk_size: int, max_disk: int | None) -> int:
+        """
+        Checks if the files of the external mode fit in the disk budget and returns
+        their size.
+        """
+        if max_disk is not None and disk_size > max_disk:
+            raise BreadthFirstDiskBudgetError(disk_size, max_disk)
+
+        return disk_size
+
+    @staticmethod
+    def reconstruct_moves_external(
+            board: Board,
+            mover: Mover,
+            goal_key: int,
+            layers: list[StateFile]
+        ) -> list[tuple[str, int]]:
+        """
+        Rebuilds the moves from the start state to the goal state, which is one move
+        further than the last of the layers.
+
+        Every move can be reversed, so a parent of a state is one of its children that
+        is in the layer before it. Only one state is kept in memory, the layers are
+        searched on disk (see 'StateFile.__contains__').
+        """
+        moves: list[tuple[str, int]] = []
+        state_key = goal_key
+
+        for layer in reversed(layers):
+            board.set_state_key(state_key)
+
+            for name, steps in mover.iter_children(mover.get_all_available_moves()):
+                parent_key = board.get_state_key()
+
+                if parent_key in layer:
+                    break
+
+            moves.append((name, -steps))
+            state_key = parent_key
+
+        moves.reverse()
+
+        return moves
@@ -1,6 +1,7 @@
 import copy
 
-from code.classes import Board, Mover, Game
+from code.classes import Board, CARTER_NAME, LRUTable, Mover, Game, SeenStates
+from .heuristics import free_carter
 
 
 class DepthFirst:
@@ -9,6 +10,10 @@ class DepthFirst:
     Search algorithm, starting from an initial Board state. It maintains a stack and
     archive of Board states, generates child states for valid moves, and continues the
     search until a solution is found.
+
+    The iterative deepening mode (see 'run_iterative_deepening') searches depth first
+    with an increasing depth limit instead, which finds the shortest solution with
+    memory that only grows with the depth of the search.
     """
     def __init__(self, initial_state: Board) -> None:
         """
@@ -16,8 +21,14 @@ class DepthFirst:
         setting up a stack of Board states where the input Board serves as the initial
         state.
         """
+        self.initial_state = initial_state
         self.states = [(copy.deepcopy(initial_state), [])]
-        self.seen_states: set[tuple[tuple[object]]] = set()
+        self.seen_states = SeenStates()
+
+        # keep track of statistics of the iterative deepening mode
+        self.num_seen_states = 0
+        self.num_iterations = 0
+
         self.solution = None
         self.moves: list[tuple[str, int]] = []
 
@@ -38,16 +49,28 @@ class DepthFirst:
             # make the valid move in the new board instance
             new_mover.move_vehicle(move)
 
-            # https://www.geeksforgeeks.org/how-to-fix-the-typeerror-unhashable-type-numpy-ndarray/
-            if tuple(map(tuple, child_state.locations)) not in self.seen_states:
-                self.seen_states.add(tuple(map(tuple, child_state.locations)))
+            if self.seen_states.add(child_state):
                 self.states.append((child_state, move_history + [move]))
 
-    def run(self) -> None:
+    def run(
+            self,
+            iterative_deepening: bool=False,
+            table_size: int | None = None,
+            max_depth: int | None = None
+        ) -> None:
         """
         Runs the algorithm until all possible Board states are visited or a solution
         is found.
+
+        If iterative_deepening == True:
+            - runs the iterative deepening mode instead (see 'run_iterative_deepening')
+              with the size of the transposition table and the maximum depth
         """
+        if iterative_deepening:
+            self.run_iterative_deepening(table_size, max_depth)
+
+            return
+
         while self.states:
 
             # get the board instance on top of the stack
@@ -62,3 +85,127 @@ class DepthFirst:
             self.build_children(next_state, move_history)
 
         self.solution = next_state
+
+    def run_iterative_deepening(
+            self,
+            table_size: int | None = None,
+            max_depth: int | None = None
+        ) -> None:
+        """
+        Runs a Depth First Search with a depth limit of 0 moves, then 1 move and so on
+        until a solution is found, no state was cut off by the limit (there is no
+        solution) or the limit exceeds 'max_depth'. The first solution found is the
+        shortest.
+
+        Moves are made and undone in place on a single Board and only the states on the
+        current path are remembered, to never go round in circles. Memory is linear in
+        the depth of the search, at the cost of expanding states again in every
+        iteration.
+
+        If a table size is given, a transposition table stores the smallest depth every
+        state was reached at in the current iteration, for at most 'table_size' states
+        (see 'LRUTable'). A state reached again at the same or a larger depth is not
+        searched twice. The depths of an earlier iteration never prune a later one, so
+        the table is cleared at the start of every iteration.
+        """
+        self.board = self.initial_state.copy()
+        self.mover = Mover(self.board)
+        self.table_size = table_size
+        self.transposition_table = LRUTable(table_size) if table_size is not None else None
+        self.path: list[tuple[str, int]] = []
+        self.path_keys: set[int] = set()
+
+        limit = 0
+
+        while max_depth is None or limit <= max_depth:
+            self.num_iterations += 1
+            self.cut_off = False
+
+            if self.transposition_table is not None:
+                self.transposition_table.clear()
+
+            found = self.search(0, limit)
+            print(f'Depth limit: {limit}, Number of seen states: {self.num_seen_states}')
+
+            if found:
+                break
+
+            if not self.cut_off:
+                break
+
+            limit += 1
+        else:
+            found = False
+
+        if not found:
+            print('No solution found')
+
+            return
+
+        # make the final move when carter can finish the game in one move
+        move = (CARTER_NAME, free_carter(self.board))
+        self.mover.move_vehicle(move)
+
+        self.moves = self.path + [move]
+        self.solution = self.board
+
+    def search(self, depth: int, limit: int) -> bool:
+        """
+        Searches depth first from the current Board state for a state where carter can
+        finish the game, within the depth limit.
+
+        Returns True if a solution is found (the board is then left in that state and
+        the moves are in self.path), otherwise False.
+        """
+        if free_carter(self.board):
+            return True
+
+        if depth == limit:
+            self.cut_off = True
+
+            return False
+
+        self.path_keys.add(self.board.get_state_key())
+
+        for move in self.mover.get_all_available_moves():
+            self.mover.apply_move(move)
+            child_key = self.board.get_state_key()
+
+            # going round in circles or searching a transposition again is never shorter
+            if child_key in self.path_keys or not self.store(child_key, depth + 1):
+                self.mover.undo_move(move)
+
+                continue
+
+            self.num_seen_states += 1
+            self.path.append(move)
+
+            if self.search(depth + 1, limit):
+                return True
+
+            self.path.pop()
+            self.mover.undo_move(move)
+
+        self.path_keys.remove(self.board.get_state_key())
+
+        return False
+
+    def store(self, state_key: int, depth: int) -> bool:
+        """
+        Stores the depth of a state in the transposition table as the most recently
+        used state.
+
+        Returns False if the state was already reached at the same or a smaller depth
+        in the current iteration, otherwise True. Always True without a table.
+        """
+        if self.transposition_table is None:
+            return True
+
+        seen_depth = self.transposition_table.get(state_key)
+
+        if seen_depth is not None and seen_depth <= depth:
+            return False
+
+        self.transposition_table.put(state_key, depth)
+
+        return True
@@ -14,7 +14,7 @@ def free_carter(board: Board) -> int | None:
      carter_max_steps_forward: int = mover.get_vehicle_max_steps(CARTER_NAME, Direction.FORWARDS)
 
      # check if carter can move to finish
-     if (carter.location[1][0] + carter_max_steps_forward) == (board.size - 1):
+     if (carter.front[0] + carter_max_steps_forward) == (board.size - 1):
           return carter_max_steps_forward
 
 
@@ -22,24 +22,13 @@ def all_max_moves(board: Board) -> list[tuple[str, int]]:
      """
      Returns only the largest possible moves of all Vehicles on the board
      as a list of moves.
+
+     The moves of all vehicles are generated at once, see 'Mover.get_move_arrays'.
      """
      mover = Mover(board)
 
-     max_moves: list[tuple[str, int]] = []
-
-     for vehicle_name in board.vehicles:
-
-               # check maximal forward movement
-               move_forwards = mover.get_vehicle_max_steps(vehicle_name, Direction.FORWARDS)
-               if move_forwards > 0:
-                    max_moves.append((vehicle_name, move_forwards))
-
-               # check maximal backward movement
-               move_backwards = mover.get_vehicle_max_steps(vehicle_name, Direction.BACKWARDS)
-               if move_backwards > 0:
-                    max_moves.append((vehicle_name, -move_backwards))
-
-     return max_moves
+     # per vehicle the maximal forward movement, then the maximal backward movement
+     return mover.get_moves_from_arrays(*mover.get_move_arrays(max_moves=True))
 
 
 def check_useful_move(board: Board, vehicle_name: str, steps: int) -> bool:
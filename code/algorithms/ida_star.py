@@ -0,0 +1,163 @@
+import math
+from typing import Callable
+
+from code.classes import Board, CARTER_NAME, LRUTable, Mover
+from .heuristics import free_carter
+
+
+# Approximate number of bytes a state takes in the transposition table: the state key,
+# the tuple with its iteration, depth and lower bound, and the entry of the table
+ENTRY_SIZE = 200
+
+
+class IDAStar:
+    """
+    This class explores Board configurations by performing an Iterative Deepening A*
+    algorithm, starting from an initial Board state. Each iteration is a Depth First
+    Search that only follows states with a score (depth plus heuristic) within a bound.
+    The bound is raised to the lowest score that exceeded it until a solution is found.
+
+    Moves are made and undone in place on a single Board, so memory only holds the
+    current path (whose states are never revisited) and a transposition table. The
+    table remembers the smallest depth at which a state was reached in the current
+    iteration, so transpositions reached again at the same or a larger depth are not
+    expanded twice. It holds at most 'max_memory' bytes of states (see 'LRUTable'):
+    when it is full the least recently stored or looked up state is dropped, which
+    only costs extra expansions and never changes the solution.
+
+    The table is kept between iterations, so the lower bounds learned in one iteration
+    (see 'search') also prune the next iterations.
+    """
+    def __init__(
+            self,
+            initial_state: Board,
+            heuristic: Callable[[Board], int],
+            max_memory: int=200_000_000
+        ) -> None:
+        """
+        Initializes the IDA* algorithm with a copy of the specified Board state, a
+        heuristic and the memory budget of the transposition table in bytes. The
+        budget is turned into a number of states with 'ENTRY_SIZE'.
+
+        NB.
+        A table that is much smaller than the number of states within the bound of the
+        last iteration prunes little, and IDA* then expands the same states over and
+        over again.
+        """
+        self.board = initial_state.copy()
+        self.mover = Mover(self.board)
+        self.heuristic = heuristic
+
+        self.max_memory = max_memory
+        self.table_size = max(max_memory // ENTRY_SIZE, 1)
+        self.transposition_table = LRUTable(self.table_size)
+        self.path: list[tuple[str, int]] = []
+        self.path_keys: set[int] = set()
+
+        # keep track of statistics
+        self.num_seen_states = 0
+        self.num_iterations = 0
+
+        self.solution = None
+        self.moves: list[tuple[str, int]] = []
+
+    def search(self, depth: int, bound: int) -> float | None:
+        """
+        Searches depth first from the current Board state for states where carter can
+        finish the game, without exceeding the bound.
+
+        Returns None if a solution is found (the board is then left in that state and
+        the moves are in self.path), otherwise the lowest score that exceeded the bound.
+
+        After a state is searched, the lowest exceeded score minus its depth is a lower
+        bound on the number of moves left. It is stored in the transposition table and
+        used instead of the heuristic when it is larger, also in later iterations.
+        """
+        state_key = self.board.get_state_key()
+
+        # the state is already on the path, going round in circles is never shorter
+        if state_key in self.path_keys:
+            return bound + 1
+
+        entry = self.transposition_table.get(state_key)
+        heuristic = self.heuristic(self.board)
+
+        if entry is not None:
+            iteration, seen_depth, lower_bound = entry
+            heuristic = max(heuristic, lower_bound)
+
+            # the state was already searched at the same or a smaller depth in this
+            # iteration, so no solution within the bound goes through it
+            if iteration == self.num_iterations and seen_depth <= depth:
+                return max(depth + heuristic, bound + 1)
+
+        score = depth + heuristic
+
+        if score > bound:
+            return score
+
+        if free_carter(self.board):
+            return None
+
+        self.store(state_key, depth, heuristic)
+        self.path_keys.add(state_key)
+        min_exceeded = math.inf
+
+        for move in self.mover.get_all_available_moves():
+            self.num_seen_states += 1
+            self.mover.apply_move(move)
+            self.path.append(move)
+
+            result = self.search(depth + 1, bound)
+
+            if result is None:
+                return None
+
+            self.path.pop()
+            self.mover.undo_move(move)
+
+            min_exceeded = min(min_exceeded, result)
+
+        self.path_keys.remove(state_key)
+
+        if min_exceeded < math.inf:
+            self.store(state_key, depth, min_exceeded - depth)
+
+        return min_exceeded
+
+    def store(self, state_key: int, depth: int, lower_bound: int) -> None:
+        """
+        Stores the depth and lower bound of a state in the transposition table as the
+        most recently used state.
+        """
+        self.transposition_table.put(state_key, (self.num_iterations, depth, lower_bound))
+
+    def run(self) -> None:
+        """
+        Runs the algorithm until a solution is found or until no state exceeded the
+        bound, in which case there is no solution.
+        """
+        bound = self.heuristic(self.board)
+
+        while True:
+            self.num_iterations += 1
+
+            result = self.search(0, bound)
+            print(f'Bound: {bound}, Number of seen states: {self.num_seen_states}')
+
+            if result is None:
+                break
+
+            if result == math.inf:
+                print('No solution found')
+
+                return
+
+            bound = result
+
+        # make the final move when carter can finish the game in one move
+        move = (CARTER_NAME, free_carter(self.board))
+        self.mover.move_vehicle(move)
+
+        self.moves = self.path + [move]
+        self.solution = self.board
@@ -0,0 +1,120 @@
+from code.classes import Board
+
+
+def get_interaction_graph(board: Board) -> dict[str, set[str]]:
+    """
+    Gets for every vehicle the other vehicles whose lane crosses its lane. Vehicles in
+    the same lane always interact.
+
+    Vehicles that do not interact can never block each other, so their moves can be
+    made in any order.
+    """
+    lane_squares = board.get_lane_squares()
+
+    return {
+        name: {
+            other
+            for other in lane_squares
+            if other != name and lane_squares[name] & lane_squares[other]
+        }
+        for name in lane_squares
+    }
+
+
+class MovePruning:
+    """
+    Partial-order reduction for the moves of independent vehicles. Two moves of
+    vehicles that do not interact (see 'get_interaction_graph') commute: both orders
+    are possible and reach the same state. Only the canonical order, the vehicle
+    that comes first in the state key layout moves first, is generated, so a move is
+    pruned when it directly follows a move of a later, independent vehicle.
+
+    Every path can be put in the canonical order by swapping commuting moves, without
+    changing its length, so the shortest solution is never pruned.
+
+    The pruned vehicles after a move are a bit mask, with one bit for every vehicle in
+    the order of the state key layout. The mask of every state waiting to be expanded
+    is kept by state key. When a solver reaches such a state again at the same depth
+    through a different move, only the vehicles pruned after both moves stay pruned:
+    a move can only be skipped when it is pruned on every shortest path to the state.
+
+    A Breadth First Search expands a state after all states one move closer to the
+    start, so all moves leading to it at the same depth are known by then. Solvers that
+    can expand a state earlier (like 'AStar') keep the states after expanding them
+    ('reopen'), a state whose pruned vehicles change afterwards has to be expanded
+    again.
+    """
+    def __init__(self, board: Board, reopen: bool=False) -> None:
+        """
+        Initializes the move pruning with the interaction graph of the board, and
+        whether the expanded states are kept to be reopened.
+        """
+        interaction_graph = get_interaction_graph(board)
+        names = [name for name, *_ in board.get_key_layout()]
+
+        self.bits = {name: 1 << i for i, name in enumerate(names)}
+        self.pruned_vehicles = {
+            name: sum(
+                self.bits[other]
+                for other in names[:i]
+                if other not in interaction_graph[name]
+            )
+            for i, name in enumerate(names)
+        }
+
+        # the depth and pruned vehicles of the states waiting to be expanded, and of
+        # the expanded states when they can be reopened
+        self.reopen = reopen
+        self.states: dict[int, tuple[int, int]] = {}
+        self.expanded: set[int] = set()
+
+        # keep track of statistics
+        self.num_pruned_moves = 0
+
+    def add(self, state_key: int, depth: int, move: tuple[str, int]) -> None:
+        """
+        Stores the pruned vehicles of a new state, reached with the move.
+        """
+        self.states[state_key] = (depth, self.pruned_vehicles[move[0]])
+
+    def merge(self, state_key: int, depth: int, move: tuple[str, int]) -> bool:
+        """
+        Merges the pruned vehicles of a state that was reached again with the move, if
+        it was reached at the same depth before.
+
+        Returns True if fewer vehicles are pruned than when the state was expanded
+        (only when reopening), the state then has to be expanded again.
+        """
+        entry = self.states.get(state_key)
+
+        if entry is None or entry[0] != depth:
+            return False
+
+        pruned_vehicles = entry[1] & self.pruned_vehicles[move[0]]
+        self.states[state_key] = (depth, pruned_vehicles)
+
+        return self.reopen and pruned_vehicles != entry[1] and state_key in self.expanded
+
+    def filter_moves(
+            self,
+            moves: list[tuple[str, int]],
+            state_key: int
+        ) -> list[tuple[str, int]]:
+        """
+        Removes the moves of the pruned vehicles of the state that is expanded. The
+        state is no longer waiting to be expanded afterwards.
+        """
+        if self.reopen:
+            self.expanded.add(state_key)
+            _, pruned_vehicles = self.states.get(state_key, (0, 0))
+        else:
+            _, pruned_vehicles = self.states.pop(state_key, (0, 0))
+
+        if not pruned_vehicles:
+            return moves
+
+        bits = self.bits
+        filtered_moves = [move for move in moves if not bits[move[0]] & pruned_vehicles]
+        self.num_pruned_moves += len(moves) - len(filtered_moves)
+
+        return filtered_moves
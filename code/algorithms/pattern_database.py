@@ -0,0 +1,254 @@
+import hashlib
+import os
+
+from code.classes import Board, CARTER_NAME, Game
+from .tablebase import Tablebase, TablebaseStateNotFoundError, get_rank_layout
+
+
+def get_relevant_vehicles(board: Board) -> list[str]:
+    """
+    Gets the names of all vehicles except carter, ordered by how directly they block
+    carter: first the vehicles whose lane crosses the path of carter to the exit, then
+    the vehicles whose lane crosses the lanes of those vehicles, and so on. Vehicles
+    that never block carter, not even indirectly, come last.
+
+    Within the same degree the vehicles are ordered by name.
+    """
+    carter = board.vehicles[CARTER_NAME]
+    lane_squares = board.get_lane_squares()
+    del lane_squares[CARTER_NAME]
+
+    # the path of carter from its current position to the exit
+    blocked_squares = {
+        (col, carter.lane)
+        for col in range(carter.offset, board.size)
+    }
+    remaining = sorted(lane_squares)
+    ordered: list[str] = []
+
+    while remaining:
+        degree = [name for name in remaining if lane_squares[name] & blocked_squares]
+
+        if not degree:
+            ordered += remaining
+
+            break
+
+        ordered += degree
+        remaining = [name for name in remaining if name not in degree]
+        blocked_squares = set().union(*(lane_squares[name] for name in degree))
+
+    return ordered
+
+
+class PatternDatabase:
+    """
+    Heuristic that looks up the number of moves to the goal in pattern databases. A
+    pattern keeps carter and a subset of the other vehicles and removes the rest. Every
+    move on the real board is also a valid move on the pattern board (there are fewer
+    vehicles in the way), so the distance on a pattern board never overestimates the
+    real distance. The largest distance of all patterns is used.
+
+    The distances of a pattern are a tablebase (see 'Tablebase') of the pattern board,
+    built from the first board the heuristic is called with and stored in the
+    'data/cache/pattern_database' folder. Boards whose pattern board is in the same
+    group of reachable states load it from disk instead of building it again.
+
+    If no patterns are given, they are chosen by 'get_patterns': every pattern starts
+    with a vehicle that blocks carter and grows with the vehicles that can block it.
+
+    NB.
+    AStar stops when carter can drive to the exit in one move, so the heuristic is the
+    distance minus that last move.
+    """
+    def __init__(
+            self,
+            patterns: list[list[str]] | None = None,
+            pattern_size: int=4,
+            num_patterns: int=2,
+            cache_path: str | None = None
+        ) -> None:
+        """
+        Initializes the heuristic with the patterns (lists of vehicle names without
+        carter), or the size and number of patterns to choose automatically, and the
+        folder to store the databases in.
+        """
+        if cache_path is None:
+            from code.helpers import get_cache_path
+
+            cache_path = os.path.join(get_cache_path(), 'pattern_database')
+
+        self.patterns = patterns
+        self.pattern_size = pattern_size
+        self.num_patterns = num_patterns
+        self.cache_path = cache_path
+
+        # the patterns and databases of every lane layout, per pattern one database
+        # for each group of states that cannot reach each other
+        self.databases: dict[tuple, tuple[list[list[str]], list[list[Tablebase]]]] = {}
+
+    def __call__(self, board: Board) -> int:
+        """
+        Gets the largest number of moves to the goal of all patterns, minus the final
+        move of carter.
+        """
+        layout = self.get_layout(board)
+
+        if layout not in self.databases:
+            patterns = self.get_patterns(board)
+            self.databases[layout] = (patterns, [[] for _ in patterns])
+
+        distance = 0
+
+        for pattern, pattern_databases in zip(*self.databases[layout]):
+            pattern_distance = self.get_distance(board, pattern, pattern_databases)
+            distance = max(distance, pattern_distance)
+
+        return max(distance - 1, 0)
+
+    @staticmethod
+    def get_layout(board: Board) -> tuple:
+        """
+        Gets the lanes and lengths of the vehicles, which are the same for every state
+        of a board.
+        """
+        return (board.size,) + tuple(
+            (vehicle.name, vehicle.orientation, vehicle.lane, vehicle.length)
+            for vehicle in board.vehicles.values()
+        )
+
+    def get_patterns(self, board: Board) -> list[list[str]]:
+        """
+        Gets the patterns, choosing them from the relevant vehicles of the board when
+        they were not given.
+
+        The vehicles are ordered by 'get_relevant_vehicles'. The first vehicles that
+        are not in a pattern yet start the patterns, which grow with the most relevant
+        vehicles whose lane crosses a lane in the pattern until they have
+        'pattern_size' vehicles. Vehicles that interact end up in the same pattern,
+        which makes the patterns more informed than groups of independent vehicles.
+        """
+        if self.patterns is not None:
+            return self.patterns
+
+        relevant = get_relevant_vehicles(board)
+        lane_squares = board.get_lane_squares()
+        patterns: list[list[str]] = []
+
+        for name in relevant:
+            if len(patterns) == self.num_patterns:
+                break
+
+            if any(name in pattern for pattern in patterns):
+                continue
+
+            pattern = [name]
+
+            while len(pattern) < self.pattern_size:
+                squares = set().union(*(lane_squares[other] for other in pattern))
+                candidate = next(
+                    (
+                        other
+                        for other in relevant
+                        if other not in pattern and lane_squares[other] & squares
+                    ),
+                    None,
+                )
+
+                if candidate is None:
+                    break
+
+                pattern.append(candidate)
+
+            patterns.append(pattern)
+
+        return patterns
+
+    def get_distance(
+            self,
+            board: Board,
+            pattern: list[str],
+            pattern_databases: list[Tablebase]
+        ) -> int:
+        """
+        Gets the number of moves to the goal of the pattern board of the board, a
+        database is loaded or built when none of the databases contains the state.
+        """
+        for database in pattern_databases:
+            try:
+                return database.get_distance(board) or 0
+            except TablebaseStateNotFoundError:
+                continue
+
+        database = self.load_database(self.get_pattern_board(board, pattern))
+        pattern_databases.append(database)
+
+        return database.get_distance(board) or 0
+
+    @staticmethod
+    def get_pattern_board(board: Board, pattern: list[str]) -> Board:
+        """
+        Creates a board with only carter and the vehicles of the pattern, on their
+        current positions.
+        """
+        return Game.setup_board(
+            Board(board.size),
+            [
+                (vehicle.name, vehicle.orientation, *vehicle.back, vehicle.length)
+                for vehicle in board.vehicles.values()
+                if vehicle.name == CARTER_NAME or vehicle.name in pattern
+            ],
+        )
+
+    def load_database(self, pattern_board: Board) -> Tablebase:
+        """
+        Loads the database that contains the state of the pattern board from disk, or
+        builds and stores it.
+
+        The databases are stored per rank layout (see 'get_rank_layout'), under a hash
+        of the size of the board and per lane in the order of the ranks: the lane, the
+        vehicles from the back to the front with their lengths and the weight of the
+        lane. Boards with the same hash give every state the same rank. Every database
+        of a layout is stored under the lowest rank of its states, which is the same for
+        every start state in the group of states it holds, so any state of that group
+        loads it.
+        """
+        key_layout = pattern_board.get_key_layout()
+        vehicles = pattern_board.vehicles
+        description = repr((pattern_board.size, tuple(
+            (
+                vehicles[key_layout[indices[0]][0]].orientation.value,
+                vehicles[key_layout[indices[0]][0]].lane,
+                tuple(
+                    (key_layout[i][0], vehicles[key_layout[i][0]].length)
+                    for i in indices
+                ),
+                weight,
+            )
+            for indices, _, weight in get_rank_layout(pattern_board)
+        )))
+        layout_directory = os.path.join(
+            self.cache_path,
+            hashlib.sha256(description.encode()).hexdigest(),
+        )
+
+        if os.path.isdir(layout_directory):
+            for name in sorted(os.listdir(layout_directory)):
+                directory = os.path.join(layout_directory, name)
+
+                if not os.path.isfile(os.path.join(directory, 'distances.npy')):
+                    continue
+
+                database = Tablebase.load(pattern_board, directory)
+
+                try:
+                    database.get_distance(pattern_board)
+                except TablebaseStateNotFoundError:
+                    continue
+
+                return database
+
+        database = Tablebase.build(pattern_board)
+        database.save(os.path.join(layout_directory, str(int(database.ranks[0]))))
+
+        return database
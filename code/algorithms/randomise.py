@@ -1,7 +1,24 @@
 import random
 
+import numpy as np
+
 from code.classes import Board, Game, CARTER_NAME
-from .heuristics import free_carter, all_max_moves
+from .heuristics import free_carter
+
+
+def random_move(game: Game, max_moves: bool=False) -> tuple[str, int]:
+    """
+    Picks a move at random from all available valid moves, or from all maximum
+    moves if 'max_moves' is True.
+
+    The moves are generated as arrays (see 'Mover.get_move_arrays') and only the
+    picked move is converted to a tuple.
+    """
+    vehicle_indices, steps = game.mover.get_move_arrays(max_moves)
+    index = random.randrange(len(steps))
+    vehicle_names = game.board.get_vehicle_arrays()[0]
+
+    return vehicle_names[vehicle_indices[index]], int(steps[index])
 
 
 def random_from_all_available_valid(game: Game) -> None:
@@ -11,7 +28,7 @@ def random_from_all_available_valid(game: Game) -> None:
     Picks a move at random from all available valid moves
     """
     while not Game.is_finished(game.board):
-        move: tuple[str, int] = random.choice(game.get_all_available_moves())
+        move: tuple[str, int] = random_move(game)
 
         game.make_move(move)
 
@@ -24,13 +41,15 @@ def random_vehicle_first(game: Game) -> None:
     then picks number of valid steps to move for that vehicle
     """
     while not Game.is_finished(game.board):
-        vehicle_moves: set[str, list[int]] = {}
+        vehicle_indices, vehicle_steps = game.mover.get_move_arrays()
+        vehicle_names = game.board.get_vehicle_arrays()[0]
 
-        for vehicle, steps in game.get_all_available_moves():
-            vehicle_moves.setdefault(vehicle, []).append(steps)
+        # vehicles with valid moves, in the order they were added
+        movable_vehicles = np.unique(vehicle_indices)
 
-        random_vehicle = random.choice(list(vehicle_moves.keys()))
-        steps = random.choice(vehicle_moves[random_vehicle])
+        random_vehicle_index = random.choice(movable_vehicles)
+        random_vehicle = vehicle_names[random_vehicle_index]
+        steps = int(random.choice(vehicle_steps[vehicle_indices == random_vehicle_index]))
 
         game.make_move((random_vehicle, steps))
 
@@ -46,7 +65,7 @@ def all_available_valid_finish_check(game: Game) -> None:
         if finish_game:
             game.make_move((CARTER_NAME, finish_game))
         else:
-            move: tuple[str, int] = random.choice(game.get_all_available_moves())
+            move: tuple[str, int] = random_move(game)
             game.make_move(move)
 
 
@@ -63,7 +82,7 @@ def all_max_moves_finish_check(game: Game) -> None:
         if finish_game:
             game.make_move((CARTER_NAME, finish_game))
         else:
-            move: tuple[str, int] = random.choice(all_max_moves(game.board))
+            move: tuple[str, int] = random_move(game, max_moves=True)
 
             # do not pick the same vehicle multiple times
             if move[0] != moved_vehicle:
@@ -25,9 +25,9 @@ class StepRefiner:
          # create new board as self.board
         data: list[tuple[str, Orientation, int, int, int]] = []
         for vehicle in board.vehicles.values():
-            data.append((vehicle.name, vehicle.orientation, vehicle.location[0][0], vehicle.location[0][1], vehicle.length))
+            data.append((vehicle.name, vehicle.orientation, *vehicle.back, vehicle.length))
 
-        self.board = Game.setup_board(Board(board.size), data)
+        self.board = Game.setup_board(type(board)(board.size), data)
 
         self.mover = Mover(self.board)
         self.moves = moves
@@ -40,7 +40,7 @@ class StepRefiner:
         self.new_moves: list[tuple[str, int]] = []
 
         self.total_seen_states = 0
-        self.unique_seen_states: set[tuple[tuple[object]]] = set()
+        self.unique_seen_states: set[int] = set()
         self.max_queue_size = 0
 
     def create_rewind_moves(self) -> list[tuple[str, int]]:
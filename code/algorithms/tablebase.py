@@ -0,0 +1,382 @@
+import math
+import os
+from dataclasses import dataclass, field
+
+import numpy as np
+from numpy.typing import NDArray
+
+from code.classes import Board, CARTER_NAME, Mover
+from .bidirectional import is_goal_state
+
+
+# Distance of states from which the goal cannot be reached
+UNREACHABLE = np.iinfo(np.uint8).max
+MAX_RANK = np.iinfo(np.uint64).max
+
+
+class TablebaseError(ValueError):
+    pass
+
+
+class TablebaseTooLargeError(TablebaseError):
+    def __init__(self, num_ranks: int):
+        super().__init__(
+            f'{num_ranks:.3E} state ranks do not fit in 64 bits'
+        )
+
+
+class TablebaseStateNotFoundError(TablebaseError):
+    def __init__(self):
+        super().__init__(
+            'State is not part of the tablebase'
+        )
+
+
+def get_rank_layout(board: Board) -> list[tuple[list[int], int, int]]:
+    """
+    Gets the layout of the state rank, a list with for every lane with vehicles:
+        - the positions of the vehicles in the state key layout (see
+          'Board.get_key_layout'), from the back of the lane to the front
+        - the number of empty squares in the lane
+        - the weight of the lane in the state rank
+
+    A lane with 'v' vehicles and 's' empty squares has C(s + v, v) configurations
+    (see docs/State_space.md), the rank of a state is the mixed radix number of the
+    configurations of all lanes.
+    """
+    lanes: dict[tuple, list[int]] = {}
+
+    for i, (name, *_) in enumerate(board.get_key_layout()):
+        vehicle = board.vehicles[name]
+        lanes.setdefault((vehicle.orientation, vehicle.lane), []).append(i)
+
+    layout = []
+    weight = 1
+
+    for indices in lanes.values():
+        indices.sort(key=lambda i: board.key_layout[i][1])
+        empty_squares = board.key_layout[indices[0]][2] - 1
+
+        layout.append((indices, empty_squares, weight))
+        weight *= math.comb(empty_squares + len(indices), len(indices))
+
+    if weight > MAX_RANK:
+        raise TablebaseTooLargeError(weight)
+
+    return layout
+
+
+def get_state_space_bound(board: Board, finished: bool=False) -> int:
+    """
+    Gets the size of the state space of the board as calculated in
+    docs/State_space.md: the product of the number of configurations of every lane.
+
+    Unless 'finished' is True, carter is not allowed on the last square of its lane
+    (those states finish the game), like in the docs.
+    """
+    bound = 1
+
+    for indices, empty_squares, _ in get_rank_layout(board):
+        if not finished and any(
+            board.key_layout[i][0] == CARTER_NAME
+            for i in indices
+        ):
+            empty_squares -= 1
+
+        bound *= math.comb(empty_squares + len(indices), len(indices))
+
+    return bound
+
+
+@dataclass
+class Tablebase:
+    """
+    Table with the number of moves to the goal (carter at the exit) of every state that
+    can be reached from the start state of a board.
+
+    The states are identified by their rank (see 'get_rank_layout'). The ranks of the
+    reachable states are stored as a sorted uint64 array, with their distances as a
+    packed uint8 array in the same order, so a state takes 9 bytes and is looked up by
+    binary search on its rank (O(log n)).
+
+    NB.
+    The ranks count every configuration of every lane, also the ones where vehicles
+    in crossing lanes overlap. Only a tiny part of them is reachable (818 of the
+    2025000 ranks of the first gameboard), and on a 9x9 board there are already
+    trillions of ranks, so a distance array indexed by the rank itself would not fit.
+
+    Both arrays are stored as .npy files that can be memory mapped read-only, so
+    several processes can share a single copy of the tablebase.
+    """
+    board: Board
+    ranks: NDArray[np.uint64]
+    distances: NDArray[np.uint8]
+    rank_layout: list[tuple[list[int], int, int]] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.rank_layout = get_rank_layout(self.board)
+
+    @classmethod
+    def build(cls, board: Board, verbose: bool=False) -> 'Tablebase':
+        """
+        Builds the tablebase by retrograde analysis:
+            - a Breadth First Search from the start state finds all reachable states
+              and the goal states among them
+            - a Breadth First Search from those goal states gives the distance to the
+              goal of every reachable state, every move can be reversed so it reaches
+              the same states
+
+        The ranks of all states are calculated at once from their state keys.
+
+        If verbose == True:
+            - prints the number of reachable states after every layer of the search
+
+        Raises exception if:
+            - the ranks of the board do not fit in 64 bits
+        """
+        # check the size before the search, not after
+        get_rank_layout(board)
+
+        board = board.copy()
+        mover = Mover(board)
+        start_key = board.get_state_key()
+
+        # find all reachable states and the goal states among them
+        reachable = {start_key}
+        layer = [start_key]
+        goal_keys = [start_key] if is_goal_state(board) else []
+
+        while layer:
+            next_layer = []
+
+            for state_key in layer:
+                board.set_state_key(state_key)
+
+                for move in mover.iter_children(mover.get_all_available_moves()):
+                    child_key = board.get_state_key()
+
+                    if child_key not in reachable:
+                        reachable.add(child_key)
+                        next_layer.append(child_key)
+
+                        if is_goal_state(board):
+                            goal_keys.append(child_key)
+
+            if verbose:
+                print(f'Number of reachable states: {len(reachable)}')
+
+            layer = next_layer
+
+        # search back from the goal states
+        distances: dict[int, int] = dict.fromkeys(goal_keys, 0)
+        layer = goal_keys
+        depth = 0
+
+        while layer:
+            next_layer = []
+            depth += 1
+
+            for state_key in layer:
+                board.set_state_key(state_key)
+
+                for move in mover.iter_children(mover.get_all_available_moves()):
+                    child_key = board.get_state_key()
+
+                    if child_key not in distances:
+                        distances[child_key] = depth
+                        next_layer.append(child_key)
+
+            layer = next_layer
+
+        # states without a path to the goal (only when there are no goal states)
+        for state_key in reachable:
+            distances.setdefault(state_key, UNREACHABLE)
+
+        del reachable
+
+        tablebase = cls(
+            board,
+            np.empty(0, dtype=np.uint64),
+            np.empty(0, dtype=np.uint8),
+        )
+
+        ranks = tablebase.get_state_ranks(list(distances))
+        order = np.argsort(ranks)
+
+        tablebase.ranks = ranks[order]
+        tablebase.distances = np.fromiter(
+            distances.values(),
+            dtype=np.uint8,
+            count=len(distances),
+        )[order]
+
+        return tablebase
+
+    def get_state_ranks(self, state_keys: list[int]) -> NDArray[np.uint64]:
+        """
+        Calculates the ranks of many states at once from their state keys.
+
+        Per lane the offsets of the vehicles (relative to their lowest offset) never
+        decrease from the back to the front, adding the position of the vehicle makes
+        them increase. The combinatorial number system then gives the rank of the lane
+        configuration.
+        """
+        key_layout = self.board.get_key_layout()
+        keys = np.array(state_keys, dtype=object)
+
+        relative_offsets = [
+            (keys // weight % radix).astype(np.int64)
+            for _, _, radix, weight in key_layout
+        ]
+
+        ranks = np.zeros(len(state_keys), dtype=np.uint64)
+        binomials = get_binomials(self.board.size)
+
+        for indices, _, weight in self.rank_layout:
+            lane_ranks = np.zeros(len(state_keys), dtype=np.uint64)
+
+            for position, i in enumerate(indices):
+                lane_ranks += binomials[relative_offsets[i] + position, position + 1]
+
+            ranks += lane_ranks * np.uint64(weight)
+
+        return ranks
+
+    def get_state_rank(self, board: Board) -> int:
+        """
+        Calculates the rank of the state of a board, see 'get_state_ranks'.
+        """
+        key_layout = self.board.get_key_layout()
+        rank = 0
+
+        for indices, _, weight in self.rank_layout:
+            lane_rank = 0
+
+            for position, i in enumerate(indices):
+                name, min_offset, _, _ = key_layout[i]
+                relative_offset = board.vehicles[name].offset - min_offset
+
+                lane_rank += math.comb(relative_offset + position, position + 1)
+
+            rank += lane_rank * weight
+
+        return rank
+
+    def get_distance(self, board: Board) -> int | None:
+        """
+        Gets the number of moves to the goal from the state of the board, or None if
+        the goal cannot be reached. The rank of the state is looked up by binary search.
+
+        Raises exception if:
+            - the state is not part of the tablebase
+        """
+        rank = self.get_state_rank(board)
+        index = int(np.searchsorted(self.ranks, np.uint64(rank)))
+
+        if index == len(self.ranks) or self.ranks[index] != rank:
+            raise TablebaseStateNotFoundError()
+
+        distance = int(self.distances[index])
+
+        return None if distance == UNREACHABLE else distance
+
+    def get_hint(self, board: Board) -> tuple[str, int] | None:
+        """
+        Gets a move that brings the board one move closer to the goal, or None if the
+        board is in a goal state or the goal cannot be reached.
+        """
+        distance = self.get_distance(board)
+
+        if not distance:
+            return None
+
+        mover = Mover(board)
+
+        for move in mover.get_all_available_moves():
+            mover.apply_move(move)
+            child_distance = self.get_distance(board)
+            mover.undo_move(move)
+
+            if child_distance == distance - 1:
+                return move
+
+    def solve(self, board: Board) -> list[tuple[str, int]]:
+        """
+        Gets the shortest list of moves from the state of the board to the goal by
+        following the hints, without changing the board.
+        """
+        board = board.copy()
+        mover = Mover(board)
+        moves: list[tuple[str, int]] = []
+
+        while (move := self.get_hint(board)) is not None:
+            mover.apply_move(move)
+            moves.append(move)
+
+        return moves
+
+    def save(self, directory: str) -> None:
+        """
+        Saves the ranks and distances as .npy files in 'directory'.
+
+        The files are written to a temporary file first so other processes never read
+        a half written tablebase.
+        """
+        os.makedirs(directory, exist_ok=True)
+
+        for name, array in (('ranks', self.ranks), ('distances', self.distances)):
+            file_path = os.path.join(directory, f'{name}.npy')
+            tmp_file_path = f'{file_path}.{os.getpid()}.tmp.npy'
+
+            np.save(tmp_file_path, array)
+            os.replace(tmp_file_path, file_path)
+
+    @classmethod
+    def load(cls, board: Board, directory: str, mmap: bool=True) -> 'Tablebase':
+        """
+        Loads the tablebase of the board from 'directory'.
+
+        If mmap == True:
+            - the arrays are memory mapped read-only instead of read into memory
+        """
+        mmap_mode = 'r' if mmap else None
+
+        return cls(
+            board.copy(),
+            np.load(os.path.join(directory, 'ranks.npy'), mmap_mode=mmap_mode),
+            np.load(os.path.join(directory, 'distances.npy'), mmap_mode=mmap_mode),
+        )
+
+    def get_counts(self) -> dict[str, int]:
+        """
+        Gets the counts to check the tablebase against the bounds in
+        docs/State_space.md:
+            - the number of reachable states, in total and without goal states
+            - the number of goal states
+            - the number of states from which the goal cannot be reached
+            - the largest number of moves to the goal
+            - the bound on the number of states without goal states from the docs
+            - the bound on the number of states including goal states
+        """
+        num_goal_states = int(np.count_nonzero(self.distances == 0))
+        solvable = self.distances[self.distances != UNREACHABLE]
+
+        return {
+            'states': len(self.distances),
+            'unfinished_states': len(self.distances) - num_goal_states,
+            'goal_states': num_goal_states,
+            'unreachable_states': len(self.distances) - len(solvable),
+            'max_distance': int(solvable.max()) if len(solvable) else 0,
+            'bound': get_state_space_bound(self.board),
+            'bound_finished': get_state_space_bound(self.board, finished=True),
+        }
+
+
+def get_binomials(size: int) -> NDArray[np.uint64]:
+    """
+    Gets a table with the binomial coefficients C(n, k) for n and k up to 'size'.
+    """
+    return np.array(
+        [[math.comb(n, k) for k in range(size + 1)] for n in range(size + 1)],
+        dtype=np.uint64,
+    )
@@ -1,3 +1,5 @@
+from .bitboard import BitBoard
+from .bucket_queue import BucketQueue
 from .board import (
     Board,
     BoardPlacementError,
@@ -6,7 +8,18 @@ from .board import (
     BoardVehicleCarterOrientationError,
     BoardVehicleNameExistError,
 )
-from .game import Game, SetupBoardNoCarterError, SetupBoardNoVehicleDataError
+from .compact_board import CompactBoard, CompactBoardTooManyVehiclesError
+from .fingerprint_set import FingerprintSet
+from .game import (
+    BOARD_BACKENDS,
+    Game,
+    SetupBoardNoCarterError,
+    SetupBoardNoVehicleDataError,
+    SetupBoardUnknownBackendError,
+)
+from .lane_table import LaneTable
+from .layer_queue import LayerQueue
+from .lru_table import LRUTable
 from .mover import (
     Direction,
     Mover,
@@ -16,7 +29,11 @@ from .mover import (
     MoveVehicleBlockedError,
     MoveVehicleNotExistError,
 )
+from .path_table import PathTable
 from .plotter import Plotter, PlotterError, PlotterUnsupportedWriterError
+from .seen_states import SeenStates
+from .solution_cache import SolutionCache
+from .state_file import StateFile
 from .vehicle import (
     CARTER_NAME,
     Orientation,
@@ -25,6 +42,9 @@ from .vehicle import (
 
 
 __all__ = [
+    'BitBoard',
+    'BOARD_BACKENDS',
+    'BucketQueue',
     'Board',
     'BoardPlacementError',
     'BoardPlacementOccupiedError',
@@ -32,18 +52,29 @@ __all__ = [
     'BoardVehicleCarterOrientationError',
     'BoardVehicleNameExistError',
     'CARTER_NAME',
+    'CompactBoard',
+    'CompactBoardTooManyVehiclesError',
     'Direction',
+    'FingerprintSet',
     'Game',
+    'LaneTable',
+    'LayerQueue',
+    'LRUTable',
     'Mover',
     'MoveOutOfBoundsError',
     'MoveStepIsZeroError',
     'MoveVehicleBlockedError',
     'MoveVehicleNotExistError',
     'Orientation',
+    'PathTable',
     'Plotter',
     'PlotterError',
     'PlotterUnsupportedWriterError',
+    'SeenStates',
     'SetupBoardNoCarterError',
     'SetupBoardNoVehicleDataError',
+    'SetupBoardUnknownBackendError',
+    'SolutionCache',
+    'StateFile',
     'Vehicle',
 ]
@@ -0,0 +1,138 @@
+from dataclasses import dataclass, field
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .board import Board
+from .vehicle import Orientation, Vehicle
+
+
+@dataclass
+class BitBoard(Board):
+    """
+    Bitboard backend for the Board.
+
+    Next to the regular layout it keeps an integer occupancy mask for every
+    row and every column of the board. Bit 'i' of a row mask is set when
+    column 'i' of that row is occupied, bit 'i' of a column mask is set when
+    row 'i' of that column is occupied.
+
+    This allows the Mover to get the occupancy of a lane without slicing and
+    comparing the layout.
+    """
+    row_masks: list[int] = field(init=False)
+    col_masks: list[int] = field(init=False)
+    placed: dict[str, tuple[int, int]] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+    )
+
+    def __post_init__(self):
+        super().__post_init__()
+
+        self.row_masks = [0] * self.size
+        self.col_masks = [0] * self.size
+
+    def update_state(self, vehicle: Vehicle, new=False) -> None:
+        """
+        Updates the layout like the regular Board and keeps the row and column
+        masks in sync.
+
+        The lane and offset a vehicle was placed on last are remembered, so we
+        only have to clear those bits instead of scanning the whole board.
+        """
+        super().update_state(vehicle, new)
+
+        if not new and vehicle.name in self.placed:
+            lane, offset = self.placed[vehicle.name]
+            self.set_bits(vehicle, lane, offset, False)
+
+        self.set_bits(vehicle, vehicle.lane, vehicle.offset, True)
+
+    def shift_vehicle(self, vehicle: Vehicle, steps: int) -> None:
+        """
+        Moves a vehicle like the regular Board and clears and sets the bits of
+        the squares the vehicle covers before and after the move.
+        """
+        old_offset = vehicle.offset
+
+        super().shift_vehicle(vehicle, steps)
+
+        self.set_bits(vehicle, vehicle.lane, old_offset, False)
+        self.set_bits(vehicle, vehicle.lane, vehicle.offset, True)
+
+    def set_bits(
+        self,
+        vehicle: Vehicle,
+        lane: int,
+        offset: int,
+        occupied: bool,
+    ) -> None:
+        """
+        Sets (occupied) or clears the bits of the squares a vehicle covers
+        when it is at 'offset' in 'lane'.
+
+        The squares are a run of bits in the mask of the lane itself and a
+        single bit in the mask of every crossing lane.
+        """
+        if vehicle.orientation == Orientation.HORIZONTAL:
+            lane_masks, cross_masks = self.row_masks, self.col_masks
+        else:
+            lane_masks, cross_masks = self.col_masks, self.row_masks
+
+        run = ((1 << vehicle.length) - 1) << offset
+        cross_bit = 1 << lane
+
+        if occupied:
+            lane_masks[lane] |= run
+
+            for i in range(offset, offset + vehicle.length):
+                cross_masks[i] |= cross_bit
+
+            self.placed[vehicle.name] = (lane, offset)
+        else:
+            lane_masks[lane] &= ~run
+
+            for i in range(offset, offset + vehicle.length):
+                cross_masks[i] &= ~cross_bit
+
+    def copy(self) -> 'BitBoard':
+        """
+        Creates a copy of the board, including the masks.
+        """
+        board = super().copy()
+        board.row_masks = list(self.row_masks)
+        board.col_masks = list(self.col_masks)
+        board.placed = dict(self.placed)
+
+        return board
+
+    def reset_locations(self) -> None:
+        """
+        Removes all vehicles from the layout and clears all masks.
+        """
+        super().reset_locations()
+
+        self.row_masks = [0] * self.size
+        self.col_masks = [0] * self.size
+        self.placed.clear()
+
+    def get_lane_mask(self, vehicle: Vehicle) -> int:
+        """
+        Gets the occupancy mask of the lane of a vehicle straight from the
+        row or column masks.
+        """
+        if vehicle.orientation == Orientation.HORIZONTAL:
+            return self.row_masks[vehicle.lane]
+
+        return self.col_masks[vehicle.lane]
+
+    def get_lane_masks(self) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """
+        Gets the row and column masks as arrays.
+        """
+        return (
+            np.array(self.row_masks, dtype=np.int64),
+            np.array(self.col_masks, dtype=np.int64),
+        )
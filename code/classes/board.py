@@ -1,12 +1,23 @@
+import copy
+import random
 from dataclasses import dataclass, field
 
 import numpy as np
 from numpy.typing import NDArray
 
-from .vehicle import Vehicle, Orientation
+from .vehicle import CARTER_NAME, Vehicle, Orientation
 
 
 EMPTY_SPOT = 0
+ZOBRIST_BITS = 64
+
+# Vehicle names, horizontal flags, lanes and lengths (see 'get_vehicle_arrays')
+VehicleArrays = tuple[
+    list[str],
+    NDArray[np.bool_],
+    NDArray[np.int64],
+    NDArray[np.int64],
+]
 
 
 class BoardPlacementError(ValueError):
@@ -53,10 +64,52 @@ class Board:
     vehicle objects as values), a list to track the movement steps of vehicles
     (vehicle names and step sizes as tuples), and an empty 2-D array to
     represent the Board's layout.
+
+    The state of the Board can also be described by a single packed integer,
+    the state key (see 'get_state_key'). Optionally the Board also keeps a
+    Zobrist hash of its state (see 'enable_zobrist'). Both are updated in
+    O(1) after every move.
     """
     size: int
     vehicles: dict[str, 'Vehicle'] = field(default_factory=dict, init=False)
     locations: NDArray[int | str] = field(init=False)  # type: ignore[type-var]
+    key_layout: list[tuple[str, int, int, int]] | None = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    key_weights: dict[str, int] | None = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    cached_state_key: int | None = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    vehicle_arrays: VehicleArrays | None = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    zobrist_keys: dict[str, list[int]] | None = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    zobrist_seed: int = field(default=0, init=False, repr=False, compare=False)
+    cached_zobrist_hash: int | None = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
 
     def __post_init__(self):
         self.locations = np.zeros((self.size, self.size), dtype='object')
@@ -95,6 +148,15 @@ class Board:
         self.vehicles[vehicle.name] = vehicle
         self.update_state(vehicle, True)
 
+        # Lanes changed, so the layout of the state key has to be rebuilt
+        self.key_layout = None
+        self.key_weights = None
+        self.vehicle_arrays = None
+
+        # There are no Zobrist keys for the new vehicle yet
+        if self.zobrist_keys is not None:
+            self.enable_zobrist(self.zobrist_seed)
+
     def update_state(self, vehicle: Vehicle, new=False) -> None:
         """
         Updates the state of the board by storing either 0 or a 'vehicle name'
@@ -106,9 +168,407 @@ class Board:
             - then storing the vehicle name at the new coordinates
         else:
             - not going to remove the vehicle from the board first
+
+        The state key and Zobrist hash are recalculated when they are
+        requested next.
         """
+        value = self.get_cell_value(vehicle)
+        self.cached_state_key = None
+        self.cached_zobrist_hash = None
+
         if not new:
-            self.locations[self.locations == vehicle.name] = 0
+            self.locations[self.locations == value] = EMPTY_SPOT
 
         for col, row in vehicle.location:
-            self.locations[row, col] = vehicle.name
+            self.locations[row, col] = value
+
+    def get_cell_value(self, vehicle: Vehicle) -> int | str:
+        """
+        Gets the value stored in the layout for the squares the vehicle
+        occupies, which is the vehicle name.
+        """
+        return vehicle.name
+
+    def get_vehicle_name(self, value: int | str) -> str:
+        """
+        Gets the name of the vehicle stored in the layout as 'value'.
+        """
+        return value
+
+    def get_lane_mask(self, vehicle: Vehicle) -> int:
+        """
+        Gets the occupancy mask of the lane of a vehicle: bit 'i' is set when
+        square 'i' of the row (horizontal) or column (vertical) is occupied.
+        """
+        if vehicle.orientation == Orientation.HORIZONTAL:
+            lane_squares = self.locations[vehicle.lane]
+        else:
+            lane_squares = self.locations[:, vehicle.lane]
+
+        return int.from_bytes(
+            np.packbits(lane_squares != EMPTY_SPOT, bitorder='little'),
+            'little',
+        )
+
+    def get_lane_masks(self) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """
+        Gets the occupancy masks of all rows and all columns at once, in a
+        single pass over the layout (see 'get_lane_mask').
+        """
+        occupied = (self.locations != EMPTY_SPOT).astype(np.int64)
+        powers = np.left_shift(1, np.arange(self.size, dtype=np.int64))
+
+        return occupied @ powers, powers @ occupied
+
+    def get_vehicle_arrays(self) -> VehicleArrays:
+        """
+        Gets the vehicle names and the properties that never change during a
+        game as arrays, in the order the vehicles were added:
+            - whether the vehicle is horizontal
+            - the lane of the vehicle
+            - the length of the vehicle
+
+        Like the layout of the state key these are built once and shared by
+        copies of the board.
+        """
+        if self.vehicle_arrays is None:
+            vehicles = self.vehicles.values()
+
+            self.vehicle_arrays = (
+                list(self.vehicles),
+                np.array(
+                    [
+                        vehicle.orientation == Orientation.HORIZONTAL
+                        for vehicle in vehicles
+                    ],
+                    dtype=np.bool_,
+                ),
+                np.array(
+                    [vehicle.lane for vehicle in vehicles],
+                    dtype=np.int64,
+                ),
+                np.array(
+                    [vehicle.length for vehicle in vehicles],
+                    dtype=np.int64,
+                ),
+            )
+
+        return self.vehicle_arrays
+
+    def get_vehicle_offsets(self) -> NDArray[np.int64]:
+        """
+        Gets the offsets of all vehicles as an array, in the order the
+        vehicles were added.
+        """
+        return np.fromiter(
+            (vehicle.offset for vehicle in self.vehicles.values()),
+            dtype=np.int64,
+            count=len(self.vehicles),
+        )
+
+    def shift_vehicle(self, vehicle: Vehicle, steps: int) -> None:
+        """
+        Moves a vehicle 'steps' squares along its lane and only updates the
+        squares the vehicle covers before and after the move.
+
+        NB.
+        The move is trusted, so it is not validated. Use the Mover to make
+        moves that still need to be validated.
+        """
+        lane = vehicle.lane
+        old_start = vehicle.offset
+        new_start = old_start + steps
+        value = self.get_cell_value(vehicle)
+
+        if vehicle.orientation == Orientation.HORIZONTAL:
+            lane_squares = self.locations[lane]
+        else:
+            lane_squares = self.locations[:, lane]
+
+        lane_squares[old_start:old_start + vehicle.length] = EMPTY_SPOT
+        lane_squares[new_start:new_start + vehicle.length] = value
+
+        # Only the term of this vehicle changes in the key and the hash
+        if self.cached_state_key is not None:
+            self.cached_state_key += steps * self.key_weights[vehicle.name]
+
+        if self.cached_zobrist_hash is not None:
+            keys = self.zobrist_keys[vehicle.name]
+            self.cached_zobrist_hash ^= keys[old_start] ^ keys[new_start]
+
+        vehicle.offset = new_start
+
+    def copy(self) -> 'Board':
+        """
+        Creates a copy of the board that can be changed independently.
+
+        Much cheaper than setting up a new board since placements don't need
+        to be validated again. The layout of the state key and the Zobrist
+        keys are shared.
+        """
+        board = copy.copy(self)
+        board.vehicles = {
+            name: copy.copy(vehicle)
+            for name, vehicle in self.vehicles.items()
+        }
+        board.locations = self.locations.copy()
+
+        return board
+
+    def reset_locations(self) -> None:
+        """
+        Removes all vehicles from the layout of the board without removing
+        them from the vehicles dictionary.
+        """
+        self.locations[:] = EMPTY_SPOT
+        self.cached_state_key = None
+        self.cached_zobrist_hash = None
+
+    def get_key_layout(self) -> list[tuple[str, int, int, int]]:
+        """
+        Gets the layout of the state key, a list with for every vehicle:
+            - the vehicle name
+            - the lowest offset the vehicle can ever have in its lane
+            - the number of offsets the vehicle can have in its lane (radix)
+            - the weight of the vehicle in the state key
+
+        Vehicles can never leave their lane or pass the other vehicles in it,
+        so a vehicle can only be placed between the vehicles in front of and
+        behind it. This makes the number of possible offsets equal to the
+        number of empty squares in the lane plus one.
+
+        The layout only depends on the lanes, not on the exact positions of
+        the vehicles, so it is built once and reused after every move.
+        """
+        if self.key_layout is not None:
+            return self.key_layout
+
+        lanes: dict[tuple[Orientation, int], list[Vehicle]] = {}
+
+        for vehicle in self.vehicles.values():
+            lanes.setdefault(
+                (vehicle.orientation, vehicle.lane),
+                [],
+            ).append(vehicle)
+
+        self.key_layout = []
+        self.key_weights = {}
+        weight = 1
+
+        for vehicle in self.vehicles.values():
+            lane = lanes[(vehicle.orientation, vehicle.lane)]
+
+            min_offset = sum(
+                other.length
+                for other in lane
+                if other.offset < vehicle.offset
+            )
+            radix = self.size - sum(other.length for other in lane) + 1
+
+            self.key_layout.append((vehicle.name, min_offset, radix, weight))
+            self.key_weights[vehicle.name] = weight
+            weight *= radix
+
+        return self.key_layout
+
+    def get_lane_squares(self) -> dict[str, set[tuple[int, int]]]:
+        """
+        Gets for every vehicle the squares it can ever cover: its lane between
+        the vehicles behind and in front of it.
+        """
+        lane_squares = {}
+
+        for name, min_offset, radix, _ in self.get_key_layout():
+            vehicle = self.vehicles[name]
+            offsets = range(
+                min_offset,
+                min_offset + radix - 1 + vehicle.length,
+            )
+
+            if vehicle.orientation == Orientation.HORIZONTAL:
+                lane_squares[name] = {
+                    (offset, vehicle.lane) for offset in offsets
+                }
+            else:
+                lane_squares[name] = {
+                    (vehicle.lane, offset) for offset in offsets
+                }
+
+        return lane_squares
+
+    def get_dependency_closure(self) -> set[str]:
+        """
+        Gets the names of the vehicles that can influence carter: carter
+        itself, the vehicles whose lane crosses the lane of carter, the
+        vehicles whose lane crosses the lanes of those vehicles, and so on.
+
+        The squares of the other vehicles can never be covered by a vehicle in
+        the closure, so they never block it (and are never blocked by it).
+        They never have to move to solve the game and can be left out of the
+        search (see 'create_relevant_board').
+        """
+        lane_squares = self.get_lane_squares()
+        closure = {CARTER_NAME}
+        new_names = [CARTER_NAME]
+
+        while new_names:
+            squares = set().union(*(lane_squares[name] for name in new_names))
+            new_names = [
+                name
+                for name in lane_squares
+                if name not in closure and lane_squares[name] & squares
+            ]
+            closure.update(new_names)
+
+        return closure
+
+    def create_relevant_board(self) -> 'Board':
+        """
+        Creates a new board of the same type with only the vehicles in the
+        dependency closure (see 'get_dependency_closure'), on their current
+        positions.
+
+        Every move on the new board is a valid move on this board, so the
+        moves of a solution of the new board also solve this board, leaving
+        the other vehicles where they are.
+        """
+        closure = self.get_dependency_closure()
+        board = type(self)(self.size)
+
+        for vehicle in self.vehicles.values():
+            if vehicle.name in closure:
+                col, row = vehicle.back
+
+                board.add_vehicle(
+                    Vehicle(
+                        vehicle.name,
+                        vehicle.orientation,
+                        col,
+                        row,
+                        vehicle.length,
+                    )
+                )
+
+        if self.zobrist_keys is not None:
+            board.enable_zobrist(self.zobrist_seed)
+
+        return board
+
+    def get_state_key(self) -> int:
+        """
+        Gets the state key of the board: a single integer that fully describes
+        the positions of all vehicles.
+
+        A vehicle's lane is fixed, so its position is described by its offset
+        in that lane (column for horizontal, row for vertical vehicles). The
+        offsets relative to the lowest possible offset are packed together as
+        a mixed radix number, in the order the vehicles were added.
+
+        Boards set up from the same data always use the same layout, so the
+        keys are canonical and can be compared between boards.
+
+        The key is calculated once and then updated in O(1) by every move
+        (see 'shift_vehicle').
+        """
+        if self.cached_state_key is None:
+            vehicles = self.vehicles
+
+            self.cached_state_key = sum(
+                (vehicles[name].offset - min_offset) * weight
+                for name, min_offset, _, weight in self.get_key_layout()
+            )
+
+        return self.cached_state_key
+
+    def set_state_key(self, key: int) -> None:
+        """
+        Places all vehicles on the positions described by the state key.
+
+        NB.
+        The key is trusted, so placements are not validated. Only use keys
+        created by 'get_state_key' of a board with the same layout.
+        """
+        self.reset_locations()
+
+        for name, min_offset, radix, weight in self.get_key_layout():
+            vehicle = self.vehicles[name]
+            vehicle.offset = min_offset + key // weight % radix
+
+            self.update_state(vehicle, True)
+
+        self.cached_state_key = key
+
+    def create_from_state_key(self, key: int) -> 'Board':
+        """
+        Creates a new board of the same type, with the same vehicles, placed
+        on the positions described by the state key.
+        """
+        board = type(self)(self.size)
+
+        for vehicle in self.vehicles.values():
+            col, row = vehicle.back
+
+            board.add_vehicle(
+                Vehicle(
+                    vehicle.name,
+                    vehicle.orientation,
+                    col,
+                    row,
+                    vehicle.length,
+                )
+            )
+
+        board.key_layout = self.get_key_layout()
+        board.key_weights = self.key_weights
+        board.vehicle_arrays = self.vehicle_arrays
+        board.zobrist_keys = self.zobrist_keys
+        board.set_state_key(key)
+
+        return board
+
+    def enable_zobrist(self, seed: int = 0) -> None:
+        """
+        Starts keeping a Zobrist hash of the state of the board.
+
+        Every vehicle gets a random 64 bit key for every offset in its lane.
+        The hash is the XOR of the keys of the current offsets of all
+        vehicles, so a move only has to XOR out the key of the old offset and
+        XOR in the key of the new offset.
+
+        The keys are drawn from a generator seeded with 'seed', so boards set
+        up from the same data get the same hashes.
+
+        NB.
+        Unlike the state key, different states can share the same hash.
+        Always verify a matching hash with the state key (see 'SeenStates').
+        """
+        generator = random.Random(seed)
+        self.zobrist_seed = seed
+
+        self.zobrist_keys = {
+            name: [
+                generator.getrandbits(ZOBRIST_BITS)
+                for _ in range(self.size)
+            ]
+            for name in self.vehicles
+        }
+        self.cached_zobrist_hash = None
+
+    @property
+    def zobrist_hash(self) -> int | None:
+        """
+        The Zobrist hash of the state of the board, or None when Zobrist
+        hashing is not enabled.
+        """
+        if self.zobrist_keys is None:
+            return None
+
+        if self.cached_zobrist_hash is None:
+            zobrist_hash = 0
+
+            for name, vehicle in self.vehicles.items():
+                zobrist_hash ^= self.zobrist_keys[name][vehicle.offset]
+
+            self.cached_zobrist_hash = zobrist_hash
+
+        return self.cached_zobrist_hash
@@ -0,0 +1,74 @@
+import heapq
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class BucketQueue:
+    """
+    Priority queue for scores that only take a few distinct values, like the
+    scores of A* (depth plus heuristic).
+
+    Every score has a bucket with a stack of items per depth. The item with
+    the lowest score is popped first, ties are broken by the largest depth
+    (the state closest to a solution) and then by the item pushed last, so
+    the order is deterministic.
+
+    Only the distinct scores are kept in a heap, which stays tiny, so pushing
+    and popping take constant time apart from creating and removing buckets.
+    """
+    buckets: dict[float, list[list[Any]]] = field(default_factory=dict)
+    tops: dict[float, int] = field(default_factory=dict)
+    scores: list[float] = field(default_factory=list)
+    size: int = 0
+
+    def push(self, score: float, depth: int, item: Any) -> None:
+        """
+        Adds the item with its score and depth to the queue.
+        """
+        bucket = self.buckets.get(score)
+
+        if bucket is None:
+            bucket = self.buckets[score] = []
+            self.tops[score] = depth
+            heapq.heappush(self.scores, score)
+        elif depth > self.tops[score]:
+            self.tops[score] = depth
+
+        if len(bucket) <= depth:
+            bucket.extend([] for _ in range(depth + 1 - len(bucket)))
+
+        bucket[depth].append(item)
+        self.size += 1
+
+    def pop(self) -> tuple[float, int, Any]:
+        """
+        Removes and returns the score, depth and item with the lowest score
+        and the largest depth.
+        """
+        score = self.scores[0]
+        bucket = self.buckets[score]
+        depth = self.tops[score]
+        item = bucket[depth].pop()
+        self.size -= 1
+
+        # move down to the next depth with items, or remove the empty bucket
+        top = depth
+
+        while top >= 0 and not bucket[top]:
+            top -= 1
+
+        if top < 0:
+            del self.buckets[score]
+            del self.tops[score]
+            heapq.heappop(self.scores)
+        else:
+            self.tops[score] = top
+
+        return score, depth, item
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __bool__(self) -> bool:
+        return self.size > 0
@@ -0,0 +1,94 @@
+from dataclasses import dataclass, field
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .board import Board, EMPTY_SPOT
+from .vehicle import Vehicle
+
+
+MAX_VEHICLES = np.iinfo(np.uint8).max
+
+
+class CompactBoardTooManyVehiclesError(ValueError):
+    def __init__(self):
+        super().__init__(
+            f'A compact board can hold at most {MAX_VEHICLES} vehicles'
+        )
+
+
+@dataclass
+class CompactBoard(Board):
+    """
+    Compact backend for the Board.
+
+    Instead of a grid of vehicle names the layout is a 'uint8' grid of
+    vehicle indices. Index 0 is the empty spot, the names belonging to the
+    other indices are stored in a side table ('vehicle_names').
+
+    Comparisons on the layout are native NumPy comparisons and the layout
+    can be turned into bytes ('locations.tobytes()') and back
+    ('np.frombuffer') for hashing or sharing memory between processes.
+    """
+    locations: NDArray[np.uint8] = field(init=False)
+    vehicle_names: list[str] = field(init=False)
+    vehicle_indices: dict[str, int] = field(default_factory=dict, init=False)
+
+    def __post_init__(self):
+        self.locations = np.zeros((self.size, self.size), dtype=np.uint8)
+        self.vehicle_names = ['']
+
+    def add_vehicle(self, vehicle: Vehicle) -> None:
+        """
+        Adds a Vehicle to the Board like the regular Board.
+
+        Raises an exception:
+            - if the board has no more indices left for a new vehicle
+        """
+        if (
+            vehicle.name not in self.vehicle_indices
+            and len(self.vehicle_names) > MAX_VEHICLES
+        ):
+            raise CompactBoardTooManyVehiclesError()
+
+        super().add_vehicle(vehicle)
+
+    def get_cell_value(self, vehicle: Vehicle) -> int:
+        """
+        Gets the index of the vehicle in the side table, the vehicle is added
+        to the side table the first time it is placed on the board.
+        """
+        index = self.vehicle_indices.get(vehicle.name)
+
+        if index is None:
+            index = len(self.vehicle_names)
+            self.vehicle_indices[vehicle.name] = index
+            self.vehicle_names.append(vehicle.name)
+
+        return index
+
+    def get_vehicle_name(self, value: int) -> str:
+        """
+        Gets the name of the vehicle stored in the layout as 'value'.
+        """
+        return self.vehicle_names[value]
+
+    def copy(self) -> 'CompactBoard':
+        """
+        Creates a copy of the board, including the side table.
+        """
+        board = super().copy()
+        board.vehicle_names = list(self.vehicle_names)
+        board.vehicle_indices = dict(self.vehicle_indices)
+
+        return board
+
+    def get_names_layout(self) -> NDArray[int | str]:  # type: ignore[type-var]
+        """
+        Gets the layout as a grid of vehicle names, like the layout of the
+        regular Board.
+        """
+        names = np.array(self.vehicle_names, dtype='object')
+        names[EMPTY_SPOT] = EMPTY_SPOT
+
+        return names[self.locations]
@@ -0,0 +1,104 @@
+from array import array
+from dataclasses import dataclass, field
+
+
+# Odd multiplier that spreads the bits of a state key over the fingerprint
+FINGERPRINT_MULTIPLIER = 0x9E3779B97F4A7C15
+FINGERPRINT_MASK = (1 << 64) - 1
+MIN_CAPACITY = 16
+
+
+def get_fingerprint(state_key: int) -> int:
+    """
+    Gets the 64-bit fingerprint of a state key, never 0 (which marks an empty
+    slot). Keys below 2**64 keep a unique fingerprint, apart from the one key
+    that maps to 0.
+    """
+    return (state_key * FINGERPRINT_MULTIPLIER & FINGERPRINT_MASK) or 1
+
+
+@dataclass
+class FingerprintSet:
+    """
+    Set of state keys that only stores a fixed-width fingerprint of every
+    key: a hash table with open addressing in a single array of 64-bit
+    words, so a state takes 8 bytes per slot instead of a Python int in a
+    set.
+
+    Two keys with the same fingerprint count as the same state, so a state
+    can be taken for seen when it was not (only on boards with keys longer
+    than 64 bits). The table doubles when it is half full, so it never takes
+    more than 4 slots per state.
+    """
+    slots: array = field(
+        default_factory=lambda: array('Q', bytes(8 * MIN_CAPACITY))
+    )
+    size: int = 0
+
+    def add(self, state_key: int) -> bool:
+        """
+        Adds the state key to the set. Returns True if it was not in the set
+        yet, otherwise False.
+        """
+        if self.insert(get_fingerprint(state_key)):
+            self.size += 1
+
+            if 2 * self.size > len(self.slots):
+                self.grow()
+
+            return True
+
+        return False
+
+    def insert(self, fingerprint: int) -> bool:
+        """
+        Stores the fingerprint in the first empty slot from its home slot.
+        Returns False if it was already stored.
+        """
+        slots = self.slots
+        mask = len(slots) - 1
+        index = (fingerprint >> 32) & mask
+
+        while slots[index]:
+            if slots[index] == fingerprint:
+                return False
+
+            index = (index + 1) & mask
+
+        slots[index] = fingerprint
+
+        return True
+
+    def grow(self) -> None:
+        """
+        Doubles the number of slots and stores all fingerprints again.
+        """
+        old_slots = self.slots
+        self.slots = array('Q', bytes(16 * len(old_slots)))
+
+        for fingerprint in old_slots:
+            if fingerprint:
+                self.insert(fingerprint)
+
+    def get_memory(self) -> int:
+        """
+        Gets the number of bytes of the slots.
+        """
+        return len(self.slots) * self.slots.itemsize
+
+    def __contains__(self, state_key: int) -> bool:
+        fingerprint = get_fingerprint(state_key)
+        slots = self.slots
+        mask = len(slots) - 1
+        index = (fingerprint >> 32) & mask
+
+        while slots[index]:
+            if slots[index] == fingerprint:
+                return True
+
+            index = (index + 1) & mask
+
+        return False
+
+    def __len__(self) -> int:
+        return self.size
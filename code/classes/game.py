@@ -1,8 +1,12 @@
 from dataclasses import dataclass, field
+from typing import Any
 
+from .bitboard import BitBoard
 from .board import Board
+from .compact_board import CompactBoard
 from .mover import Mover, MoveError
 from .plotter import Plotter
+from .solution_cache import SolutionCache
 from .vehicle import CARTER_NAME, Orientation, Vehicle
 
 
@@ -21,6 +25,14 @@ class SetupBoardNoVehicleDataError(GameError):
         super().__init__('No vehicle data provided')
 
 
+class SetupBoardUnknownBackendError(GameError):
+    def __init__(self, backend: str):
+        super().__init__(f"'{backend}': unknown board backend")
+
+
+BOARD_BACKENDS = ('default', 'bitboard', 'compact')
+
+
 @dataclass
 class Game:
     """
@@ -29,9 +41,13 @@ class Game:
     board setup, move execution through the Mover, move history tracking
     and checking if the game is finished. The Game class also allows for easy
     visualizing of the current state of the board through the Plotter.
+
+    The 'backend' decides which Board implementation is used, see
+    'BOARD_BACKENDS' for the supported options.
     """
     start_state: list[tuple[str, Orientation, int, int, int]]
     board_size: int
+    backend: str = 'default'
     board: Board = field(init=False)
     mover: Mover = field(init=False)
     plotter: Plotter = field(init=False)
@@ -46,7 +62,7 @@ class Game:
         and Plotter.
         """
         self.board = self.setup_board(
-            Board(self.board_size),
+            self.create_board(self.board_size, self.backend),
             self.start_state
         )
         self.mover = Mover(self.board)
@@ -115,7 +131,10 @@ class Game:
         NB.
         Removes any moves stored in the current game instance
         """
-        self.board = self.setup_board(Board(self.board.size), self.start_state)
+        self.board = self.setup_board(
+            self.create_board(self.board.size, self.backend),
+            self.start_state
+        )
         self.mover = Mover(self.board)
         self.moves.clear()
 
@@ -135,6 +154,64 @@ class Game:
 
         return self.is_finished(self.board)
 
+    def solve(
+        self,
+        solver_class: type,
+        *args: Any,
+        cache: SolutionCache | None = None,
+        freeze_irrelevant: bool = False,
+        **kwargs: Any,
+    ) -> list[tuple[str, int]]:
+        """
+        Solves the game from the current board state with a solver (like
+        'BreadthFirst' or 'AStar') and returns the moves, without changing the
+        board.
+
+        The solver is created with a copy of the board and 'args', then run
+        with 'kwargs'. If a cache is provided it is consulted first, so the
+        solver only searches when the board was not solved before with the
+        same algorithm and parameters. Solutions that are found are stored
+        in the cache.
+
+        If freeze_irrelevant == True:
+            - the solver only gets the vehicles that can influence carter (see
+              'Board.create_relevant_board'), the other vehicles stay where
+              they are
+
+        NB.
+        Returns an empty list if the solver found no solution, those are not
+        stored in the cache. Solvers like 'AStar' always set their solution
+        board, so a solution only counts when carter reached the exit on it.
+        """
+        key = None
+        board = self.board
+
+        if freeze_irrelevant:
+            board = board.create_relevant_board()
+
+        if cache is not None:
+            key = cache.get_key(
+                board,
+                solver_class.__name__,
+                args,
+                kwargs,
+            )
+            moves = cache.get(key)
+
+            if moves is not None:
+                return moves
+
+        solver = solver_class(board.copy(), *args)
+        solver.run(**kwargs)
+
+        if solver.solution is None or not self.is_finished(solver.solution):
+            return []
+
+        if key is not None:
+            cache.put(key, solver.moves)
+
+        return solver.moves
+
     def write_moves_to_csv(self, file_path: str) -> None:
         """
         Write moves to a CSV file.
@@ -157,7 +234,11 @@ class Game:
         write_board_state_to_csv(file_path, list(self.board.vehicles.values()))
 
     @classmethod
-    def load_game_from_csv(cls, board_file_path: str) -> 'Game':
+    def load_game_from_csv(
+        cls,
+        board_file_path: str,
+        backend: str = 'default',
+    ) -> 'Game':
         """
         Creates a new Game from board data from csv file.
         """
@@ -167,7 +248,7 @@ class Game:
         board_size = get_board_size_from_file_path(board_file_path)
         data = read_board_state_from_csv(board_file_path)
 
-        return cls(data, board_size)
+        return cls(data, board_size, backend)
 
     @staticmethod
     def is_finished(board: Board) -> bool:
@@ -181,6 +262,28 @@ class Game:
 
         return col_carter_front == board.size - 1
 
+    @staticmethod
+    def create_board(board_size: int, backend: str = 'default') -> Board:
+        """
+        Creates an empty board of 'board_size' using the requested backend.
+
+        Backends:
+            - 'default': layout stored as a grid of vehicle names
+            - 'bitboard': also keeps integer occupancy masks per row and
+              column for faster move calculations
+            - 'compact': layout stored as a 'uint8' grid of vehicle indices
+        """
+        if backend == 'default':
+            return Board(board_size)
+
+        if backend == 'bitboard':
+            return BitBoard(board_size)
+
+        if backend == 'compact':
+            return CompactBoard(board_size)
+
+        raise SetupBoardUnknownBackendError(backend)
+
     @staticmethod
     def setup_board(
         board: Board,
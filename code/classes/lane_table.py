@@ -0,0 +1,180 @@
+import os
+from dataclasses import dataclass, field
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+MAX_VEHICLE_LENGTH = 3
+
+
+@dataclass
+class LaneTable:
+    """
+    Lookup table with the maximum number of steps a vehicle can move forwards
+    and backwards in a lane.
+
+    These only depend on the occupancy mask of the lane (bit 'i' set when
+    square 'i' is occupied), the offset of the vehicle and its length, so for
+    a given board size they can be calculated once for every combination.
+
+    Both tables are indexed as [lane mask, vehicle offset, vehicle length].
+    For lookups they are also kept as flat lists, since indexing a list of
+    Python ints is several times faster than indexing a NumPy array. For
+    lookups of many vehicles at once they are kept as flat int64 arrays.
+
+    To turn move ranges into moves, the table also keeps all steps a vehicle
+    could make on the board (first forwards, then backwards) and for every
+    combination of [backward steps, forward steps] which of those are valid.
+    """
+    size: int
+    forward: NDArray[np.uint8]
+    backward: NDArray[np.uint8]
+    forward_steps: list[int] = field(init=False, repr=False)
+    backward_steps: list[int] = field(init=False, repr=False)
+    forward_array: NDArray[np.int64] = field(init=False, repr=False)
+    backward_array: NDArray[np.int64] = field(init=False, repr=False)
+    step_candidates: NDArray[np.int64] = field(init=False, repr=False)
+    step_masks: NDArray[np.bool_] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.forward_steps = self.forward.ravel().tolist()
+        self.backward_steps = self.backward.ravel().tolist()
+        self.forward_array = self.forward.ravel().astype(np.int64)
+        self.backward_array = self.backward.ravel().astype(np.int64)
+
+        steps = np.arange(1, self.size, dtype=np.int64)
+        self.step_candidates = np.concatenate((steps, -steps))
+
+        max_steps = np.arange(self.size)[:, None, None]
+        self.step_masks = np.concatenate(
+            (
+                np.broadcast_to(
+                    steps <= max_steps.transpose(1, 0, 2),
+                    (self.size, self.size, self.size - 1),
+                ),
+                np.broadcast_to(
+                    steps <= max_steps,
+                    (self.size, self.size, self.size - 1),
+                ),
+            ),
+            axis=2,
+        )
+
+    def get_index(self, mask: int, offset: int, length: int) -> int:
+        """
+        Gets the index of [mask, offset, length] in the flat lists.
+
+        Also works on arrays of masks, offsets and lengths.
+        """
+        return (mask * self.size + offset) * (MAX_VEHICLE_LENGTH + 1) + length
+
+    def get_max_steps(
+        self,
+        mask: int,
+        offset: int,
+        length: int,
+        forwards: bool,
+    ) -> int:
+        """
+        Gets the maximum number of steps a vehicle at 'offset' with 'length'
+        can move in a lane with occupancy 'mask'.
+        """
+        steps = self.forward_steps if forwards else self.backward_steps
+
+        return steps[self.get_index(mask, offset, length)]
+
+    def get_move_range(
+        self,
+        mask: int,
+        offset: int,
+        length: int,
+    ) -> tuple[int, int]:
+        """
+        Gets the maximum number of steps backwards and forwards at once.
+        """
+        index = self.get_index(mask, offset, length)
+
+        return self.backward_steps[index], self.forward_steps[index]
+
+    @classmethod
+    def build(cls, size: int) -> 'LaneTable':
+        """
+        Calculates the tables for a board size.
+
+        Uses two helper arrays indexed by mask:
+            - the number of trailing zeros (the number of empty squares
+              before the first occupied square)
+            - the bit length (one past the last occupied square)
+
+        Forwards the mask is shifted so the square in front of the vehicle
+        becomes bit 0, backwards only the bits behind the vehicle are kept.
+        """
+        masks = np.arange(1 << size)
+
+        bit_length = np.zeros(1 << size, dtype=np.int64)
+        trailing_zeros = np.full(1 << size, size, dtype=np.int64)
+
+        for i in reversed(range(size)):
+            trailing_zeros[(masks >> i) & 1 == 1] = i
+
+        for i in range(size):
+            bit_length[masks >> i != 0] = i + 1
+
+        shape = (1 << size, size, MAX_VEHICLE_LENGTH + 1)
+        forward = np.zeros(shape, dtype=np.uint8)
+        backward = np.zeros(shape, dtype=np.uint8)
+
+        for length in range(1, MAX_VEHICLE_LENGTH + 1):
+            for offset in range(size - length + 1):
+                squares_ahead = size - offset - length
+
+                forward[:, offset, length] = np.minimum(
+                    trailing_zeros[masks >> (offset + length)],
+                    squares_ahead,
+                )
+                backward[:, offset, length] = (
+                    offset - bit_length[masks & ((1 << offset) - 1)]
+                )
+
+        return cls(size, forward, backward)
+
+    @classmethod
+    def load(cls, size: int) -> 'LaneTable':
+        """
+        Gets the tables for a board size.
+
+        Tables are built only once per board size: they are kept in memory
+        and cached on disk in the 'data/cache' folder.
+        """
+        if size in LANE_TABLES:
+            return LANE_TABLES[size]
+
+        from code.helpers import get_cache_path
+
+        cache_path = get_cache_path()
+        file_path = os.path.join(cache_path, f'lane_table_{size}.npz')
+
+        if os.path.isfile(file_path):
+            with np.load(file_path) as data:
+                table = cls(size, data['forward'], data['backward'])
+        else:
+            table = cls.build(size)
+
+            # Write to a temporary file first so other processes never read
+            # a half written table
+            os.makedirs(cache_path, exist_ok=True)
+            tmp_file_path = f'{file_path}.{os.getpid()}.tmp.npz'
+            np.savez(
+                tmp_file_path,
+                forward=table.forward,
+                backward=table.backward,
+            )
+            os.replace(tmp_file_path, file_path)
+
+        LANE_TABLES[size] = table
+
+        return table
+
+
+LANE_TABLES: dict[int, LaneTable] = {}
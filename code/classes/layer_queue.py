@@ -0,0 +1,77 @@
+from array import array
+from dataclasses import dataclass, field
+
+
+# Number of bits in a machine word of the queue
+WORD_BITS = 64
+WORD_MASK = (1 << WORD_BITS) - 1
+
+
+@dataclass
+class LayerQueue:
+    """
+    First in, first out queue of state keys for a Breadth First Search,
+    packed in contiguous arrays of machine words instead of a queue of
+    objects. A key takes a single word, or as many words as its 'key_size'
+    bytes need on large boards.
+
+    States are pushed to the next layer and popped from the current layer,
+    when the current layer is empty the next layer takes its place and its
+    memory is released. The depth of the popped states is the number of the
+    layer, so it is not stored per state.
+
+    NB.
+    The queue takes no locks, it is only meant for a single thread.
+    """
+    key_size: int
+    current: array = field(default_factory=lambda: array('Q'))
+    next_layer: array = field(default_factory=lambda: array('Q'))
+    index: int = 0
+    depth: int = -1
+
+    def __post_init__(self) -> None:
+        self.num_words = max((self.key_size + 7) // 8, 1)
+
+    def push(self, state_key: int) -> None:
+        """
+        Adds the state key to the next layer, one depth deeper than the
+        current layer.
+        """
+        if self.num_words == 1:
+            self.next_layer.append(state_key)
+
+            return
+
+        for _ in range(self.num_words):
+            self.next_layer.append(state_key & WORD_MASK)
+            state_key >>= WORD_BITS
+
+    def pop(self) -> tuple[int, int]:
+        """
+        Removes and returns the first state key of the current layer with its
+        depth, moving on to the next layer when the current layer is empty.
+        """
+        if self.index == len(self.current):
+            self.current, self.next_layer = self.next_layer, array('Q')
+            self.index = 0
+            self.depth += 1
+
+        if self.num_words == 1:
+            state_key = self.current[self.index]
+        else:
+            state_key = 0
+
+            for i in range(self.num_words):
+                state_key |= self.current[self.index + i] << (WORD_BITS * i)
+
+        self.index += self.num_words
+
+        return state_key, self.depth
+
+    def __len__(self) -> int:
+        num_words = len(self.current) - self.index + len(self.next_layer)
+
+        return num_words // self.num_words
+
+    def __bool__(self) -> bool:
+        return self.index < len(self.current) or len(self.next_layer) > 0
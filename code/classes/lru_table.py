@@ -0,0 +1,49 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class LRUTable:
+    """
+    Table of at most 'size' state keys with a value each. When the table is
+    full the least recently used state is dropped: both storing a state and
+    finding it with 'get' make it the most recently used state, so states
+    that are looked up often stay in the table.
+    """
+    size: int
+    entries: OrderedDict[int, Any] = field(default_factory=OrderedDict)
+
+    def get(self, state_key: int) -> Any:
+        """
+        Gets the value of the state, None if it is not in the table.
+        """
+        value = self.entries.get(state_key)
+
+        if value is not None:
+            self.entries.move_to_end(state_key)
+
+        return value
+
+    def put(self, state_key: int, value: Any) -> None:
+        """
+        Stores the value of the state, dropping the least recently used state
+        when the table is full.
+        """
+        self.entries[state_key] = value
+        self.entries.move_to_end(state_key)
+
+        if len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Removes all states from the table.
+        """
+        self.entries.clear()
+
+    def __contains__(self, state_key: int) -> bool:
+        return state_key in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
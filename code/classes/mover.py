@@ -1,8 +1,11 @@
 from enum import Enum
+from typing import Iterator
 
 import numpy as np
+from numpy.typing import NDArray
 
-from .board import Board, EMPTY_SPOT
+from .board import Board
+from .lane_table import LaneTable
 from .vehicle import Orientation
 
 
@@ -62,6 +65,7 @@ class Mover:
             - calculating all the available valid moves for the current board state
         """
         self.board = board
+        self.lane_table = LaneTable.load(board.size)
 
     def _get_all_moves_vehicle(
         self,
@@ -76,21 +80,15 @@ class Mover:
         """
         all_vehicle_moves: list[tuple[str, int]] = []
 
-        # Get steps forwards
-        max_steps_forward = self.get_vehicle_max_steps(
+        max_steps_backward, max_steps_forward = self.get_vehicle_move_range(
             vehicle_name,
-            Direction.FORWARDS,
         )
 
+        # Get steps forwards
         for steps in range(1, max_steps_forward + 1):
             all_vehicle_moves.append((vehicle_name, steps))
 
         # Get steps backwards
-        max_steps_backward = self.get_vehicle_max_steps(
-            vehicle_name,
-            Direction.BACKWARDS,
-        )
-
         for steps in range(1, max_steps_backward + 1):
             all_vehicle_moves.append((vehicle_name, -steps))
 
@@ -108,17 +106,79 @@ class Mover:
         else:
             - gets all available valid moves for all vehicles on the board
         """
-        available_moves: list[tuple[str, int]] = []
-
         if vehicle_name:
-            available_moves = self._get_all_moves_vehicle(vehicle_name)
-        else:
-            for vehicle_name, vehicle in self.board.vehicles.items():
-                available_moves.extend(
-                    self._get_all_moves_vehicle(vehicle_name)
-                )
+            return self._get_all_moves_vehicle(vehicle_name)
+
+        return self.get_moves_from_arrays(*self.get_move_arrays())
+
+    def get_move_ranges(self) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """
+        Gets the maximum number of steps every vehicle can move backwards and
+        forwards, as two arrays in the order the vehicles were added.
+
+        The occupancy masks of all lanes are calculated in one pass over the
+        layout, after which the steps of all vehicles are looked up in the
+        LaneTable at once.
+        """
+        _, horizontal, lanes, lengths = self.board.get_vehicle_arrays()
+        row_masks, col_masks = self.board.get_lane_masks()
+
+        masks = np.where(horizontal, row_masks[lanes], col_masks[lanes])
+        indices = self.lane_table.get_index(
+            masks,
+            self.board.get_vehicle_offsets(),
+            lengths,
+        )
+
+        return (
+            self.lane_table.backward_array[indices],
+            self.lane_table.forward_array[indices],
+        )
+
+    def get_move_arrays(
+        self,
+        max_moves: bool = False,
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """
+        Gets all available valid moves as two arrays: the indices of the
+        vehicles (see 'Board.get_vehicle_arrays') and the steps.
+
+        The valid steps of every vehicle are looked up in the LaneTable by
+        its move range, so the moves are in the same order as the moves of
+        'get_all_available_moves'.
+
+        If 'max_moves' is True:
+            - only gets the largest move in both directions (see
+              'all_max_moves')
+        """
+        backward, forward = self.get_move_ranges()
+
+        if max_moves:
+            steps = np.stack((forward, -backward), axis=1)
+            vehicle_indices, columns = np.nonzero(steps)
+
+            return vehicle_indices, steps[vehicle_indices, columns]
+
+        vehicle_indices, columns = np.nonzero(
+            self.lane_table.step_masks[backward, forward],
+        )
+
+        return vehicle_indices, self.lane_table.step_candidates[columns]
+
+    def get_moves_from_arrays(
+        self,
+        vehicle_indices: NDArray[np.int64],
+        steps: NDArray[np.int64],
+    ) -> list[tuple[str, int]]:
+        """
+        Converts move arrays (see 'get_move_arrays') to a list of moves.
+        """
+        names = self.board.get_vehicle_arrays()[0]
 
-        return available_moves
+        return list(zip(
+            [names[i] for i in vehicle_indices.tolist()],
+            steps.tolist(),
+        ))
 
     def get_vehicle_max_steps(
         self,
@@ -155,61 +215,39 @@ class Mover:
                 - checks coordinates from the back of the vehicle up until the
                   top of the board
 
-        Uses Numpy for faster value comparison
+        The steps are looked up in the LaneTable of the board size, using the
+        occupancy mask of the lane the vehicle is in.
         """
-        board = self.board
         vehicle = self.board.vehicles.get(vehicle_name)
 
         if vehicle is None:
             raise MoveVehicleNotExistError()
 
-        orientation = vehicle.orientation
-        col_vehicle_back, row_vehicle_back = vehicle.location[0]
-        col_vehicle_front, row_vehicle_front = vehicle.location[-1]
-
-        if orientation == Orientation.HORIZONTAL:
-            if direction == Direction.FORWARDS:
-                max_steps = board.size - 1 - col_vehicle_front
-                start = col_vehicle_front + 1
-                end = start + max_steps
-                squares_to_check = board.locations[row_vehicle_back, start:end]
-            else:
-                max_steps = col_vehicle_back
-                start = col_vehicle_back - max_steps
-                end = col_vehicle_back
-                squares_to_check = board.locations[row_vehicle_back, start:end]
-
-                # Since we're moving backwards we'd like np.argmax() to 'scan'
-                # in reverse order
-                squares_to_check = np.flip(squares_to_check)
-        else:
-            if direction == Direction.FORWARDS:
-                max_steps = board.size - 1 - row_vehicle_front
-                start = row_vehicle_front + 1
-                end = start + max_steps
-                squares_to_check = board.locations[start:end, col_vehicle_back]
-            else:
-                max_steps = row_vehicle_back
-                start = row_vehicle_back - max_steps
-                end = row_vehicle_back
-                squares_to_check = board.locations[start:end, col_vehicle_back]
-
-                # Since we're moving backwards we'd like np.argmax() to 'scan'
-                # in reverse order
-                squares_to_check = np.flip(squares_to_check)
+        return self.lane_table.get_max_steps(
+            self.board.get_lane_mask(vehicle),
+            vehicle.offset,
+            vehicle.length,
+            direction == Direction.FORWARDS,
+        )
 
-        # Creates boolean array (no collision results in no 'True' values)
-        has_collision = np.any(squares_to_check != EMPTY_SPOT)
+    def get_vehicle_move_range(self, vehicle_name: str) -> tuple[int, int]:
+        """
+        Gets the maximum number of steps a vehicle can move backwards and
+        forwards, using a single lookup of the lane mask.
 
-        # Default 'collision_idx' to max length (no 'True' values)
-        collision_at_idx = len(squares_to_check)
+        Raises exception if:
+            - vehicle does not exist
+        """
+        vehicle = self.board.vehicles.get(vehicle_name)
 
-        if has_collision:
-            # np.argmax() returns the index of the first occurrence of 'True'
-            collision_at_idx = np.argmax(squares_to_check != EMPTY_SPOT)
+        if vehicle is None:
+            raise MoveVehicleNotExistError()
 
-        # Pick whichever is lowest of 'max_steps' or 'collision_at_idx'
-        return min(max_steps, collision_at_idx)
+        return self.lane_table.get_move_range(
+            self.board.get_lane_mask(vehicle),
+            vehicle.offset,
+            vehicle.length,
+        )
 
     def move_vehicle(self, move: tuple[str, int]) -> None:
         """
@@ -219,19 +257,56 @@ class Mover:
             - vehicle exists
             - move can be made (not blocked or out of bounds)
         """
+        self.validate_move(move)
+        self.apply_move(move)
+
+    def apply_move(self, move: tuple[str, int]) -> None:
+        """
+        Moves a vehicle on the board without validating the move first.
+
+        Only the squares the vehicle covers are updated, which makes this the
+        fast path for moves that are known to be valid, e.g. moves taken from
+        'get_all_available_moves'.
+        """
         vehicle_name, steps = move
-        vehicle = self.board.vehicles.get(vehicle_name)
 
-        self.validate_move(move)
+        self.board.shift_vehicle(self.board.vehicles[vehicle_name], steps)
 
-        col_back, row_back = vehicle.location[0]
+    def undo_move(self, move: tuple[str, int]) -> None:
+        """
+        Reverts a move made with 'apply_move' (or 'move_vehicle') by moving
+        the vehicle back the same number of steps.
+        """
+        vehicle_name, steps = move
 
-        if vehicle.orientation == Orientation.HORIZONTAL:
-            vehicle.update_location(col_back + steps, row_back)
-        else:
-            vehicle.update_location(col_back, row_back + steps)
+        self.board.shift_vehicle(self.board.vehicles[vehicle_name], -steps)
+
+    def iter_children(
+        self,
+        moves: list[tuple[str, int]],
+    ) -> Iterator[tuple[str, int]]:
+        """
+        Expands the child states of the board in place.
+
+        For every move:
+            - applies the move on the board
+            - yields the move
+            - undoes the move when the next child is requested
+
+        While a move is yielded the board is in the child state, so its state
+        key and Zobrist hash can be read in O(1) and only the children worth
+        keeping need to be copied (see 'Board.copy').
+
+        NB.
+        The board is only restored when the iteration continues, stopping the
+        iteration early leaves the board in the last child state.
+        """
+        for move in moves:
+            self.apply_move(move)
+
+            yield move
 
-        self.board.update_state(vehicle)
+            self.undo_move(move)
 
     def validate_move(self, move: tuple[str, int]) -> None:
         """
@@ -251,8 +326,8 @@ class Mover:
         direction = Direction.FORWARDS if steps > 0 else Direction.BACKWARDS
         max_steps = self.get_vehicle_max_steps(vehicle_name, direction)
 
-        col_vehicle_front, row_vehicle_front = vehicle.location[-1]
-        col_vehicle_back, row_vehicle_back = vehicle.location[0]
+        col_vehicle_front, row_vehicle_front = vehicle.front
+        col_vehicle_back, row_vehicle_back = vehicle.back
         first_board_col = first_board_row = 0
         last_board_col = last_board_row = self.board.size - 1
 
@@ -0,0 +1,46 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class PathTable:
+    """
+    Table with for every reached state the state it was reached from (its
+    parent) and the move that was made, both indexed by state key.
+
+    Solvers only store this single parent reference per state instead of the
+    full move history, the moves are only rebuilt for the state that solves
+    the game (see 'get_moves').
+    """
+    start_key: int
+    parents: dict[int, tuple[int, tuple[str, int]]] = field(
+        default_factory=dict,
+    )
+
+    def add(
+        self,
+        state_key: int,
+        parent_key: int,
+        move: tuple[str, int],
+    ) -> None:
+        """
+        Stores the parent and the move of a newly reached state.
+        """
+        self.parents[state_key] = (parent_key, move)
+
+    def get_moves(self, state_key: int) -> list[tuple[str, int]]:
+        """
+        Rebuilds the moves from the start state to the state by following the
+        parents back to the start state.
+        """
+        moves: list[tuple[str, int]] = []
+
+        while state_key != self.start_key:
+            state_key, move = self.parents[state_key]
+            moves.append(move)
+
+        moves.reverse()
+
+        return moves
+
+    def __len__(self) -> int:
+        return len(self.parents)
@@ -0,0 +1,40 @@
+from dataclasses import dataclass, field
+from typing import Iterator
+
+from .board import Board
+
+
+@dataclass
+class SeenStates:
+    """
+    Set of the states a solver has already seen, stored as state keys.
+
+    The state key of a board is kept up to date with every move, so it is
+    looked up directly. A Zobrist hash (see 'Board.enable_zobrist') is not
+    used: it is a Python int of the same size as the key on every shipped
+    board, and a hash hit would still need the key to rule out a collision.
+
+    Iterating over the set gives the state keys of all seen states.
+    """
+    keys: set[int] = field(default_factory=set)
+
+    def add(self, board: Board) -> bool:
+        """
+        Adds the state of the board to the set.
+
+        Returns True if the state was not seen before, False otherwise.
+        """
+        state_key = board.get_state_key()
+
+        if state_key in self.keys:
+            return False
+
+        self.keys.add(state_key)
+
+        return True
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.keys)
@@ -0,0 +1,183 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from .board import Board
+
+
+@dataclass
+class SolutionCache:
+    """
+    Cache of the solutions found by the solvers, stored in a SQLite file so
+    it is kept between runs of the scripts.
+
+    A solution is stored under a key made from the start state of the board,
+    the name of the algorithm and its parameters (see 'get_key'). Every
+    solution records when it was last used, when the stored moves take more
+    than 'max_size' bytes the least recently used solutions are removed.
+    """
+    file_path: str
+    max_size: int = 64 * 1024 * 1024
+    connection: sqlite3.Connection = field(init=False, repr=False)
+
+    def __post_init__(self):
+        directory = os.path.dirname(self.file_path)
+
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.connection = sqlite3.connect(self.file_path)
+        self.connection.execute(
+            'CREATE TABLE IF NOT EXISTS solutions ('
+            'key TEXT PRIMARY KEY, '
+            'moves TEXT NOT NULL, '
+            'size INTEGER NOT NULL, '
+            'last_used REAL NOT NULL)'
+        )
+        self.connection.commit()
+
+    @classmethod
+    def load(cls, max_size: int = 64 * 1024 * 1024) -> 'SolutionCache':
+        """
+        Opens the cache of the project in the 'data/cache' folder.
+        """
+        from code.helpers import get_cache_path
+
+        return cls(
+            os.path.join(get_cache_path(), 'solutions.sqlite3'),
+            max_size,
+        )
+
+    @staticmethod
+    def get_key(
+        board: Board,
+        algorithm: str,
+        args: tuple[Any, ...] = (),
+        kwargs: dict[str, Any] | None = None,
+    ) -> str:
+        """
+        Gets the cache key of a board state solved by an algorithm, created
+        with 'args' and run with 'kwargs'.
+
+        The key is a SHA-256 hash of:
+            - the board size
+            - every vehicle (name, orientation, lane, offset, length), sorted
+              by name so the order in which they were added does not matter
+            - the name of the algorithm
+            - the arguments, keyword arguments sorted by name, functions (like
+              heuristics) are represented by their name
+
+        NB.
+        The board backend and Zobrist hashing do not change the solution, so
+        they are not part of the key.
+        """
+        vehicles = sorted(
+            (
+                vehicle.name,
+                vehicle.orientation.value,
+                vehicle.lane,
+                vehicle.offset,
+                vehicle.length,
+            )
+            for vehicle in board.vehicles.values()
+        )
+        args = [getattr(value, '__name__', value) for value in args]
+        kwargs = {
+            name: getattr(value, '__name__', value)
+            for name, value in sorted((kwargs or {}).items())
+        }
+        description = json.dumps(
+            [board.size, vehicles, algorithm, args, kwargs],
+            default=repr,
+        )
+
+        return hashlib.sha256(description.encode()).hexdigest()
+
+    def get(self, key: str) -> list[tuple[str, int]] | None:
+        """
+        Gets the moves of a cached solution and marks it as used, or None if
+        there is no solution for the key.
+        """
+        row = self.connection.execute(
+            'SELECT moves FROM solutions WHERE key = ?',
+            (key,),
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        self.connection.execute(
+            'UPDATE solutions SET last_used = ? WHERE key = ?',
+            (time.time(), key),
+        )
+        self.connection.commit()
+
+        return [(name, steps) for name, steps in json.loads(row[0])]
+
+    def put(self, key: str, moves: list[tuple[str, int]]) -> None:
+        """
+        Stores the moves of a solution, then removes the least recently used
+        solutions until the cache fits in 'max_size' again.
+        """
+        moves_json = json.dumps(moves, separators=(',', ':'))
+
+        self.connection.execute(
+            'INSERT OR REPLACE INTO solutions VALUES (?, ?, ?, ?)',
+            (key, moves_json, len(moves_json), time.time()),
+        )
+
+        # never evict the solution that was just stored
+        total_size = self.get_size()
+        rows = self.connection.execute(
+            'SELECT key, size FROM solutions WHERE key != ? '
+            'ORDER BY last_used, rowid',
+            (key,),
+        )
+
+        for evicted_key, size in rows.fetchall():
+            if total_size <= self.max_size:
+                break
+
+            self.connection.execute(
+                'DELETE FROM solutions WHERE key = ?',
+                (evicted_key,),
+            )
+            total_size -= size
+
+        self.connection.commit()
+
+    def get_size(self) -> int:
+        """
+        Gets the number of bytes taken by the stored moves.
+        """
+        return self.connection.execute(
+            'SELECT COALESCE(SUM(size), 0) FROM solutions'
+        ).fetchone()[0]
+
+    def clear(self) -> None:
+        """
+        Removes all cached solutions.
+        """
+        self.connection.execute('DELETE FROM solutions')
+        self.connection.commit()
+
+    def close(self) -> None:
+        """
+        Closes the connection to the cache file.
+        """
+        self.connection.close()
+
+    def __len__(self) -> int:
+        return self.connection.execute(
+            'SELECT COUNT(*) FROM solutions'
+        ).fetchone()[0]
+
+    def __contains__(self, key: str) -> bool:
+        return self.connection.execute(
+            'SELECT 1 FROM solutions WHERE key = ?',
+            (key,),
+        ).fetchone() is not None
@@ -0,0 +1,149 @@
+import heapq
+import os
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+from .board import Board
+
+
+# Number of state keys read from or written to disk at once
+CHUNK_SIZE = 65536
+
+
+@dataclass
+class StateFile:
+    """
+    File on disk with sorted, unique state keys. Every key takes 'key_size'
+    bytes, stored big endian, so the bytes of the file sort the same way as
+    the keys.
+
+    The keys are only read in chunks (see '__iter__'), or looked up by binary
+    search on the file (see '__contains__'), so a state file never has to fit
+    in memory.
+    """
+    file_path: str
+    key_size: int
+
+    @staticmethod
+    def get_key_size(board: Board) -> int:
+        """
+        Gets the number of bytes needed for every state key of the board.
+        """
+        num_keys = 1
+
+        for _, _, radix, _ in board.get_key_layout():
+            num_keys *= radix
+
+        return max(((num_keys - 1).bit_length() + 7) // 8, 1)
+
+    @classmethod
+    def write(
+        cls,
+        file_path: str,
+        key_size: int,
+        keys: Iterable[int],
+    ) -> 'StateFile':
+        """
+        Writes the keys, which have to be sorted and unique, to a new state
+        file.
+
+        The keys are written to a temporary file first, so the state file is
+        never left half written.
+        """
+        tmp_file_path = file_path + '.tmp'
+        chunk: list[bytes] = []
+
+        with open(tmp_file_path, 'wb') as file:
+            for key in keys:
+                chunk.append(key.to_bytes(key_size, 'big'))
+
+                if len(chunk) == CHUNK_SIZE:
+                    file.write(b''.join(chunk))
+                    chunk = []
+
+            file.write(b''.join(chunk))
+
+        os.replace(tmp_file_path, file_path)
+
+        return cls(file_path, key_size)
+
+    @classmethod
+    def merge(
+        cls,
+        file_path: str,
+        runs: list['StateFile'],
+        excluded: list['StateFile'],
+    ) -> 'StateFile':
+        """
+        Merges the keys of the runs into a new state file, without the keys
+        that are in one of the excluded state files.
+
+        All files are read at the same time in order, so the duplicates in
+        the runs and the keys of the excluded files are removed without
+        looking up a single key.
+        """
+        key_size = runs[0].key_size if runs else excluded[0].key_size
+        excluded_keys = heapq.merge(*excluded)
+        excluded_key = next(excluded_keys, None)
+
+        def iter_keys() -> Iterator[int]:
+            nonlocal excluded_key
+            last_key = None
+
+            for key in heapq.merge(*runs):
+                if key == last_key:
+                    continue
+
+                last_key = key
+
+                while excluded_key is not None and excluded_key < key:
+                    excluded_key = next(excluded_keys, None)
+
+                if key != excluded_key:
+                    yield key
+
+        return cls.write(file_path, key_size, iter_keys())
+
+    def get_size(self) -> int:
+        """
+        Gets the size of the state file in bytes.
+        """
+        return os.path.getsize(self.file_path)
+
+    def remove(self) -> None:
+        """
+        Removes the state file from disk.
+        """
+        os.remove(self.file_path)
+
+    def __iter__(self) -> Iterator[int]:
+        key_size = self.key_size
+
+        with open(self.file_path, 'rb') as file:
+            while chunk := file.read(key_size * CHUNK_SIZE):
+                for i in range(0, len(chunk), key_size):
+                    yield int.from_bytes(chunk[i:i + key_size], 'big')
+
+    def __contains__(self, key: int) -> bool:
+        key_size = self.key_size
+        low = 0
+        high = len(self)
+
+        with open(self.file_path, 'rb') as file:
+            while low < high:
+                middle = (low + high) // 2
+                file.seek(middle * key_size)
+                middle_key = int.from_bytes(file.read(key_size), 'big')
+
+                if middle_key == key:
+                    return True
+
+                if middle_key < key:
+                    low = middle + 1
+                else:
+                    high = middle
+
+        return False
+
+    def __len__(self) -> int:
+        return self.get_size() // self.key_size
@@ -10,10 +10,17 @@ class Orientation(Enum):
     VERTICAL = 'V'
 
 
-@dataclass
+@dataclass(slots=True)
 class Vehicle:
     """
     Vehicle represents the cars (length 2) and trucks (length 3) on the board.
+
+    A vehicle only stores its lane (the row of a horizontal vehicle, the
+    column of a vertical vehicle) and its offset in that lane (the column or
+    row of the back of the vehicle). The squares it occupies are calculated
+    when they are requested.
+
+    Uses slots since millions of vehicles get created while searching.
     """
     name: str
     orientation: Orientation
@@ -21,21 +28,59 @@ class Vehicle:
     start_row: int
     length: int
     is_carter: bool = field(default=False, init=False)
-    location: list[tuple[int, int]] = field(default_factory=list, init=False)
+    lane: int = field(default=0, init=False)
+    offset: int = field(default=0, init=False)
 
     def __post_init__(self):
         self.is_carter = self.name == CARTER_NAME
         self.update_location(self.start_col, self.start_row)
 
+    @property
+    def location(self) -> list[tuple[int, int]]:
+        """
+        A list of coordinates of the grid squares the vehicle occupies on the
+        board, from back to front.
+        """
+        if self.orientation == Orientation.HORIZONTAL:
+            return [
+                (self.offset + i, self.lane)
+                for i in range(self.length)
+            ]
+
+        return [(self.lane, self.offset + i) for i in range(self.length)]
+
+    @location.setter
+    def location(self, location: list[tuple[int, int]]) -> None:
+        self.update_location(*location[0])
+
+    @property
+    def back(self) -> tuple[int, int]:
+        """
+        The coordinates of the back of the vehicle.
+        """
+        if self.orientation == Orientation.HORIZONTAL:
+            return self.offset, self.lane
+
+        return self.lane, self.offset
+
+    @property
+    def front(self) -> tuple[int, int]:
+        """
+        The coordinates of the front of the vehicle.
+        """
+        if self.orientation == Orientation.HORIZONTAL:
+            return self.offset + self.length - 1, self.lane
+
+        return self.lane, self.offset + self.length - 1
+
     def update_location(self, col: int, row: int) -> None:
         """
         Updates the location of the Vehicle starting at col, row.
         Col and row represent the coordinates of the back of the car.
-
-        A vehicle keeps a list of coordinates of the grid squares it occupies
-        on the board.
         """
         if self.orientation == Orientation.HORIZONTAL:
-            self.location = [(col + i, row) for i in range(self.length)]
+            self.lane = row
+            self.offset = col
         else:
-            self.location = [(col, row + i) for i in range(self.length)]
+            self.lane = col
+            self.offset = row
@@ -58,6 +58,14 @@ def get_output_path() -> str:
     return get_path(get_data_path(), 'output')
 
 
+def get_cache_path() -> str:
+    """
+    Helper function for getting the full path of the 'cache' folder in this
+    project.
+    """
+    return get_path(get_data_path(), 'cache')
+
+
 def get_output_images_path() -> str:
     """
     Helper function for getting the full path of the 'output/images' folder in
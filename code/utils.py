@@ -100,21 +100,37 @@ def read_moves_from_csv(file_path) -> list[tuple[str, int]]:
     return data
 
 
-def generate_results(results: list[tuple[int, float, int | str, int | str, int | str]], dest_file: str) -> None:
+def generate_results(
+        results: list[tuple[int, float, int | str, int | str, int | str]],
+        dest_file: str,
+        bounds: list[float] | None = None
+    ) -> None:
     """
     Writes all the search results (number of moves made, solving time, number of
     seen states, max size of queue) to a CSV file.
+
+    If bounds are provided, every result also gets its suboptimality bound (the
+    solution is at most this many times as long as the shortest solution).
     """
     with open(dest_file, 'w', newline='') as f:
         fieldnames = ['number moves made', 'solving time', 'total seen states', 'max queue size', 'unique seen states']
+
+        if bounds is not None:
+            fieldnames.append('suboptimality bound')
+
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
 
-        for num_moves_made, solving_time, num_seen_states, max_queue_size, unique_seen_states in results:
-            writer.writerow({
+        for i, (num_moves_made, solving_time, num_seen_states, max_queue_size, unique_seen_states) in enumerate(results):
+            row = {
                     'number moves made': num_moves_made,
                     'solving time': solving_time,
                     'total seen states': num_seen_states,
                     'max queue size': max_queue_size,
                     'unique seen states': unique_seen_states
-            })
+            }
+
+            if bounds is not None:
+                row['suboptimality bound'] = bounds[i]
+
+            writer.writerow(row)
@@ -2,7 +2,7 @@ import os
 import time
 import argparse
 
-from code.classes import Board, Game
+from code.classes import BOARD_BACKENDS, Board, Game, SolutionCache
 from code.helpers import (
     get_output_path,
     get_experiment_path,
@@ -17,18 +17,75 @@ from code.utils import (
 )
 
 
-def a_star(filename: str, max_moves: bool = True) -> None:
+def a_star(
+    filename: str,
+    max_moves: bool = True,
+    backend: str = 'default',
+    cache: bool = True,
+    weight: float = 1.0,
+    anytime: bool = False,
+    move_pruning: bool = False,
+    freeze_irrelevant: bool = False,
+    lazy: bool = False,
+) -> None:
     """
     Executes the A-Star algorithm several times for a given Board, writes
     the search results (number of moves made, solving time, number of seen states, max
     size of queue) to a CSV file in the data/experiment folder, and exports the moves
     made during the search to another CSV file in the data/output folder.
+
+    If cache == True:
+        - a solution found before with the same parameters is exported without
+          searching again, no experiment results are written
+
+    If anytime == True:
+        - runs Anytime Repairing A* once for at most 3600 seconds, starting with
+          'weight', and writes a result for every improved solution instead
+
+    If move_pruning == True:
+        - moves that only change the order of independent moves are not generated
+          (see 'MovePruning'), not used by the anytime search
+
+    If freeze_irrelevant == True:
+        - only the vehicles that can influence carter are searched (see
+          'Board.create_relevant_board'), the others never move
+
+    If lazy == True:
+        - children are only stored as seen when they are popped from the
+          queue (see 'AStar.run'), not used by the anytime search
     """
     filename_path = os.path.join(get_gameboards_path(), filename)
 
     board_size = get_board_size_from_file_path(filename)
     data = read_board_state_from_csv(filename_path)
-    board = Game.setup_board(Board(board_size), data)
+    board = Game.setup_board(Game.create_board(board_size, backend), data)
+
+    # leave out the vehicles that can never influence carter
+    if freeze_irrelevant:
+        board = board.create_relevant_board()
+
+    if anytime:
+        a_star_anytime(filename, board, max_moves, weight)
+
+        return
+
+    # consult the solution cache before searching
+    solution_cache = SolutionCache.load() if cache else None
+    cache_key = SolutionCache.get_key(
+        board,
+        'AStar',
+        (num_blocking_vehicles, weight),
+        {'max_moves': max_moves, 'move_pruning': move_pruning, 'lazy': lazy},
+    )
+
+    if solution_cache is not None:
+        moves = solution_cache.get(cache_key)
+
+        if moves is not None:
+            print(f'Found cached solution for {filename}, use -nc to search again')
+            export_moves(filename, 'AStar', moves)
+
+            return
 
     print(f'Starting A-Star for {filename}')
     start_time = time.time()
@@ -38,8 +95,8 @@ def a_star(filename: str, max_moves: bool = True) -> None:
 
     while time.time() - start_time < 3600:
         start_run_time = time.time()
-        astar = AStar(board, num_blocking_vehicles)
-        astar.run(max_moves)
+        astar = AStar(board, num_blocking_vehicles, weight)
+        astar.run(max_moves, move_pruning, lazy)
 
         n_runs += 1
         if n_runs % 10 == 0:
@@ -58,15 +115,20 @@ def a_star(filename: str, max_moves: bool = True) -> None:
         f'for {n_runs} runs to solve {filename}'
     )
 
-    # get the output and experiment folder paths
-    output_path = get_output_path()
+    # only cache a search that brought carter to the exit
+    if (
+        solution_cache is not None
+        and astar.solution is not None
+        and Game.is_finished(astar.solution)
+    ):
+        solution_cache.put(cache_key, astar.moves)
+
+    # get the experiment folder path
     experiment_path = get_experiment_path()
-    os.makedirs(output_path, exist_ok=True)
     os.makedirs(experiment_path, exist_ok=True)
 
     # write the moves made in the last run to the file in the output folder
-    export_file_path = os.path.join(output_path, f'AStar_{filename}')
-    write_moves_to_csv(export_file_path, astar.moves)
+    export_moves(filename, 'AStar', astar.moves)
 
     # write the search results to the file in the experiment folder
     experiment_file_path = os.path.join(
@@ -75,6 +137,52 @@ def a_star(filename: str, max_moves: bool = True) -> None:
     generate_results(results, experiment_file_path)
 
 
+def a_star_anytime(
+    filename: str,
+    board: Board,
+    max_moves: bool,
+    weight: float,
+) -> None:
+    """
+    Executes Anytime Repairing A* for at most 3600 seconds for a given Board,
+    writes the search results of every improved solution (number of moves made,
+    solving time, number of expanded states, max size of queue, suboptimality
+    bound) to a CSV file in the data/experiment folder, and exports the best
+    moves to another CSV file in the data/output folder.
+    """
+    print(f'Starting Anytime A-Star for {filename}')
+
+    astar = AStar(board, num_blocking_vehicles)
+    astar.run_anytime(max_moves, max(weight, 1.0), time_budget=3600)
+
+    results = [
+        (num_moves, solving_time, num_expansions, astar.max_queue_size, num_expansions)
+        for num_moves, _, solving_time, num_expansions in astar.solutions
+    ]
+    bounds = [bound for _, bound, _, _ in astar.solutions]
+
+    experiment_path = get_experiment_path()
+    os.makedirs(experiment_path, exist_ok=True)
+
+    export_moves(filename, 'AnytimeAStar', astar.moves)
+
+    experiment_file_path = os.path.join(
+        experiment_path, f'AnytimeAStar_experiment_{filename}'
+    )
+    generate_results(results, experiment_file_path, bounds)
+
+
+def export_moves(filename: str, algorithm: str, moves: list[tuple[str, int]]) -> None:
+    """
+    Exports the moves to a CSV file in the data/output folder.
+    """
+    output_path = get_output_path()
+    os.makedirs(output_path, exist_ok=True)
+
+    export_file_path = os.path.join(output_path, f'{algorithm}_{filename}')
+    write_moves_to_csv(export_file_path, moves)
+
+
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(
                 prog='A-Star script',
@@ -91,10 +199,78 @@ if __name__ == '__main__':
         action='store_false',
         help='Boolean flag to disable max moves',
     )
+    parser.add_argument(
+        '-b',
+        '--backend',
+        choices=BOARD_BACKENDS,
+        default='default',
+        help='Board backend to run the algorithm on',
+    )
+    parser.add_argument(
+        '-nc',
+        '--no-cache',
+        action='store_false',
+        help='Boolean flag to search again instead of using a cached solution',
+    )
+    parser.add_argument(
+        '-w',
+        '--weight',
+        type=float,
+        default=1.0,
+        help='Weight of the heuristic (weighted A*), or the first weight of '
+             'the anytime search (default: 1.0)',
+    )
+    parser.add_argument(
+        '-a',
+        '--anytime',
+        action='store_true',
+        help='Boolean flag to run Anytime Repairing A* once for 3600 seconds, '
+             'does not use the solution cache',
+    )
+    parser.add_argument(
+        '-mp',
+        '--move-pruning',
+        action='store_true',
+        help='Boolean flag to skip moves that only change the order of '
+             'independent moves',
+    )
+    parser.add_argument(
+        '-fi',
+        '--freeze-irrelevant',
+        action='store_true',
+        help='Boolean flag to leave out the vehicles that can never '
+             'influence carter',
+    )
+    parser.add_argument(
+        '-l',
+        '--lazy',
+        action='store_true',
+        help='Boolean flag to only store children as seen when they are '
+             'popped from the queue',
+    )
 
     args = parser.parse_args()
 
     filename = args.filename
     no_max_moves = args.no_max_moves
+    backend = args.backend
 
-    a_star(filename, no_max_moves)
+    cache = args.no_cache
+
+    weight = args.weight
+    anytime = args.anytime
+    move_pruning = args.move_pruning
+    freeze_irrelevant = args.freeze_irrelevant
+    lazy = args.lazy
+
+    a_star(
+        filename,
+        no_max_moves,
+        backend,
+        cache,
+        weight,
+        anytime,
+        move_pruning,
+        freeze_irrelevant,
+        lazy,
+    )
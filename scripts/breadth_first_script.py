@@ -2,7 +2,7 @@ import os
 import time
 import argparse
 
-from code.classes import Board, Game
+from code.classes import BOARD_BACKENDS, Game, SolutionCache
 from code.helpers import (
     get_output_path,
     get_experiment_path,
@@ -21,18 +21,70 @@ def breadth_first(
     filename: str,
     max_moves: bool = True,
     useful_move: bool = False,
+    backend: str = 'default',
+    frontier: bool = False,
+    cache: bool = True,
+    external: bool = False,
+    max_memory: int = 8_000_000,
+    max_disk: int | None = None,
+    move_pruning: bool = False,
+    freeze_irrelevant: bool = False,
 ) -> None:
     """
     Executes the Breadth First Search algorithm several times for a given Board, writes
     the search results (number of moves made, solving time, number of seen states, max
     size of queue) to a CSV file in the data/experiment folder, and exports the moves
     made during the search to another CSV file in the data/output folder.
+
+    If cache == True:
+        - a solution found before with the same parameters is exported without
+          searching again, no experiment results are written
+
+    If external == True:
+        - the layers of the search are stored on disk, with at most max_memory
+          bytes of states in memory and max_disk bytes on disk (see
+          'BreadthFirst.run_external')
+
+    If move_pruning == True:
+        - moves that only change the order of independent moves are not generated
+          (see 'MovePruning')
+
+    If freeze_irrelevant == True:
+        - only the vehicles that can influence carter are searched (see
+          'Board.create_relevant_board'), the others never move
     """
     filename_path = os.path.join(get_gameboards_path(), filename)
 
     board_size = get_board_size_from_file_path(filename)
     data = read_board_state_from_csv(filename_path)
-    board = Game.setup_board(Board(board_size), data)
+    board = Game.setup_board(Game.create_board(board_size, backend), data)
+
+    # leave out the vehicles that can never influence carter
+    if freeze_irrelevant:
+        board = board.create_relevant_board()
+
+    # consult the solution cache before searching
+    solution_cache = SolutionCache.load() if cache else None
+    cache_key = SolutionCache.get_key(
+        board,
+        'BreadthFirst',
+        (),
+        {
+            'max_moves': max_moves,
+            'useful_move': useful_move,
+            'frontier': frontier or external,
+            'move_pruning': move_pruning,
+        },
+    )
+
+    if solution_cache is not None:
+        moves = solution_cache.get(cache_key)
+
+        if moves is not None:
+            print(f'Found cached solution for {filename}, use -nc to search again')
+            export_moves(filename, 'BreadthFirst', moves)
+
+            return
 
     print(f'Starting Breadth First for {filename}')
     start_time = time.time()
@@ -43,7 +95,16 @@ def breadth_first(
     while time.time() - start_time < 3600:
         start_run_time = time.time()
         breadth = BreadthFirst(board)
-        breadth.run(max_moves=max_moves, useful_move=useful_move)
+
+        if external:
+            breadth.run_external(max_memory=max_memory, max_disk=max_disk)
+        else:
+            breadth.run(
+                max_moves=max_moves,
+                useful_move=useful_move,
+                frontier=frontier,
+                move_pruning=move_pruning,
+            )
 
         n_runs += 1
         if n_runs % 10 == 0:
@@ -52,9 +113,9 @@ def breadth_first(
         results.append((
             len(breadth.moves),
             time.time() - start_run_time,
-            len(breadth.seen_states),
+            breadth.num_seen_states,
             breadth.max_queue_size,
-            len(breadth.seen_states)
+            breadth.num_seen_states
         ))
 
     print(
@@ -62,15 +123,20 @@ def breadth_first(
         f'for {n_runs} runs to solve {filename}'
     )
 
-    # get the output and experiment folder paths
-    output_path = get_output_path()
+    # only cache a search that brought carter to the exit
+    if (
+        solution_cache is not None
+        and breadth.solution is not None
+        and Game.is_finished(breadth.solution)
+    ):
+        solution_cache.put(cache_key, breadth.moves)
+
+    # get the experiment folder path
     experiment_path = get_experiment_path()
-    os.makedirs(output_path, exist_ok=True)
     os.makedirs(experiment_path, exist_ok=True)
 
     # write the moves made in the last run to the file in the output folder
-    export_file_path = os.path.join(output_path, f'BreadthFirst_{filename}')
-    write_moves_to_csv(export_file_path, breadth.moves)
+    export_moves(filename, 'BreadthFirst', breadth.moves)
 
     # write the search results to the file in the experiment folder
     experiment_file_path = os.path.join(
@@ -79,6 +145,17 @@ def breadth_first(
     generate_results(results, experiment_file_path)
 
 
+def export_moves(filename: str, algorithm: str, moves: list[tuple[str, int]]) -> None:
+    """
+    Exports the moves to a CSV file in the data/output folder.
+    """
+    output_path = get_output_path()
+    os.makedirs(output_path, exist_ok=True)
+
+    export_file_path = os.path.join(output_path, f'{algorithm}_{filename}')
+    write_moves_to_csv(export_file_path, moves)
+
+
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(
                 prog='Breadth First script',
@@ -102,11 +179,96 @@ if __name__ == '__main__':
         action='store_true',
         help='Boolean flag to enable only useful moves',
     )
+    parser.add_argument(
+        '-b',
+        '--backend',
+        choices=BOARD_BACKENDS,
+        default='default',
+        help='Board backend to run the algorithm on',
+    )
+    parser.add_argument(
+        '-f',
+        '--frontier',
+        action='store_true',
+        help='Boolean flag to only keep the last layers of the search, '
+             'requires -nmm',
+    )
+    parser.add_argument(
+        '-e',
+        '--external',
+        action='store_true',
+        help='Boolean flag to store the layers of the search on disk, '
+             'requires -nmm',
+    )
+    parser.add_argument(
+        '-mm',
+        '--max-memory',
+        type=int,
+        default=8_000_000,
+        help='Number of bytes of states kept in memory by the external '
+             'search, 8 bytes per state (default: 8000000)',
+    )
+    parser.add_argument(
+        '-md',
+        '--max-disk',
+        type=int,
+        default=None,
+        help='Number of bytes the external search may store on disk '
+             '(default: the free space on the disk)',
+    )
+    parser.add_argument(
+        '-mp',
+        '--move-pruning',
+        action='store_true',
+        help='Boolean flag to skip moves that only change the order of '
+             'independent moves, cannot use -f or -e',
+    )
+    parser.add_argument(
+        '-fi',
+        '--freeze-irrelevant',
+        action='store_true',
+        help='Boolean flag to leave out the vehicles that can never '
+             'influence carter',
+    )
+    parser.add_argument(
+        '-nc',
+        '--no-cache',
+        action='store_false',
+        help='Boolean flag to search again instead of using a cached solution',
+    )
 
     args = parser.parse_args()
 
     filename = args.filename
     no_max_moves = args.no_max_moves
     useful_move = args.useful_move
+    backend = args.backend
+
+    cache = args.no_cache
+    frontier = args.frontier
+    external = args.external
+    move_pruning = args.move_pruning
+    freeze_irrelevant = args.freeze_irrelevant
+
+    if frontier and (no_max_moves or useful_move):
+        parser.error('-f/--frontier requires -nmm and cannot use -um')
 
-    breadth_first(filename, no_max_moves, useful_move)
+    if external and (no_max_moves or useful_move):
+        parser.error('-e/--external requires -nmm and cannot use -um')
+
+    if move_pruning and (frontier or external):
+        parser.error('-mp/--move-pruning cannot use -f or -e')
+
+    breadth_first(
+        filename,
+        no_max_moves,
+        useful_move,
+        backend,
+        frontier,
+        cache,
+        external,
+        args.max_memory,
+        args.max_disk,
+        move_pruning,
+        freeze_irrelevant,
+    )
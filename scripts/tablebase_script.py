@@ -0,0 +1,65 @@
+import os
+import time
+import argparse
+
+from code.classes import Game
+from code.helpers import (
+    get_cache_path,
+    get_board_size_from_file_path,
+    get_gameboards_path,
+)
+from code.algorithms import Tablebase
+from code.utils import read_board_state_from_csv
+
+
+def tablebase(filename: str) -> None:
+    """
+    Builds the tablebase of a given Board (the number of moves to the goal of every
+    reachable state), stores it in the data/cache/tablebase folder and prints the state
+    counts next to the bounds from docs/State_space.md.
+
+    A tablebase that is already stored is loaded instead of built again.
+    """
+    filename_path = os.path.join(get_gameboards_path(), filename)
+
+    board_size = get_board_size_from_file_path(filename)
+    data = read_board_state_from_csv(filename_path)
+    board = Game.setup_board(Game.create_board(board_size), data)
+
+    tablebase_path = os.path.join(
+        get_cache_path(), 'tablebase', os.path.splitext(filename)[0]
+    )
+
+    start_time = time.time()
+
+    if os.path.isfile(os.path.join(tablebase_path, 'distances.npy')):
+        print(f'Loading tablebase for {filename}')
+        table = Tablebase.load(board, tablebase_path)
+    else:
+        print(f'Building tablebase for {filename}')
+        table = Tablebase.build(board, verbose=True)
+        table.save(tablebase_path)
+
+    print(f'Tablebase took {time.time() - start_time} seconds')
+
+    for name, count in table.get_counts().items():
+        print(f'{name}: {count}')
+
+    print(f'Shortest solution: {len(table.solve(board))} moves')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+                prog='Tablebase script',
+                description='Builds the tablebase of a gameboard and reports '
+                            'its state counts'
+            )
+
+    parser.add_argument(
+        'filename',
+        help='Filename of the gameboard',
+    )
+
+    args = parser.parse_args()
+
+    tablebase(args.filename)
@@ -0,0 +1,229 @@
+import random
+
+import pytest
+
+from code.algorithms import (
+    AStar,
+    BreadthFirst,
+    num_blocking_vehicles,
+    num_two_blocking_vehicles,
+)
+from code.classes import BOARD_BACKENDS, Game, Mover
+from code.helpers import get_gameboard_file_paths
+
+
+@pytest.mark.parametrize('backend', BOARD_BACKENDS)
+@pytest.mark.parametrize('file_path', get_gameboard_file_paths()[:4])
+@pytest.mark.parametrize(
+    'heuristic',
+    [num_blocking_vehicles, num_two_blocking_vehicles],
+)
+def test_incremental_heuristic(heuristic, file_path, backend):
+    """
+    Test if the incremental form of a heuristic gives the same value as the
+    heuristic itself for every child along a random walk, and leaves the
+    board in the child state.
+    """
+    rng = random.Random(0)
+    game = Game.load_game_from_csv(file_path, backend)
+    board = game.board
+    mover = Mover(board)
+    value = heuristic(board)
+
+    for _ in range(200):
+        moves = mover.get_all_available_moves()
+
+        for move in mover.iter_children(moves):
+            state_key = board.get_state_key()
+
+            assert heuristic.update(board, move, value) == heuristic(board)
+            assert board.get_state_key() == state_key
+
+        move = rng.choice(moves)
+        mover.apply_move(move)
+        value = heuristic.update(board, move, value)
+
+        assert value == heuristic(board)
+
+
+@pytest.mark.parametrize('file_path', get_gameboard_file_paths()[:3])
+def test_incremental_a_star(file_path):
+    """
+    Test if AStar finds the same solution with and without the incremental
+    form of the heuristic, and only calls the heuristic itself for the
+    initial state.
+    """
+    game = Game.load_game_from_csv(file_path)
+
+    def full_heuristic(state):
+        return num_two_blocking_vehicles(state)
+
+    astar = AStar(game.board.copy(), full_heuristic)
+    astar.run()
+
+    calls = []
+
+    def heuristic(state):
+        calls.append(state)
+
+        return num_two_blocking_vehicles(state)
+
+    heuristic.update = num_two_blocking_vehicles.update
+
+    incremental = AStar(game.board.copy(), heuristic)
+    incremental.run()
+
+    assert len(calls) == 1
+    assert incremental.moves == astar.moves
+    assert game.is_valid_solution(incremental.moves)
+
+
+@pytest.mark.parametrize('weight', [1.0, 2.0, 5.0])
+def test_weighted(weight):
+    """
+    Test if weighted A* finds a valid solution.
+    """
+    game = Game.load_game_from_csv(get_gameboard_file_paths()[0])
+
+    astar = AStar(game.board.copy(), num_blocking_vehicles, weight)
+    astar.run()
+
+    assert game.is_valid_solution(astar.moves)
+
+
+@pytest.mark.parametrize('file_path', get_gameboard_file_paths()[:3])
+def test_run_anytime(file_path):
+    """
+    Test if the anytime search improves its solutions until it proves that
+    the last one is as short as the Breadth First Search.
+    """
+    game = Game.load_game_from_csv(file_path)
+
+    breadth = BreadthFirst(game.board.copy())
+    breadth.run(max_moves=False)
+
+    astar = AStar(game.board.copy(), num_blocking_vehicles)
+    astar.run_anytime(weight=3.0)
+
+    num_moves = [num_moves for num_moves, _, _, _ in astar.solutions]
+    bounds = [bound for _, bound, _, _ in astar.solutions]
+
+    assert num_moves == sorted(num_moves, reverse=True)
+    assert bounds == sorted(bounds, reverse=True)
+    assert all(bound >= num / len(breadth.moves) for num, bound in zip(num_moves, bounds))
+    assert astar.bound == 1.0
+    assert len(astar.moves) == len(breadth.moves)
+    assert game.is_valid_solution(astar.moves)
+
+
+def test_run_anytime_budget():
+    """
+    Test if the anytime search stops when its budget runs out and keeps the
+    best solution found so far.
+    """
+    game = Game.load_game_from_csv(get_gameboard_file_paths()[2])
+
+    astar = AStar(game.board.copy(), num_blocking_vehicles)
+    astar.run_anytime(weight=3.0, max_expansions=7000)
+
+    assert astar.num_expansions <= 7000
+    assert astar.bound > 1.0
+    assert len(astar.moves) == astar.solutions[-1][0]
+    assert game.is_valid_solution(astar.moves)
+
+    game.reset()
+    astar = AStar(game.board.copy(), num_blocking_vehicles)
+    astar.run_anytime(max_expansions=10)
+
+    assert astar.solution is None
+    assert astar.solutions == []
+
+
+@pytest.mark.parametrize('file_path', get_gameboard_file_paths()[:3])
+def test_run_deterministic(file_path):
+    """
+    Test if AStar expands the same states and finds the same solution every
+    run, without a random tie-breaker.
+    """
+    game = Game.load_game_from_csv(file_path)
+
+    astar = AStar(game.board.copy(), num_blocking_vehicles)
+    astar.run()
+
+    other = AStar(game.board.copy(), num_blocking_vehicles)
+    other.run()
+
+    assert other.moves == astar.moves
+    assert len(other.seen_states) == len(astar.seen_states)
+
+
+@pytest.mark.parametrize('max_moves', [False, True])
+@pytest.mark.parametrize('file_path', get_gameboard_file_paths()[:3])
+def test_run_lazy(file_path, max_moves):
+    """
+    Test if the lazy mode finds a solution as short as the eager mode, and
+    only calls the heuristic itself for the initial state.
+    """
+    game = Game.load_game_from_csv(file_path)
+
+    astar = AStar(game.board.copy(), num_blocking_vehicles)
+    astar.run(max_moves)
+
+    calls = []
+
+    def heuristic(state):
+        calls.append(state)
+
+        return num_blocking_vehicles(state)
+
+    heuristic.update = num_blocking_vehicles.update
+
+    lazy = AStar(game.board.copy(), heuristic)
+    lazy.run(max_moves, lazy=True)
+
+    assert len(calls) == 1
+    assert len(lazy.moves) == len(astar.moves)
+    assert game.is_valid_solution(lazy.moves)
+
+
+@pytest.mark.parametrize('file_path', get_gameboard_file_paths()[:2])
+def test_run_lazy_pop_order(file_path):
+    """
+    Test if the lazy mode expands every state with the score the eager mode
+    gives it, also with a heuristic that can drop by more than one per move,
+    and expands the states both modes expand at the same depth.
+    """
+    game = Game.load_game_from_csv(file_path)
+    expansions = {}
+
+    class RecordingAStar(AStar):
+        def build_children(self, next_state, depth, state_key, *args):
+            value = num_two_blocking_vehicles(next_state)
+
+            assert args[-1] == value
+            assert self.score == depth + value
+
+            self.expanded.setdefault(state_key, (self.score, depth))
+            super().build_children(next_state, depth, state_key, *args)
+
+    for lazy in (False, True):
+        astar = RecordingAStar(game.board.copy(), num_two_blocking_vehicles)
+        astar.expanded = {}
+        pop = astar.queue.pop
+
+        def pop_recording(astar=astar, pop=pop):
+            astar.score, depth, entry = pop()
+
+            return astar.score, depth, entry
+
+        astar.queue.pop = pop_recording
+        astar.run(lazy=lazy)
+        expansions[lazy] = astar
+
+    eager, lazy = expansions[False], expansions[True]
+    common = eager.expanded.keys() & lazy.expanded.keys()
+
+    assert len(common) >= 0.9 * len(eager.expanded)
+    assert all(eager.expanded[key] == lazy.expanded[key] for key in common)
+    assert len(lazy.moves) == len(eager.moves)
+    assert game.is_valid_solution(lazy.moves)
@@ -0,0 +1,93 @@
+import pytest
+
+from code.algorithms import BeamSearch, BreadthFirst, num_blocking_vehicles
+from code.classes import Game
+from code.helpers import get_gameboard_file_paths
+from code.utils import read_moves_from_csv, write_moves_to_csv
+
+
+@pytest.fixture
+def game():
+    """
+    Fixture for loading the third gameboard.
+    """
+    return Game.load_game_from_csv(get_gameboard_file_paths()[2])
+
+
+@pytest.mark.parametrize('max_moves', [False, True])
+@pytest.mark.parametrize('width', [100, 1000])
+def test_run(game, width, max_moves):
+    """
+    Test if the beam search finds a valid solution, which is never shorter
+    than the Breadth First Search.
+    """
+    breadth = BreadthFirst(game.board.copy())
+    breadth.run(max_moves=False)
+
+    beam_search = BeamSearch(game.board, num_blocking_vehicles, width)
+    beam_search.run(max_moves)
+
+    assert len(beam_search.moves) >= len(breadth.moves)
+    assert game.is_valid_solution(beam_search.moves)
+
+
+def test_memory_bound(game):
+    """
+    Test if no more than 'width' states are kept per layer.
+    """
+    beam_search = BeamSearch(game.board, num_blocking_vehicles, 5)
+    beam_search.run(max_depth=20)
+
+    assert beam_search.num_seen_states <= 5 * 20
+
+
+@pytest.mark.parametrize('width', [10, 1000])
+def test_seen_memory(game, width):
+    """
+    Test if the seen filter takes at most 32 bytes per kept state, instead of
+    a Python int per state.
+    """
+    beam_search = BeamSearch(game.board, num_blocking_vehicles, width)
+    beam_search.run(max_depth=20)
+
+    assert len(beam_search.seen) == beam_search.num_seen_states + 1
+    assert beam_search.seen.get_memory() <= max(32 * len(beam_search.seen), 8 * 16)
+
+
+def test_max_depth(game):
+    """
+    Test if no solution is found when the search stops before the solution.
+    """
+    beam_search = BeamSearch(game.board, num_blocking_vehicles, 1000)
+    beam_search.run(max_depth=10)
+
+    assert beam_search.solution is None
+    assert beam_search.moves == []
+
+
+def test_write_moves(game, tmp_path):
+    """
+    Test if the moves can be written to and read from a CSV file.
+    """
+    beam_search = BeamSearch(game.board, num_blocking_vehicles, 100)
+    beam_search.run()
+
+    file_path = str(tmp_path / 'moves.csv')
+    write_moves_to_csv(file_path, beam_search.moves)
+
+    assert read_moves_from_csv(file_path) == beam_search.moves
+
+
+def test_run_parallel(game):
+    """
+    Test if the parallel beam searches keep a valid solution, also when some
+    of the beams are too narrow to find one.
+    """
+    widths = [1, 100, 1000]
+
+    beam_search = BeamSearch(game.board, num_blocking_vehicles)
+    beam_search.run_parallel(widths, processes=2)
+
+    assert beam_search.width in widths
+    assert beam_search.moves
+    assert game.is_valid_solution(beam_search.moves)
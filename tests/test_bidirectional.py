@@ -0,0 +1,118 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from code.algorithms import (
+    Bidirectional,
+    BreadthFirst,
+    is_goal_state,
+    iter_goal_state_keys,
+)
+from code.classes import Board, CARTER_NAME, Game, Orientation
+from code.helpers import get_gameboard_file_paths
+
+
+@pytest.fixture
+def board():
+    """
+    Fixture for creating a small board with a truck in the lane of carter.
+    """
+    return Game.setup_board(
+        Board(6),
+        [
+            ('A', Orientation.VERTICAL, 3, 1, 2),
+            ('B', Orientation.HORIZONTAL, 2, 0, 2),
+            ('C', Orientation.VERTICAL, 5, 3, 3),
+            ('D', Orientation.HORIZONTAL, 0, 0, 2),
+            (CARTER_NAME, Orientation.HORIZONTAL, 0, 2, 2),
+        ],
+    )
+
+
+def brute_force_goal_state_keys(board):
+    """
+    Finds the goal states by trying every combination of offsets.
+    """
+    layout = board.get_key_layout()
+    keys = set()
+
+    for relative_offsets in itertools.product(
+        *(range(radix) for _, _, radix, _ in layout)
+    ):
+        key = sum(
+            offset * weight
+            for offset, (_, _, _, weight) in zip(relative_offsets, layout)
+        )
+        goal_board = board.create_from_state_key(key)
+        occupied = np.zeros((board.size, board.size), dtype=int)
+
+        for vehicle in goal_board.vehicles.values():
+            for col, row in vehicle.location:
+                occupied[row, col] += 1
+
+        lanes_in_order = all(
+            (vehicle.offset < other.offset)
+            == (board.vehicles[vehicle.name].offset < board.vehicles[other.name].offset)
+            for vehicle in goal_board.vehicles.values()
+            for other in goal_board.vehicles.values()
+            if vehicle is not other
+            and vehicle.orientation == other.orientation
+            and vehicle.lane == other.lane
+        )
+
+        if occupied.max() == 1 and lanes_in_order and is_goal_state(goal_board):
+            keys.add(key)
+
+    return keys
+
+
+def test_iter_goal_state_keys(board):
+    """
+    Test if all goal states are enumerated exactly once.
+    """
+    keys = list(iter_goal_state_keys(board))
+
+    assert len(keys) == len(set(keys))
+    assert set(keys) == brute_force_goal_state_keys(board)
+
+
+def test_iter_goal_state_keys_blocked_carter():
+    """
+    Test if there are no goal states when a vehicle in front of carter can
+    never leave its lane.
+    """
+    board = Game.setup_board(
+        Board(6),
+        [
+            (CARTER_NAME, Orientation.HORIZONTAL, 0, 2, 2),
+            ('A', Orientation.HORIZONTAL, 3, 2, 2),
+        ],
+    )
+
+    assert list(iter_goal_state_keys(board)) == []
+
+    bidirectional = Bidirectional(board)
+    bidirectional.run()
+
+    assert bidirectional.solution is None
+    assert bidirectional.moves == []
+
+
+@pytest.mark.parametrize('file_path', get_gameboard_file_paths()[:3])
+def test_run(file_path):
+    """
+    Test if the bidirectional search finds a valid solution as short as the
+    Breadth First Search.
+    """
+    game = Game.load_game_from_csv(file_path)
+
+    breadth = BreadthFirst(game.board.copy())
+    breadth.run()
+
+    bidirectional = Bidirectional(game.board.copy())
+    bidirectional.run()
+
+    assert len(bidirectional.moves) == len(breadth.moves)
+    assert is_goal_state(bidirectional.solution)
+    assert game.is_valid_solution(bidirectional.moves)
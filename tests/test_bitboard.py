@@ -0,0 +1,149 @@
+import random
+
+import pytest
+
+from code.classes import (
+    BitBoard,
+    CARTER_NAME,
+    Direction,
+    Game,
+    Mover,
+    Orientation,
+    SetupBoardUnknownBackendError,
+    Vehicle,
+)
+from code.helpers import get_gameboard_file_paths
+from code.utils import read_board_state_from_csv
+
+
+@pytest.fixture(params=[6, 9, 12])
+def board(request):
+    """
+    Fixture for creating different sized bitboards.
+    """
+    return BitBoard(request.param)
+
+
+@pytest.fixture
+def valid_vehicles():
+    """
+    Fixture for creating a list of valid test vehicles.
+    """
+    return [
+        Vehicle('A', Orientation.HORIZONTAL, 0, 0, 2),
+        Vehicle('B', Orientation.VERTICAL, 2, 2, 3),
+        Vehicle(CARTER_NAME, Orientation.HORIZONTAL, 3, 5, 2),
+    ]
+
+
+def test_bitboard_masks_initialization(board):
+    """
+    Test if the masks of an empty bitboard are all zero.
+    """
+    assert board.row_masks == [0] * board.size
+    assert board.col_masks == [0] * board.size
+
+
+def test_bitboard_masks_add_vehicle(board, valid_vehicles):
+    """
+    Test if adding vehicles sets the correct bits.
+    """
+    for vehicle in valid_vehicles:
+        board.add_vehicle(vehicle)
+
+    assert board.row_masks[0] == 0b11
+    assert board.row_masks[5] == 0b11000
+    assert board.col_masks[2] == 0b11100
+
+    for row in range(board.size):
+        for col in range(board.size):
+            occupied = bool(board.row_masks[row] & (1 << col))
+
+            assert occupied == bool(board.locations[row, col])
+            assert occupied == bool(board.col_masks[col] & (1 << row))
+
+
+def test_bitboard_masks_move_vehicle(board, valid_vehicles):
+    """
+    Test if moving a vehicle clears the old bits and sets the new bits.
+    """
+    for vehicle in valid_vehicles:
+        board.add_vehicle(vehicle)
+
+    mover = Mover(board)
+    mover.move_vehicle(('A', 3))
+    mover.move_vehicle(('B', -2))
+
+    assert board.row_masks[0] == 0b11100
+    assert board.col_masks[2] == 0b111
+
+
+def test_bitboard_masks_set_state_key(board, valid_vehicles):
+    """
+    Test if setting a state key rebuilds the masks.
+    """
+    for vehicle in valid_vehicles:
+        board.add_vehicle(vehicle)
+
+    key = board.get_state_key()
+    row_masks = list(board.row_masks)
+    col_masks = list(board.col_masks)
+
+    Mover(board).move_vehicle(('A', 3))
+    board.set_state_key(key)
+
+    assert board.row_masks == row_masks
+    assert board.col_masks == col_masks
+
+
+@pytest.mark.parametrize('file_path', get_gameboard_file_paths())
+def test_bitboard_max_steps_match_board(file_path):
+    """
+    Test if the bitboard calculates the same moves as the default board
+    during a random walk over the gameboards.
+    """
+    random.seed(0)
+
+    game = Game.load_game_from_csv(file_path)
+    bit_game = Game.load_game_from_csv(file_path, 'bitboard')
+
+    assert isinstance(bit_game.board, BitBoard)
+
+    for _ in range(200):
+        for vehicle_name in game.board.vehicles:
+            for direction in Direction:
+                assert (
+                    game.mover.get_vehicle_max_steps(vehicle_name, direction)
+                    == bit_game.mover.get_vehicle_max_steps(
+                        vehicle_name,
+                        direction,
+                    )
+                )
+
+        move = random.choice(game.get_all_available_moves())
+
+        game.make_move(move)
+        bit_game.make_move(move)
+
+
+def test_create_board_unknown_backend():
+    """
+    Test creating a board with an unknown backend raises an error.
+    """
+    with pytest.raises(SetupBoardUnknownBackendError) as exc:
+        Game.create_board(6, 'unknown')
+
+    assert "'unknown': unknown board backend" in str(exc.value)
+
+
+def test_reset_keeps_backend():
+    """
+    Test the backend is kept when resetting the game.
+    """
+    file_path = get_gameboard_file_paths()[0]
+    data = read_board_state_from_csv(file_path)
+
+    game = Game(data, 6, 'bitboard')
+    game.reset()
+
+    assert isinstance(game.board, BitBoard)
@@ -7,7 +7,9 @@ from code.classes import (
     BoardPlacementOccupiedError,
     BoardVehicleNameExistError,
     BoardVehicleCarterOrientationError,
+    BOARD_BACKENDS,
     CARTER_NAME,
+    Game,
     Orientation,
     Vehicle,
 )
@@ -343,3 +345,261 @@ def test_update_state_new(board, valid_vehicles):
         board.locations[start_row, new_col:new_col + length]
     ) == valid_vehicles[0].name
 
+
+
+def test_get_state_key(board, valid_vehicles):
+    """
+    Test if the state key changes when a vehicle moves and is restored when
+    the vehicle moves back.
+    """
+    for vehicle in valid_vehicles:
+        board.add_vehicle(vehicle)
+
+    key = board.get_state_key()
+
+    assert isinstance(key, int)
+
+    valid_vehicles[1].update_location(2, 3)
+    board.update_state(valid_vehicles[1])
+
+    assert board.get_state_key() != key
+
+    valid_vehicles[1].update_location(2, 2)
+    board.update_state(valid_vehicles[1])
+
+    assert board.get_state_key() == key
+
+
+def test_get_key_layout_lanes(board):
+    """
+    Test if vehicles sharing a lane get a lowest offset and radix based on
+    the other vehicles in that lane.
+    """
+    board.add_vehicle(Vehicle('A', Orientation.HORIZONTAL, 0, 0, 2))
+    board.add_vehicle(Vehicle('B', Orientation.HORIZONTAL, 3, 0, 3))
+    board.add_vehicle(Vehicle('C', Orientation.VERTICAL, 0, 1, 2))
+
+    layout = {name: values for name, *values in board.get_key_layout()}
+
+    assert layout['A'][:2] == [0, board.size - 4]
+    assert layout['B'][:2] == [2, board.size - 4]
+    assert layout['C'][:2] == [0, board.size - 1]
+
+
+def test_set_state_key(board, valid_vehicles):
+    """
+    Test if setting a state key places the vehicles back on the board.
+    """
+    for vehicle in valid_vehicles:
+        board.add_vehicle(vehicle)
+
+    key = board.get_state_key()
+    locations = board.locations.copy()
+
+    valid_vehicles[0].update_location(3, 0)
+    board.update_state(valid_vehicles[0])
+
+    board.set_state_key(key)
+
+    assert board.get_state_key() == key
+    assert np.array_equal(board.locations, locations)
+    assert valid_vehicles[0].location == [(0, 0), (1, 0)]
+
+
+def test_create_from_state_key(board, valid_vehicles):
+    """
+    Test if a new board is created from a state key without changing the
+    original board.
+    """
+    for vehicle in valid_vehicles:
+        board.add_vehicle(vehicle)
+
+    key = board.get_state_key()
+
+    valid_vehicles[2].update_location(0, 5)
+    board.update_state(valid_vehicles[2])
+
+    new_board = board.create_from_state_key(key)
+
+    assert new_board is not board
+    assert new_board.get_state_key() == key
+    assert new_board.vehicles[CARTER_NAME].location == [(3, 5), (4, 5)]
+    assert board.vehicles[CARTER_NAME].location == [(0, 5), (1, 5)]
+
+
+def test_shift_vehicle(board, valid_vehicles):
+    """
+    Test if shifting a vehicle only moves the vehicle itself.
+    """
+    for vehicle in valid_vehicles:
+        board.add_vehicle(vehicle)
+
+    board.shift_vehicle(valid_vehicles[1], 1)
+
+    assert valid_vehicles[1].location == [(2, 3), (2, 4), (2, 5)]
+    assert board.locations[2, 2] == 0
+    assert np.all(board.locations[3:6, 2] == valid_vehicles[1].name)
+    assert np.all(board.locations[0, 0:2] == valid_vehicles[0].name)
+
+
+def test_copy(board, valid_vehicles):
+    """
+    Test if a copied board can be changed without changing the original.
+    """
+    for vehicle in valid_vehicles:
+        board.add_vehicle(vehicle)
+
+    key = board.get_state_key()
+    board_copy = board.copy()
+
+    board_copy.shift_vehicle(board_copy.vehicles['A'], 1)
+
+    assert board.get_state_key() == key
+    assert board_copy.get_state_key() != key
+    assert board.vehicles['A'].location == [(0, 0), (1, 0)]
+    assert board.locations[0, 0] == 'A'
+    assert board_copy.locations[0, 0] == 0
+    assert board_copy.key_layout is board.key_layout
+
+
+def test_state_key_updated_by_shift_vehicle(board, valid_vehicles):
+    """
+    Test if the cached state key is updated by moves and matches a freshly
+    calculated key.
+    """
+    for vehicle in valid_vehicles:
+        board.add_vehicle(vehicle)
+
+    board.get_state_key()
+    board.shift_vehicle(board.vehicles['A'], 2)
+    board.shift_vehicle(board.vehicles['B'], -1)
+
+    key = board.get_state_key()
+    board.cached_state_key = None
+
+    assert board.get_state_key() == key
+
+
+def test_zobrist_hash_disabled(board, valid_vehicles):
+    """
+    Test if boards have no Zobrist hash unless it is enabled.
+    """
+    for vehicle in valid_vehicles:
+        board.add_vehicle(vehicle)
+
+    assert board.zobrist_hash is None
+
+
+def test_zobrist_hash(board, valid_vehicles):
+    """
+    Test if the Zobrist hash is updated by moves, restored by undoing them and
+    the same for boards set up with the same seed.
+    """
+    for vehicle in valid_vehicles:
+        board.add_vehicle(vehicle)
+
+    board.enable_zobrist(seed=1)
+    zobrist_hash = board.zobrist_hash
+
+    board.shift_vehicle(board.vehicles['A'], 2)
+    moved_hash = board.zobrist_hash
+
+    board.cached_zobrist_hash = None
+
+    assert board.zobrist_hash == moved_hash != zobrist_hash
+
+    board.shift_vehicle(board.vehicles['A'], -2)
+
+    assert board.zobrist_hash == zobrist_hash
+
+    other_board = Board(board.size)
+
+    for vehicle in valid_vehicles:
+        other_board.add_vehicle(
+            Vehicle(
+                vehicle.name,
+                vehicle.orientation,
+                *vehicle.back,
+                vehicle.length,
+            )
+        )
+
+    other_board.enable_zobrist(seed=1)
+
+    assert other_board.zobrist_hash == zobrist_hash
+
+
+def test_zobrist_hash_copy(board, valid_vehicles):
+    """
+    Test if copies share the Zobrist keys but keep their own hash.
+    """
+    for vehicle in valid_vehicles:
+        board.add_vehicle(vehicle)
+
+    board.enable_zobrist()
+    zobrist_hash = board.zobrist_hash
+    board_copy = board.copy()
+
+    board_copy.shift_vehicle(board_copy.vehicles['A'], 1)
+
+    assert board_copy.zobrist_keys is board.zobrist_keys
+    assert board.zobrist_hash == zobrist_hash
+    assert board_copy.zobrist_hash != zobrist_hash
+
+
+@pytest.fixture
+def irrelevant_vehicle_data():
+    """
+    Fixture with game data where carter is blocked by A, which is blocked by B.
+    D is stacked below C in the first column, so D can never move and never
+    cross a lane of the other vehicles.
+    """
+    return [
+        (CARTER_NAME, Orientation.HORIZONTAL, 1, 2, 2),
+        ('A', Orientation.VERTICAL, 4, 1, 2),
+        ('B', Orientation.HORIZONTAL, 2, 0, 2),
+        ('C', Orientation.VERTICAL, 0, 0, 3),
+        ('D', Orientation.VERTICAL, 0, 3, 3),
+    ]
+
+
+def test_get_lane_squares(irrelevant_vehicle_data):
+    """
+    Test if the lane of a vehicle ends at the vehicles in the same lane.
+    """
+    board = Game(irrelevant_vehicle_data, 6).board
+    lane_squares = board.get_lane_squares()
+
+    assert lane_squares[CARTER_NAME] == {(col, 2) for col in range(6)}
+    assert lane_squares['C'] == {(0, 0), (0, 1), (0, 2)}
+    assert lane_squares['D'] == {(0, 3), (0, 4), (0, 5)}
+
+
+def test_get_dependency_closure(irrelevant_vehicle_data):
+    """
+    Test if the closure holds the vehicles whose lanes cross the lanes of
+    carter, directly or through other vehicles.
+    """
+    board = Game(irrelevant_vehicle_data, 6).board
+
+    assert board.get_dependency_closure() == {CARTER_NAME, 'A', 'B', 'C'}
+
+
+@pytest.mark.parametrize('backend', BOARD_BACKENDS)
+def test_create_relevant_board(irrelevant_vehicle_data, backend):
+    """
+    Test if the relevant board has the same type and only the vehicles of
+    the closure on their current positions.
+    """
+    board = Game(irrelevant_vehicle_data, 6, backend).board
+    board.enable_zobrist(seed=1)
+
+    relevant_board = board.create_relevant_board()
+
+    assert type(relevant_board) is type(board)
+    assert list(relevant_board.vehicles) == [CARTER_NAME, 'A', 'B', 'C']
+    assert relevant_board.zobrist_hash is not None
+    assert np.count_nonzero(relevant_board.locations != 0) == 9
+
+    for name, vehicle in relevant_board.vehicles.items():
+        assert vehicle.location == board.vehicles[name].location
@@ -0,0 +1,156 @@
+import copy
+from array import array
+
+import pytest
+
+from code.algorithms import BreadthFirst
+from code.algorithms.breadth_first import (
+    BreadthFirstDiskBudgetError,
+    BreadthFirstFrontierError,
+)
+from code.classes import Game, Mover
+from code.helpers import get_gameboard_file_paths
+
+
+@pytest.mark.parametrize('backend', ['default', 'bitboard'])
+@pytest.mark.parametrize('file_path', get_gameboard_file_paths()[:2])
+def test_run_frontier(file_path, backend):
+    """
+    Test if the frontier mode finds a valid solution as short as the regular
+    Breadth First Search.
+    """
+    game = Game.load_game_from_csv(file_path, backend)
+
+    breadth = BreadthFirst(game.board.copy())
+    breadth.run()
+
+    frontier = BreadthFirst(game.board.copy())
+    frontier.run(frontier=True)
+
+    assert len(frontier.moves) == len(breadth.moves)
+    assert game.is_valid_solution(frontier.moves)
+    assert Game.is_finished(frontier.solution)
+    assert len(frontier.seen_states) == 0
+    assert frontier.num_seen_states > 0
+
+
+def test_run_frontier_finish():
+    """
+    Test if the frontier mode finds the shortest way to a given layout.
+    """
+    game = Game.load_game_from_csv(get_gameboard_file_paths()[0])
+    board = game.board.copy()
+    mover = Mover(board)
+
+    for _ in range(3):
+        mover.move_vehicle(mover.get_all_available_moves()[-1])
+
+    finish = copy.deepcopy(board.locations)
+
+    frontier = BreadthFirst(game.board.copy())
+    frontier.run(finish, frontier=True)
+
+    assert len(frontier.moves) <= 3
+    assert (frontier.solution.locations == finish).all()
+
+
+@pytest.mark.parametrize(
+    'max_moves, useful_move',
+    [(True, False), (False, True)],
+)
+def test_run_frontier_irreversible_moves_error(max_moves, useful_move):
+    """
+    Test if the frontier mode refuses move filters that are not reversible.
+    """
+    game = Game.load_game_from_csv(get_gameboard_file_paths()[0])
+    breadth = BreadthFirst(game.board)
+
+    with pytest.raises(BreadthFirstFrontierError):
+        breadth.run(
+            max_moves=max_moves,
+            useful_move=useful_move,
+            frontier=True,
+        )
+
+
+@pytest.mark.parametrize('max_memory', [800, 8_000_000])
+@pytest.mark.parametrize('file_path', get_gameboard_file_paths()[:3])
+def test_run_external(file_path, max_memory, tmp_path):
+    """
+    Test if the external mode finds a valid solution as short as the frontier
+    mode, also when the layers are written to disk in several runs.
+    """
+    game = Game.load_game_from_csv(file_path)
+
+    frontier = BreadthFirst(game.board.copy())
+    frontier.run(frontier=True)
+
+    external = BreadthFirst(game.board.copy())
+    external.run_external(directory=str(tmp_path), max_memory=max_memory)
+
+    assert len(external.moves) == len(frontier.moves)
+    assert external.num_seen_states == frontier.num_seen_states
+    assert game.is_valid_solution(external.moves)
+
+    # only the layers are left on disk, the runs are removed after merging
+    assert len(list(tmp_path.iterdir())) == len(external.moves) - 1
+
+
+def test_run_external_finish():
+    """
+    Test if the external mode finds the shortest way to a given layout.
+    """
+    game = Game.load_game_from_csv(get_gameboard_file_paths()[0])
+    board = game.board.copy()
+    mover = Mover(board)
+
+    for _ in range(3):
+        mover.move_vehicle(mover.get_all_available_moves()[-1])
+
+    finish = copy.deepcopy(board.locations)
+
+    external = BreadthFirst(game.board.copy())
+    external.run(finish, external=True)
+
+    assert len(external.moves) <= 3
+    assert (external.solution.locations == finish).all()
+
+
+def test_run_external_disk_budget_error(tmp_path):
+    """
+    Test if the external mode stops when the layers do not fit in the disk
+    budget.
+    """
+    game = Game.load_game_from_csv(get_gameboard_file_paths()[0])
+    breadth = BreadthFirst(game.board)
+
+    with pytest.raises(BreadthFirstDiskBudgetError):
+        breadth.run_external(directory=str(tmp_path), max_disk=1000)
+
+
+@pytest.mark.parametrize('num_words', [1, 2])
+def test_write_run(num_words, tmp_path):
+    """
+    Test if the packed children are written sorted and without duplicates,
+    also when a state key takes two words.
+    """
+    key_size = 8 * num_words
+    keys = [5, 1 << (8 * key_size - 1), 3, 5, (1 << (8 * key_size)) - 1, 3]
+    children = array('Q')
+
+    for key in keys:
+        children.extend(
+            key >> (64 * i) & ((1 << 64) - 1)
+            for i in reversed(range(num_words))
+        )
+
+    run = BreadthFirst.write_run(
+        str(tmp_path), key_size, 1, 0, children, num_words, 0, 1000
+    )
+
+    assert list(run) == sorted(set(keys))
+
+    with pytest.raises(BreadthFirstDiskBudgetError):
+        BreadthFirst.write_run(
+            str(tmp_path), key_size, 1, 1, children, num_words, 0, 10
+        )
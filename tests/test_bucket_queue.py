@@ -0,0 +1,54 @@
+from code.classes import BucketQueue
+
+
+def test_pop_order():
+    """
+    Test if the items are popped by lowest score, then largest depth, then
+    last pushed.
+    """
+    queue = BucketQueue()
+
+    queue.push(5, 1, 'a')
+    queue.push(3, 0, 'b')
+    queue.push(5, 3, 'c')
+    queue.push(3, 2, 'd')
+    queue.push(5, 3, 'e')
+    queue.push(4.5, 2, 'f')
+
+    assert len(queue) == 6
+    assert [queue.pop() for _ in range(6)] == [
+        (3, 2, 'd'),
+        (3, 0, 'b'),
+        (4.5, 2, 'f'),
+        (5, 3, 'e'),
+        (5, 3, 'c'),
+        (5, 1, 'a'),
+    ]
+    assert not queue
+
+
+def test_push_while_popping():
+    """
+    Test if items pushed between pops, also with a lower score or a larger
+    depth than the items left, are popped in order.
+    """
+    queue = BucketQueue()
+
+    queue.push(4, 1, 'a')
+    queue.push(4, 2, 'b')
+
+    assert queue.pop() == (4, 2, 'b')
+
+    queue.push(4, 3, 'c')
+    queue.push(2, 0, 'd')
+
+    assert queue.pop() == (2, 0, 'd')
+    assert queue.pop() == (4, 3, 'c')
+
+    queue.push(4, 0, 'e')
+
+    assert queue.pop() == (4, 1, 'a')
+    assert queue.pop() == (4, 0, 'e')
+    assert len(queue) == 0
+    assert queue.buckets == {}
+    assert queue.scores == []
@@ -0,0 +1,171 @@
+import os
+import random
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from code.algorithms import num_blocking_vehicles, num_two_blocking_vehicles
+from code.classes import (
+    CARTER_NAME,
+    CompactBoard,
+    Game,
+    Mover,
+    Orientation,
+    Plotter,
+    Vehicle,
+)
+from code.helpers import get_gameboard_file_paths
+from code.utils import read_board_state_from_csv
+
+
+@pytest.fixture(params=[6, 9, 12])
+def board(request):
+    """
+    Fixture for creating different sized compact boards.
+    """
+    return CompactBoard(request.param)
+
+
+@pytest.fixture
+def valid_vehicles():
+    """
+    Fixture for creating a list of valid test vehicles.
+    """
+    return [
+        Vehicle('A', Orientation.HORIZONTAL, 0, 0, 2),
+        Vehicle('B', Orientation.VERTICAL, 2, 2, 3),
+        Vehicle(CARTER_NAME, Orientation.HORIZONTAL, 3, 5, 2),
+    ]
+
+
+def test_compact_board_locations(board):
+    """
+    Test if the layout is an empty uint8 grid.
+    """
+    assert board.locations.dtype == np.uint8
+    assert board.locations.shape == (board.size, board.size)
+    assert board.locations.sum() == 0
+    assert board.vehicle_names == ['']
+
+
+def test_compact_board_add_vehicle(board, valid_vehicles):
+    """
+    Test if vehicles are stored as indices into the side table.
+    """
+    for vehicle in valid_vehicles:
+        board.add_vehicle(vehicle)
+
+    assert board.vehicle_names == ['', 'A', 'B', CARTER_NAME]
+    assert board.vehicle_indices == {'A': 1, 'B': 2, CARTER_NAME: 3}
+    assert np.all(board.locations[0, 0:2] == 1)
+    assert np.all(board.locations[2:5, 2] == 2)
+    assert board.get_vehicle_name(board.locations[5, 3]) == CARTER_NAME
+
+
+def test_compact_board_names_layout(board, valid_vehicles):
+    """
+    Test if the names layout matches the layout of the regular Board.
+    """
+    for vehicle in valid_vehicles:
+        board.add_vehicle(vehicle)
+
+    names = board.get_names_layout()
+
+    assert names[0, 0] == 'A'
+    assert names[4, 2] == 'B'
+    assert names[1, 1] == 0
+
+
+def test_compact_board_update_state(board, valid_vehicles):
+    """
+    Test if moving a vehicle only changes its own indices.
+    """
+    for vehicle in valid_vehicles:
+        board.add_vehicle(vehicle)
+
+    Mover(board).move_vehicle(('A', 2))
+
+    valid_vehicles[1].update_location(2, 1)
+    board.update_state(valid_vehicles[1])
+
+    assert np.all(board.locations[0, 0:4] == [0, 0, 1, 1])
+    assert np.all(board.locations[1:4, 2] == 2)
+    assert board.locations[4, 2] == 0
+
+
+def test_compact_board_bytes(board, valid_vehicles):
+    """
+    Test if the layout survives a round trip through bytes.
+    """
+    for vehicle in valid_vehicles:
+        board.add_vehicle(vehicle)
+
+    layout = np.frombuffer(
+        board.locations.tobytes(),
+        dtype=np.uint8,
+    ).reshape(board.size, board.size)
+
+    assert np.array_equal(layout, board.locations)
+
+
+@pytest.mark.parametrize('file_path', get_gameboard_file_paths())
+def test_compact_board_heuristics_match_board(file_path):
+    """
+    Test if the heuristics give the same values on a compact board during a
+    random walk over the gameboards.
+    """
+    random.seed(0)
+
+    game = Game.load_game_from_csv(file_path)
+    compact_game = Game.load_game_from_csv(file_path, 'compact')
+
+    for _ in range(100):
+        assert (
+            num_blocking_vehicles(game.board)
+            == num_blocking_vehicles(compact_game.board)
+        )
+        assert (
+            num_two_blocking_vehicles(game.board)
+            == num_two_blocking_vehicles(compact_game.board)
+        )
+        assert (
+            game.get_all_available_moves()
+            == compact_game.get_all_available_moves()
+        )
+
+        move = random.choice(game.get_all_available_moves())
+
+        game.make_move(move)
+        compact_game.make_move(move)
+
+
+def test_compact_board_write_board_state_to_csv(tmp_path):
+    """
+    Test if the board state of a compact board can be exported.
+    """
+    file_path = get_gameboard_file_paths()[0]
+    export_path = os.path.join(tmp_path, 'board.csv')
+
+    game = Game.load_game_from_csv(file_path, 'compact')
+    game.write_board_state_to_csv(export_path)
+
+    exported = read_board_state_from_csv(export_path)
+
+    assert [data[0] for data in exported] == list(game.board.vehicles)
+
+
+@patch('code.classes.plotter.plt')
+def test_compact_board_plot_board(mock_plt, board, valid_vehicles):
+    """
+    Test if a compact board can be plotted.
+    """
+    mock_plt.subplots.return_value = (mock_plt.figure, mock_plt.axes)
+
+    for vehicle in valid_vehicles:
+        board.add_vehicle(vehicle)
+
+    plotter = Plotter()
+    plotter.plot_board(board)
+
+    assert set(plotter.rectangles) == {'A', 'B', CARTER_NAME}
@@ -0,0 +1,78 @@
+import pytest
+
+from code.algorithms import BreadthFirst, DepthFirst
+from code.classes import Game, Mover
+from code.helpers import get_gameboard_file_paths
+
+
+@pytest.mark.parametrize('file_path', get_gameboard_file_paths()[:2])
+def test_run_iterative_deepening(file_path):
+    """
+    Test if the iterative deepening mode finds a valid solution as short as
+    the Breadth First Search.
+    """
+    game = Game.load_game_from_csv(file_path)
+
+    breadth = BreadthFirst(game.board.copy())
+    breadth.run(frontier=True)
+
+    depth = DepthFirst(game.board.copy())
+    depth.run(iterative_deepening=True, table_size=100000)
+
+    assert len(depth.moves) == len(breadth.moves)
+    assert game.is_valid_solution(depth.moves)
+
+
+def test_run_iterative_deepening_without_table():
+    """
+    Test if the iterative deepening mode finds the shortest solution with
+    only the path to prevent going round in circles.
+    """
+    game = Game.load_game_from_csv(get_gameboard_file_paths()[0])
+
+    breadth = BreadthFirst(game.board.copy())
+    breadth.run(frontier=True)
+
+    # start a few moves before the end of the shortest solution
+    board = game.board.copy()
+    mover = Mover(board)
+
+    for move in breadth.moves[:-6]:
+        mover.apply_move(move)
+
+    depth = DepthFirst(board)
+    depth.run(iterative_deepening=True)
+
+    assert len(depth.moves) == 6
+    assert depth.num_iterations == 6
+    assert Game.is_finished(depth.solution)
+
+
+def test_table_size():
+    """
+    Test if the transposition table never holds more than 'table_size'
+    states, without changing the length of the solution.
+    """
+    game = Game.load_game_from_csv(get_gameboard_file_paths()[0])
+
+    depth = DepthFirst(game.board.copy())
+    depth.run(iterative_deepening=True, table_size=500)
+
+    assert len(depth.transposition_table) == 500
+    assert len(depth.moves) == 21
+    assert game.is_valid_solution(depth.moves)
+
+
+def test_max_depth():
+    """
+    Test if no solution is found when the depth limit stays below the
+    shortest solution.
+    """
+    game = Game.load_game_from_csv(get_gameboard_file_paths()[0])
+
+    depth = DepthFirst(game.board.copy())
+    depth.run(iterative_deepening=True, table_size=100000, max_depth=10)
+
+    assert depth.num_iterations == 11
+    assert depth.solution is None
+    assert depth.moves == []
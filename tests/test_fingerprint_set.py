@@ -0,0 +1,27 @@
+from code.classes import FingerprintSet
+
+
+def test_add():
+    """
+    Test if every state key is added once, also after the table grew, and
+    small keys never collide.
+    """
+    seen = FingerprintSet()
+
+    assert all(seen.add(key) for key in range(0, 30000, 3))
+    assert not any(seen.add(key) for key in range(0, 30000, 3))
+    assert len(seen) == 10000
+    assert all(key in seen for key in range(0, 30000, 3))
+    assert not any(key in seen for key in range(1, 30000, 3))
+
+
+def test_memory():
+    """
+    Test if the set takes at most 4 slots of 8 bytes per state key.
+    """
+    seen = FingerprintSet()
+
+    for key in range(1000):
+        seen.add(key << 70)
+
+        assert seen.get_memory() <= max(32 * len(seen), 8 * 16)
@@ -296,3 +296,33 @@ def test_setup_board_no_carter(mock_board, game_data):
         )
 
     assert 'Carter appears to be missing on the board' in str(exc.value)
+
+
+def test_solve_freeze_irrelevant():
+    """
+    Test if a solution of the relevant vehicles solves the whole game as
+    fast as a solution of all vehicles, without moving the other vehicles.
+    """
+    from code.algorithms import BreadthFirst
+
+    game = Game(
+        [
+            (CARTER_NAME, Orientation.HORIZONTAL, 1, 2, 2),
+            ('A', Orientation.VERTICAL, 4, 1, 2),
+            ('B', Orientation.HORIZONTAL, 2, 0, 2),
+            ('C', Orientation.VERTICAL, 0, 0, 3),
+            ('D', Orientation.VERTICAL, 0, 3, 3),
+        ],
+        6,
+    )
+
+    moves = game.solve(BreadthFirst, max_moves=False)
+    frozen_moves = game.solve(
+        BreadthFirst,
+        freeze_irrelevant=True,
+        max_moves=False,
+    )
+
+    assert len(frozen_moves) == len(moves)
+    assert 'D' not in {name for name, _ in frozen_moves}
+    assert game.is_valid_solution(frozen_moves)
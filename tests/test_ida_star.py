@@ -0,0 +1,47 @@
+import pytest
+
+from code.algorithms import (
+    BreadthFirst,
+    IDAStar,
+    num_blocking_vehicles,
+    num_two_blocking_vehicles,
+)
+from code.algorithms.ida_star import ENTRY_SIZE
+from code.classes import Game
+from code.helpers import get_gameboard_file_paths
+
+
+@pytest.mark.parametrize('max_memory', [200_000, 200_000_000])
+@pytest.mark.parametrize('file_path', get_gameboard_file_paths()[:2])
+def test_run(file_path, max_memory):
+    """
+    Test if IDA* with an admissible heuristic finds a valid solution as short
+    as the Breadth First Search, also with a small memory budget for the
+    transposition table.
+    """
+    game = Game.load_game_from_csv(file_path)
+
+    breadth = BreadthFirst(game.board.copy())
+    breadth.run()
+
+    ida_star = IDAStar(game.board, num_blocking_vehicles, max_memory)
+    ida_star.run()
+
+    assert len(ida_star.moves) == len(breadth.moves)
+    assert len(ida_star.transposition_table) <= max_memory // ENTRY_SIZE
+    assert Game.is_finished(ida_star.solution)
+    assert game.is_valid_solution(ida_star.moves)
+
+
+def test_run_keeps_initial_state():
+    """
+    Test if the moves are made on a copy of the initial state.
+    """
+    game = Game.load_game_from_csv(get_gameboard_file_paths()[0])
+    key = game.board.get_state_key()
+
+    ida_star = IDAStar(game.board, num_two_blocking_vehicles)
+    ida_star.run()
+
+    assert game.board.get_state_key() == key
+    assert game.is_valid_solution(ida_star.moves)
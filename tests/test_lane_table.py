@@ -0,0 +1,107 @@
+import os
+
+import pytest
+
+from code.classes import LaneTable
+from code.classes.lane_table import LANE_TABLES, MAX_VEHICLE_LENGTH
+
+
+def brute_force_max_steps(size, mask, offset, length, forwards):
+    """
+    Counts the empty squares in front of or behind a vehicle one by one.
+    """
+    steps = 0
+
+    if forwards:
+        square = offset + length
+
+        while square < size and not mask & (1 << square):
+            steps += 1
+            square += 1
+    else:
+        square = offset - 1
+
+        while square >= 0 and not mask & (1 << square):
+            steps += 1
+            square -= 1
+
+    return steps
+
+
+@pytest.mark.parametrize('size', [6, 9])
+def test_build(size):
+    """
+    Test if the built table matches counting the squares one by one.
+    """
+    table = LaneTable.build(size)
+
+    assert table.forward.shape == (1 << size, size, MAX_VEHICLE_LENGTH + 1)
+
+    for mask in range(0, 1 << size, 7):
+        for length in (2, 3):
+            for offset in range(size - length + 1):
+                for forwards in (True, False):
+                    assert table.get_max_steps(
+                        mask,
+                        offset,
+                        length,
+                        forwards,
+                    ) == brute_force_max_steps(
+                        size,
+                        mask,
+                        offset,
+                        length,
+                        forwards,
+                    )
+
+
+def test_get_move_range():
+    """
+    Test if the move range combines both directions.
+    """
+    table = LaneTable.build(6)
+
+    # Vehicle of length 2 at offset 2 with occupied squares at 0 and 5
+    mask = 0b101101
+
+    assert table.get_move_range(mask, 2, 2) == (1, 1)
+    assert table.get_move_range(0b001100, 2, 2) == (2, 2)
+
+
+def test_load_caches_table(tmp_path, monkeypatch):
+    """
+    Test if loading builds the table once and caches it on disk.
+    """
+    monkeypatch.setattr('code.helpers.get_cache_path', lambda: str(tmp_path))
+    monkeypatch.delitem(LANE_TABLES, 6, raising=False)
+
+    table = LaneTable.load(6)
+
+    assert os.path.isfile(os.path.join(tmp_path, 'lane_table_6.npz'))
+    assert LaneTable.load(6) is table
+
+    monkeypatch.delitem(LANE_TABLES, 6)
+
+    loaded = LaneTable.load(6)
+
+    assert loaded is not table
+    assert (loaded.forward == table.forward).all()
+    assert (loaded.backward == table.backward).all()
+
+
+def test_step_masks():
+    """
+    Test if the step masks select the steps within a move range.
+    """
+    table = LaneTable.build(6)
+
+    assert table.step_candidates.tolist() == [1, 2, 3, 4, 5, -1, -2, -3, -4, -5]
+
+    for backward in range(6):
+        for forward in range(6):
+            steps = table.step_candidates[table.step_masks[backward, forward]]
+
+            assert steps.tolist() == (
+                list(range(1, forward + 1))
+                + list(range(-1, -backward - 1, -1))
+            )
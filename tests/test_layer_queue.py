@@ -0,0 +1,43 @@
+import pytest
+
+from code.classes import LayerQueue
+
+
+@pytest.mark.parametrize('key_size', [3, 8, 15])
+def test_pop_order(key_size):
+    """
+    Test if the state keys are popped first in, first out with the depth of
+    their layer, also when a key takes more than one word.
+    """
+    keys = [0, 1, (1 << (8 * key_size)) - 1, 12345]
+    queue = LayerQueue(key_size)
+
+    queue.push(keys[0])
+
+    assert len(queue) == 1
+    assert queue.pop() == (keys[0], 0)
+
+    queue.push(keys[1])
+    queue.push(keys[2])
+
+    assert queue.pop() == (keys[1], 1)
+
+    queue.push(keys[3])
+
+    assert len(queue) == 2
+    assert queue.pop() == (keys[2], 1)
+    assert queue.pop() == (keys[3], 2)
+    assert not queue
+
+
+def test_memory():
+    """
+    Test if every state key takes a single word when it fits in one.
+    """
+    queue = LayerQueue(8)
+
+    for key in range(1000):
+        queue.push(key)
+
+    assert len(queue.next_layer) == 1000
+    assert queue.next_layer.itemsize == 8
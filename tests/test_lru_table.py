@@ -0,0 +1,40 @@
+from code.classes import LRUTable
+
+
+def test_evict_least_recently_used():
+    """
+    Test if the least recently stored or looked up state is dropped when
+    the table is full.
+    """
+    table = LRUTable(2)
+
+    table.put(1, 'a')
+    table.put(2, 'b')
+
+    assert table.get(1) == 'a'
+
+    table.put(3, 'c')
+
+    assert len(table) == 2
+    assert 1 in table
+    assert 2 not in table
+    assert table.get(2) is None
+
+    table.put(1, 'd')
+    table.put(4, 'e')
+
+    assert table.get(1) == 'd'
+    assert 3 not in table
+
+
+def test_clear():
+    """
+    Test if all states are removed from the table.
+    """
+    table = LRUTable(2)
+
+    table.put(1, 'a')
+    table.clear()
+
+    assert len(table) == 0
+    assert table.get(1) is None
@@ -0,0 +1,150 @@
+import random
+
+import pytest
+
+from code.algorithms import (
+    AStar,
+    BreadthFirst,
+    MovePruning,
+    get_interaction_graph,
+    num_blocking_vehicles,
+)
+from code.algorithms.breadth_first import BreadthFirstFrontierError
+from code.classes import Board, CARTER_NAME, Game, Mover, Orientation
+from code.helpers import get_gameboard_file_paths
+
+
+@pytest.fixture
+def board():
+    """
+    Fixture for creating a small board where carter is blocked by A, which is
+    blocked by B, and C and D never cross the lanes of carter and A.
+    """
+    return Game.setup_board(
+        Board(6),
+        [
+            (CARTER_NAME, Orientation.HORIZONTAL, 0, 2, 2),
+            ('A', Orientation.VERTICAL, 3, 1, 2),
+            ('B', Orientation.HORIZONTAL, 2, 0, 2),
+            ('C', Orientation.HORIZONTAL, 0, 5, 2),
+            ('D', Orientation.VERTICAL, 5, 3, 3),
+        ],
+    )
+
+
+def test_get_interaction_graph(board):
+    """
+    Test if the vehicles interact when their lanes cross.
+    """
+    assert get_interaction_graph(board) == {
+        CARTER_NAME: {'A', 'D'},
+        'A': {CARTER_NAME, 'B', 'C'},
+        'B': {'A', 'D'},
+        'C': {'A', 'D'},
+        'D': {CARTER_NAME, 'B', 'C'},
+    }
+
+
+def test_filter_moves(board):
+    """
+    Test if a move is pruned after a move of a later, independent vehicle,
+    unless the state was also reached with a move that does not prune it.
+    """
+    move_pruning = MovePruning(board)
+    moves = [(CARTER_NAME, -1), ('A', 1), ('B', 1), ('C', 1), ('D', -1)]
+
+    # A comes before D in the layout and does not interact with D
+    move_pruning.add(1, 1, ('D', -1))
+
+    assert move_pruning.filter_moves(moves, 1) == [(CARTER_NAME, -1), ('B', 1), ('C', 1), ('D', -1)]
+
+    # reaching the state at another depth does not count
+    move_pruning.add(2, 1, ('D', -1))
+    move_pruning.merge(2, 2, ('B', 1))
+
+    assert move_pruning.filter_moves(moves, 2) == [(CARTER_NAME, -1), ('B', 1), ('C', 1), ('D', -1)]
+
+    # A is not pruned after B
+    move_pruning.add(3, 1, ('D', -1))
+    move_pruning.merge(3, 1, ('B', 1))
+
+    assert move_pruning.filter_moves(moves, 3) == moves
+    assert move_pruning.num_pruned_moves == 2
+
+
+@pytest.mark.parametrize('file_path', get_gameboard_file_paths()[:4])
+def test_pruned_moves_commute(file_path):
+    """
+    Test if every pruned move reaches the same state when it is made before
+    the move it was pruned after, along a random walk.
+    """
+    rng = random.Random(0)
+    board = Game.load_game_from_csv(file_path).board
+    mover = Mover(board)
+    move_pruning = MovePruning(board)
+
+    for _ in range(100):
+        moves = mover.get_all_available_moves()
+        last_move = rng.choice(moves)
+        mover.apply_move(last_move)
+
+        move_pruning.add(board.get_state_key(), 1, last_move)
+        pruned_moves = set(mover.get_all_available_moves()) - set(
+            move_pruning.filter_moves(mover.get_all_available_moves(), board.get_state_key())
+        )
+
+        for move in pruned_moves:
+            mover.apply_move(move)
+            state_key = board.get_state_key()
+            mover.undo_move(move)
+            mover.undo_move(last_move)
+
+            assert move in mover.get_all_available_moves()
+
+            mover.apply_move(move)
+            mover.apply_move(last_move)
+
+            assert board.get_state_key() == state_key
+
+            mover.undo_move(last_move)
+            mover.undo_move(move)
+            mover.apply_move(last_move)
+
+
+@pytest.mark.parametrize('file_path', get_gameboard_file_paths()[:3])
+def test_solvers(file_path):
+    """
+    Test if BFS and A* with move pruning generate fewer moves and still find
+    a solution as short as the Breadth First Search without it.
+    """
+    game = Game.load_game_from_csv(file_path)
+
+    breadth = BreadthFirst(game.board.copy())
+    breadth.run(max_moves=False)
+
+    pruned_breadth = BreadthFirst(game.board.copy())
+    pruned_breadth.run(max_moves=False, move_pruning=True)
+
+    astar = AStar(game.board.copy(), num_blocking_vehicles)
+    astar.run(move_pruning=True)
+
+    assert pruned_breadth.move_pruning.num_pruned_moves > 0
+    assert astar.move_pruning.num_pruned_moves > 0
+    assert len(pruned_breadth.moves) == len(breadth.moves)
+    assert len(astar.moves) == len(breadth.moves)
+    assert game.is_valid_solution(pruned_breadth.moves)
+
+    game.reset()
+
+    assert game.is_valid_solution(astar.moves)
+
+
+def test_frontier_error():
+    """
+    Test if the frontier mode refuses move pruning.
+    """
+    game = Game.load_game_from_csv(get_gameboard_file_paths()[0])
+    breadth = BreadthFirst(game.board)
+
+    with pytest.raises(BreadthFirstFrontierError):
+        breadth.run(frontier=True, move_pruning=True)
@@ -0,0 +1,123 @@
+import random
+
+import numpy as np
+import pytest
+
+from code.classes import (
+    BitBoard,
+    BOARD_BACKENDS,
+    Board,
+    CARTER_NAME,
+    Game,
+    Mover,
+    Orientation,
+)
+from code.helpers import get_gameboard_file_paths
+
+
+@pytest.fixture(params=[Board, BitBoard])
+def board(request):
+    """
+    Fixture for creating a board with vehicles for both backends.
+    """
+    return Game.setup_board(
+        request.param(6),
+        [
+            ('A', Orientation.HORIZONTAL, 0, 0, 2),
+            ('B', Orientation.VERTICAL, 2, 2, 3),
+            (CARTER_NAME, Orientation.HORIZONTAL, 0, 2, 2),
+        ],
+    )
+
+
+def test_apply_and_undo_move(board):
+    """
+    Test if undoing an applied move restores the board.
+    """
+    mover = Mover(board)
+    key = board.get_state_key()
+    locations = board.locations.copy()
+
+    mover.apply_move(('B', 1))
+
+    assert board.vehicles['B'].location == [(2, 3), (2, 4), (2, 5)]
+    assert board.get_state_key() != key
+
+    mover.undo_move(('B', 1))
+
+    assert board.get_state_key() == key
+    assert np.array_equal(board.locations, locations)
+
+
+def test_iter_children(board):
+    """
+    Test if iterating the children puts the board in every child state and
+    restores the board afterwards.
+    """
+    mover = Mover(board)
+    key = board.get_state_key()
+    moves = mover.get_all_available_moves()
+
+    children = []
+
+    for move in mover.iter_children(moves):
+        assert board.get_state_key() != key
+        children.append(board.copy())
+
+    assert board.get_state_key() == key
+    assert len(children) == len(moves)
+
+    for move, child in zip(moves, children):
+        expected = board.copy()
+        Mover(expected).move_vehicle(move)
+
+        assert np.array_equal(child.locations, expected.locations)
+        assert child.get_state_key() == expected.get_state_key()
+
+
+@pytest.mark.parametrize('backend', BOARD_BACKENDS)
+@pytest.mark.parametrize('file_path', get_gameboard_file_paths())
+def test_get_move_arrays(backend, file_path):
+    """
+    Test if the vectorized moves match the moves of every vehicle separately
+    during a random walk over the gameboards.
+    """
+    random.seed(0)
+
+    game = Game.load_game_from_csv(file_path, backend)
+    mover = game.mover
+    vehicle_names = game.board.get_vehicle_arrays()[0]
+
+    for _ in range(50):
+        moves = [
+            move
+            for vehicle_name in vehicle_names
+            for move in mover.get_all_available_moves(vehicle_name)
+        ]
+        max_moves = []
+
+        for vehicle_name in vehicle_names:
+            backward, forward = mover.get_vehicle_move_range(vehicle_name)
+
+            if forward > 0:
+                max_moves.append((vehicle_name, forward))
+
+            if backward > 0:
+                max_moves.append((vehicle_name, -backward))
+
+        assert mover.get_all_available_moves() == moves
+        assert mover.get_moves_from_arrays(
+            *mover.get_move_arrays(max_moves=True),
+        ) == max_moves
+
+        game.make_move(random.choice(moves))
+
+
+def test_get_move_ranges(board):
+    """
+    Test if the move ranges of all vehicles are in the order they were added.
+    """
+    backward, forward = Mover(board).get_move_ranges()
+
+    assert backward.tolist() == [0, 2, 0]
+    assert forward.tolist() == [4, 1, 0]
@@ -0,0 +1,65 @@
+from code.algorithms import AStar, BreadthFirst, num_blocking_vehicles
+from code.classes import CARTER_NAME, Game, Mover, Orientation, PathTable
+
+
+def test_get_moves():
+    """
+    Test if the moves are rebuilt from the start state in order.
+    """
+    path_table = PathTable(0)
+
+    path_table.add(5, 0, ('A', 1))
+    path_table.add(7, 5, ('B', -2))
+    path_table.add(9, 0, ('C', 1))
+
+    assert path_table.get_moves(0) == []
+    assert path_table.get_moves(7) == [('A', 1), ('B', -2)]
+    assert path_table.get_moves(9) == [('C', 1)]
+    assert len(path_table) == 3
+
+
+def test_get_moves_start_state_seen_again():
+    """
+    Test if rebuilding stops at the start state, even when the start state
+    was reached again as a child state.
+    """
+    path_table = PathTable(0)
+
+    path_table.add(5, 0, ('A', 1))
+    path_table.add(0, 5, ('A', -1))
+    path_table.add(7, 5, ('B', 1))
+
+    assert path_table.get_moves(7) == [('A', 1), ('B', 1)]
+
+
+def test_solvers_rebuild_valid_solution():
+    """
+    Test if the moves rebuilt by the solvers solve the game.
+    """
+    game = Game(
+        [
+            ('A', Orientation.VERTICAL, 3, 1, 2),
+            ('B', Orientation.HORIZONTAL, 2, 0, 2),
+            ('C', Orientation.VERTICAL, 3, 4, 2),
+            (CARTER_NAME, Orientation.HORIZONTAL, 0, 2, 2),
+        ],
+        6,
+    )
+
+    breadth = BreadthFirst(game.board.copy())
+    breadth.run()
+
+    a_star = AStar(game.board.copy(), num_blocking_vehicles)
+    a_star.run()
+
+    for moves in (breadth.moves, a_star.moves):
+        board = game.board.copy()
+        mover = Mover(board)
+
+        for move in moves:
+            mover.move_vehicle(move)
+
+        assert Game.is_finished(board)
+
+    assert len(breadth.moves) == 3
+    assert breadth.moves[-1][0] == CARTER_NAME
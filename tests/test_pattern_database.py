@@ -0,0 +1,160 @@
+import pytest
+
+from code.algorithms import (
+    AStar,
+    BreadthFirst,
+    PatternDatabase,
+    Tablebase,
+    get_relevant_vehicles,
+)
+from code.classes import Board, CARTER_NAME, Game, Mover, Orientation
+from code.helpers import get_gameboard_file_paths
+
+
+@pytest.fixture
+def board():
+    """
+    Fixture for creating a small board where carter is blocked by A, which is
+    blocked by B.
+    """
+    return Game.setup_board(
+        Board(6),
+        [
+            (CARTER_NAME, Orientation.HORIZONTAL, 0, 2, 2),
+            ('A', Orientation.VERTICAL, 3, 1, 2),
+            ('B', Orientation.HORIZONTAL, 2, 0, 2),
+            ('C', Orientation.HORIZONTAL, 0, 5, 2),
+            ('D', Orientation.VERTICAL, 5, 3, 3),
+        ],
+    )
+
+
+def test_get_relevant_vehicles(board):
+    """
+    Test if the vehicles are ordered by how directly they block carter.
+    """
+    assert get_relevant_vehicles(board) == ['A', 'D', 'B', 'C']
+
+
+def test_admissible(tmp_path):
+    """
+    Test if the heuristic never overestimates the number of moves AStar still
+    needs, for all reachable states of the first gameboard.
+    """
+    game = Game.load_game_from_csv(get_gameboard_file_paths()[0])
+    heuristic = PatternDatabase(pattern_size=3, cache_path=str(tmp_path))
+    tablebase = Tablebase.build(game.board)
+
+    board = game.board.copy()
+    mover = Mover(board)
+    seen = {board.get_state_key()}
+    layer = [board.get_state_key()]
+
+    while layer:
+        next_layer = []
+
+        for state_key in layer:
+            board.set_state_key(state_key)
+
+            assert heuristic(board) <= max(tablebase.get_distance(board) - 1, 0)
+
+            for _ in mover.iter_children(mover.get_all_available_moves()):
+                child_key = board.get_state_key()
+
+                if child_key not in seen:
+                    seen.add(child_key)
+                    next_layer.append(child_key)
+
+        layer = next_layer
+
+    assert len(seen) == 818
+
+
+def test_patterns(board, tmp_path):
+    """
+    Test if the distance of a pattern is the distance on the board with only
+    carter and the vehicles of the pattern.
+    """
+    heuristic = PatternDatabase([['A'], ['A', 'B']], cache_path=str(tmp_path))
+
+    # A has to move out of the way before carter can drive to the exit
+    assert heuristic(board) == 1
+
+    heuristic = PatternDatabase([['B'], ['C']], cache_path=str(tmp_path))
+
+    # neither B nor C block carter
+    assert heuristic(board) == 0
+
+
+def test_cached_on_disk(board, tmp_path, monkeypatch):
+    """
+    Test if the databases are stored on disk and loaded instead of built by a
+    new heuristic.
+    """
+    heuristic = PatternDatabase(pattern_size=2, cache_path=str(tmp_path))
+    distance = heuristic(board)
+
+    assert len(list(tmp_path.iterdir())) == 2
+
+    def build(board):
+        raise AssertionError('The database should be loaded from disk')
+
+    monkeypatch.setattr(Tablebase, 'build', build)
+
+    assert PatternDatabase(pattern_size=2, cache_path=str(tmp_path))(board) == distance
+
+
+@pytest.mark.parametrize('file_path', get_gameboard_file_paths()[:3])
+def test_a_star(file_path, tmp_path):
+    """
+    Test if AStar with the pattern database finds a valid solution as short
+    as the Breadth First Search.
+    """
+    game = Game.load_game_from_csv(file_path)
+
+    breadth = BreadthFirst(game.board.copy())
+    breadth.run(max_moves=False)
+
+    astar = AStar(game.board.copy(), PatternDatabase(cache_path=str(tmp_path)))
+    astar.run(max_moves=False)
+
+    assert len(astar.moves) == len(breadth.moves)
+    assert game.is_valid_solution(astar.moves)
+
+
+def test_cached_on_disk_other_state(board, tmp_path, monkeypatch):
+    """
+    Test if a database on disk is also loaded for another start state that
+    can reach the states of the database.
+    """
+    heuristic = PatternDatabase([['A', 'B']], cache_path=str(tmp_path))
+    heuristic(board)
+
+    def build(board):
+        raise AssertionError('The database should be loaded from disk')
+
+    monkeypatch.setattr(Tablebase, 'build', build)
+
+    Mover(board).move_vehicle(('B', 1))
+
+    assert PatternDatabase([['A', 'B']], cache_path=str(tmp_path))(board) == 1
+
+
+def test_cached_on_disk_vehicle_order(board, tmp_path):
+    """
+    Test if a board with the same vehicles added in another order, which
+    ranks its states differently, does not load the database of the board.
+    """
+    heuristic = PatternDatabase([['A', 'B']], cache_path=str(tmp_path))
+    heuristic(board)
+
+    reordered = Game.setup_board(
+        Board(6),
+        [
+            (vehicle.name, vehicle.orientation, *vehicle.back, vehicle.length)
+            for vehicle in reversed(board.vehicles.values())
+        ],
+    )
+
+    assert PatternDatabase([['A', 'B']], cache_path=str(tmp_path))(reordered) == 1
+    assert len(list(tmp_path.iterdir())) == 2
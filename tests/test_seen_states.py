@@ -0,0 +1,97 @@
+import pytest
+
+from code.algorithms import BreadthFirst
+from code.classes import (
+    Board,
+    CARTER_NAME,
+    Game,
+    Mover,
+    Orientation,
+    SeenStates,
+)
+from code.helpers import get_gameboard_file_paths
+
+
+@pytest.fixture(params=[False, True])
+def board(request):
+    """
+    Fixture for creating a board with and without Zobrist hashing.
+    """
+    board = Game.setup_board(
+        Board(6),
+        [
+            ('A', Orientation.HORIZONTAL, 0, 0, 2),
+            ('B', Orientation.VERTICAL, 2, 2, 3),
+            (CARTER_NAME, Orientation.HORIZONTAL, 0, 2, 2),
+        ],
+    )
+
+    if request.param:
+        board.enable_zobrist()
+
+    return board
+
+
+def test_add(board):
+    """
+    Test if only unseen states are added.
+    """
+    seen_states = SeenStates()
+    mover = Mover(board)
+
+    assert seen_states.add(board)
+    assert not seen_states.add(board)
+
+    mover.apply_move(('A', 1))
+
+    assert seen_states.add(board)
+
+    mover.undo_move(('A', 1))
+
+    assert not seen_states.add(board)
+    assert len(seen_states) == 2
+    assert set(seen_states) == {
+        board.get_state_key(),
+        board.get_state_key() + board.key_weights['A'],
+    }
+
+
+def test_add_hash_collision(board):
+    """
+    Test if different states with the same Zobrist hash are both added, as
+    states are looked up by their state key.
+    """
+    board.enable_zobrist()
+    mover = Mover(board)
+    seen_states = SeenStates()
+
+    seen_states.add(board)
+
+    # Give the moved state the hash of the original state
+    mover.apply_move(('A', 1))
+    keys = board.zobrist_keys['A']
+    keys[1] = keys[0]
+    board.cached_zobrist_hash = None
+
+    assert seen_states.add(board)
+    assert not seen_states.add(board)
+    assert len(seen_states) == 2
+
+
+@pytest.mark.parametrize('file_path', get_gameboard_file_paths()[:2])
+def test_breadth_first_zobrist(file_path):
+    """
+    Test if Breadth First finds the same solution with Zobrist hashing.
+    """
+    game = Game.load_game_from_csv(file_path)
+    zobrist_game = Game.load_game_from_csv(file_path)
+    zobrist_game.board.enable_zobrist()
+
+    breadth = BreadthFirst(game.board)
+    breadth.run()
+
+    zobrist_breadth = BreadthFirst(zobrist_game.board)
+    zobrist_breadth.run()
+
+    assert zobrist_breadth.moves == breadth.moves
+    assert set(zobrist_breadth.seen_states) == set(breadth.seen_states)
@@ -0,0 +1,153 @@
+import pytest
+
+from code.algorithms import AStar, BreadthFirst, num_blocking_vehicles
+from code.classes import Game, SolutionCache
+from code.helpers import get_gameboard_file_paths
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """
+    Fixture for creating an empty solution cache in a temporary folder.
+    """
+    cache = SolutionCache(str(tmp_path / 'cache' / 'solutions.sqlite3'))
+
+    yield cache
+
+    cache.close()
+
+
+@pytest.fixture
+def game():
+    """
+    Fixture for loading the first gameboard.
+    """
+    return Game.load_game_from_csv(get_gameboard_file_paths()[0])
+
+
+def test_get_key(game):
+    """
+    Test if the key depends on the board state, the algorithm and its
+    parameters, but not on the order of the vehicles or the backend.
+    """
+    key = SolutionCache.get_key(game.board, 'AStar', (num_blocking_vehicles,))
+
+    reversed_game = Game(game.start_state[::-1], game.board_size, 'bitboard')
+
+    assert key == SolutionCache.get_key(
+        reversed_game.board,
+        'AStar',
+        (num_blocking_vehicles,),
+    )
+    assert key != SolutionCache.get_key(game.board, 'BreadthFirst')
+    assert key != SolutionCache.get_key(
+        game.board,
+        'AStar',
+        (num_blocking_vehicles,),
+        {'max_moves': False},
+    )
+
+    game.make_move(game.get_all_available_moves()[0])
+
+    assert key != SolutionCache.get_key(
+        game.board,
+        'AStar',
+        (num_blocking_vehicles,),
+    )
+
+
+def test_get_put(tmp_path, cache):
+    """
+    Test if stored moves are returned as moves and kept in the file.
+    """
+    moves = [('A', 1), ('X', -2)]
+
+    assert cache.get('key') is None
+
+    cache.put('key', moves)
+
+    assert cache.get('key') == moves
+    assert 'key' in cache
+    assert len(cache) == 1
+
+    reopened = SolutionCache(cache.file_path)
+
+    assert reopened.get('key') == moves
+
+    reopened.close()
+
+
+def test_eviction(cache):
+    """
+    Test if the least recently used solutions are removed when the cache
+    grows larger than its maximum size.
+    """
+    moves = [('A', 1)] * 10
+    size = len('[["A",1]' + ',["A",1]' * 9 + ']')
+    cache.max_size = 3 * size
+
+    cache.put('a', moves)
+    cache.put('b', moves)
+    cache.put('c', moves)
+    cache.get('a')
+    cache.put('d', moves)
+
+    assert cache.get_size() == 3 * size
+    assert 'b' not in cache
+    assert all(key in cache for key in 'acd')
+
+    # a solution larger than the cache is still stored by itself
+    cache.put('e', moves * 4)
+
+    assert len(cache) == 1
+    assert 'e' in cache
+
+
+def test_solve(game, cache):
+    """
+    Test if solving a game stores the solution and if a second solve uses
+    the cached solution without searching.
+    """
+    moves = game.solve(BreadthFirst, cache=cache, max_moves=False)
+
+    assert len(cache) == 1
+    assert game.is_valid_solution(moves)
+
+    game.reset()
+
+    class FailingSolver(BreadthFirst):
+        def run(self, *args, **kwargs):
+            raise AssertionError('The solver should not search')
+
+    FailingSolver.__name__ = 'BreadthFirst'
+
+    assert game.solve(FailingSolver, cache=cache, max_moves=False) == moves
+    assert game.solve(AStar, num_blocking_vehicles, cache=cache)
+    assert len(cache) == 2
+
+
+def test_solve_without_cache(game):
+    """
+    Test if solving without a cache does not change the board.
+    """
+    state_key = game.board.get_state_key()
+    moves = game.solve(BreadthFirst)
+
+    assert moves
+    assert game.board.get_state_key() == state_key
+
+
+def test_solve_unsolved(game, cache):
+    """
+    Test if a search that ends without a solution is not cached, also when
+    the solver sets its solution board anyway.
+    """
+    class UnsolvedAStar(AStar):
+        def run(self, *args, **kwargs):
+            self.queue = type(self.queue)()
+            super().run(*args, **kwargs)
+
+    UnsolvedAStar.__name__ = 'AStar'
+
+    assert game.solve(UnsolvedAStar, num_blocking_vehicles, cache=cache) == []
+    assert len(cache) == 0
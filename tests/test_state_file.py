@@ -0,0 +1,55 @@
+from code.classes import Game, StateFile
+from code.helpers import get_gameboard_file_paths
+
+
+def test_get_key_size():
+    """
+    Test if every state key of the board fits in the key size.
+    """
+    board = Game.load_game_from_csv(get_gameboard_file_paths()[-1]).board
+    num_keys = 1
+
+    for _, _, radix, _ in board.get_key_layout():
+        num_keys *= radix
+
+    key_size = StateFile.get_key_size(board)
+
+    assert num_keys - 1 < 256 ** key_size
+    assert num_keys - 1 >= 256 ** (key_size - 1)
+
+
+def test_write(tmp_path):
+    """
+    Test if the keys are read back in order and looked up on disk.
+    """
+    keys = [0, 3, 255, 256, 2 ** 40 + 1]
+    state_file = StateFile.write(str(tmp_path / 'keys.bin'), 6, keys)
+
+    assert list(state_file) == keys
+    assert len(state_file) == len(keys)
+    assert state_file.get_size() == 6 * len(keys)
+    assert all(key in state_file for key in keys)
+    assert not any(key in state_file for key in [1, 254, 257, 2 ** 40])
+
+    state_file.remove()
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_merge(tmp_path):
+    """
+    Test if the runs are merged without duplicates and without the keys of
+    the excluded files.
+    """
+    runs = [
+        StateFile.write(str(tmp_path / 'run_0.bin'), 2, [1, 4, 6, 9]),
+        StateFile.write(str(tmp_path / 'run_1.bin'), 2, [2, 4, 5, 9, 300]),
+    ]
+    excluded = [
+        StateFile.write(str(tmp_path / 'previous.bin'), 2, [0, 5]),
+        StateFile.write(str(tmp_path / 'current.bin'), 2, [3, 4, 7]),
+    ]
+
+    merged = StateFile.merge(str(tmp_path / 'merged.bin'), runs, excluded)
+
+    assert list(merged) == [1, 2, 6, 9, 300]
@@ -0,0 +1,166 @@
+import numpy as np
+import pytest
+
+from code.algorithms import BreadthFirst, Tablebase, get_state_space_bound
+from code.algorithms.tablebase import (
+    TablebaseStateNotFoundError,
+    TablebaseTooLargeError,
+    UNREACHABLE,
+)
+from code.classes import Board, CARTER_NAME, Game, Mover, Orientation
+from code.helpers import get_gameboard_file_paths
+
+
+# Bounds on the number of states from docs/State_space.md
+STATE_SPACE_BOUNDS = [1_620_000, 10_800_000, 800_000]
+
+
+@pytest.fixture(scope='module')
+def game():
+    """
+    Fixture for loading the first gameboard.
+    """
+    return Game.load_game_from_csv(get_gameboard_file_paths()[0])
+
+
+@pytest.fixture(scope='module')
+def tablebase(game):
+    """
+    Fixture for building the tablebase of the first gameboard.
+    """
+    return Tablebase.build(game.board)
+
+
+@pytest.mark.parametrize(
+    'file_path, bound',
+    list(zip(get_gameboard_file_paths(), STATE_SPACE_BOUNDS)),
+)
+def test_get_state_space_bound(file_path, bound):
+    """
+    Test if the state space bound matches the calculation in the docs.
+    """
+    game = Game.load_game_from_csv(file_path)
+
+    assert get_state_space_bound(game.board) == bound
+
+
+def test_too_large():
+    """
+    Test if a board with more state ranks than fit in 64 bits is refused.
+    """
+    game = Game.load_game_from_csv(get_gameboard_file_paths()[-1])
+
+    with pytest.raises(TablebaseTooLargeError):
+        Tablebase.build(game.board)
+
+
+def test_ranks(tablebase):
+    """
+    Test if every state has a unique rank within the bound and if the rank of
+    a single state matches the ranks calculated at once.
+    """
+    counts = tablebase.get_counts()
+
+    assert counts['states'] == 818
+    assert len(np.unique(tablebase.ranks)) == len(tablebase.ranks)
+    assert np.all(np.diff(tablebase.ranks.astype(np.int64)) > 0)
+    assert int(tablebase.ranks[-1]) < counts['bound_finished']
+    assert counts['unfinished_states'] <= counts['bound']
+
+    board = tablebase.board.copy()
+    state_key = board.get_state_key()
+
+    assert tablebase.get_state_rank(board) == tablebase.get_state_ranks(
+        [state_key]
+    )[0]
+
+
+def test_distances(game, tablebase):
+    """
+    Test if the distance of the start state equals the number of moves of the
+    Breadth First Search and if the solution is valid.
+    """
+    breadth = BreadthFirst(game.board.copy())
+    breadth.run(max_moves=False)
+
+    moves = tablebase.solve(game.board)
+
+    assert tablebase.get_distance(game.board) == len(breadth.moves)
+    assert len(moves) == len(breadth.moves)
+
+    board = game.board.copy()
+    mover = Mover(board)
+
+    for move in moves:
+        mover.apply_move(move)
+
+    assert tablebase.get_distance(board) == 0
+    assert tablebase.get_hint(board) is None
+
+
+def test_state_not_found(tablebase):
+    """
+    Test if looking up a state outside of the tablebase raises an exception.
+    """
+    ranks = set(tablebase.ranks.tolist())
+    state_key = next(
+        state_key
+        for state_key in range(10_000)
+        if tablebase.get_state_ranks([state_key])[0] not in ranks
+    )
+    board = tablebase.board.create_from_state_key(state_key)
+
+    with pytest.raises(TablebaseStateNotFoundError):
+        tablebase.get_distance(board)
+
+
+def test_unreachable():
+    """
+    Test if states without a path to the goal are stored as unreachable.
+    """
+    board = Game.setup_board(
+        Board(6),
+        [
+            (CARTER_NAME, Orientation.HORIZONTAL, 0, 2, 2),
+            ('A', Orientation.HORIZONTAL, 3, 2, 2),
+        ],
+    )
+    tablebase = Tablebase.build(board)
+
+    assert np.all(tablebase.distances == UNREACHABLE)
+    assert tablebase.get_distance(board) is None
+    assert tablebase.get_hint(board) is None
+    assert tablebase.solve(board) == []
+
+
+@pytest.mark.parametrize('mmap', [True, False])
+def test_save_load(tmp_path, tablebase, mmap):
+    """
+    Test if a saved tablebase is loaded with the same contents.
+    """
+    tablebase.save(str(tmp_path))
+    loaded = Tablebase.load(tablebase.board, str(tmp_path), mmap=mmap)
+
+    assert isinstance(loaded.ranks, np.memmap) == mmap
+    assert np.array_equal(loaded.ranks, tablebase.ranks)
+    assert np.array_equal(loaded.distances, tablebase.distances)
+    assert loaded.get_distance(tablebase.board) == tablebase.get_distance(
+        tablebase.board
+    )
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        'distances.npy',
+        'ranks.npy',
+    ]
+
+
+def test_build_verbose(game, capsys):
+    """
+    Test if building only prints the number of reachable states when asked.
+    """
+    Tablebase.build(game.board)
+
+    assert capsys.readouterr().out == ''
+
+    Tablebase.build(game.board, verbose=True)
+
+    assert 'Number of reachable states: 818' in capsys.readouterr().out
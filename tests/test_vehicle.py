@@ -90,3 +90,51 @@ def test_vehicle_update_location(vehicle):
             (new_col, new_row + i)
             for i in range(vehicle.length)
         ]
+
+
+def test_vehicle_lane_and_offset(vehicle):
+    """
+    Test if the lane and offset describe the back of the vehicle.
+    """
+    if vehicle.orientation == Orientation.HORIZONTAL:
+        assert (vehicle.lane, vehicle.offset) == (
+            vehicle.start_row,
+            vehicle.start_col,
+        )
+    else:
+        assert (vehicle.lane, vehicle.offset) == (
+            vehicle.start_col,
+            vehicle.start_row,
+        )
+
+
+def test_vehicle_back_and_front(vehicle):
+    """
+    Test if the back and front match the first and last location.
+    """
+    assert vehicle.back == vehicle.location[0]
+    assert vehicle.front == vehicle.location[-1]
+
+    vehicle.offset += 1
+
+    assert vehicle.back == vehicle.location[0]
+    assert vehicle.front == vehicle.location[-1]
+
+
+def test_vehicle_set_location(vehicle):
+    """
+    Test if setting the location moves the vehicle.
+    """
+    vehicle.location = [(col + 1, row + 1) for col, row in vehicle.location]
+
+    assert vehicle.back == (vehicle.start_col + 1, vehicle.start_row + 1)
+
+
+def test_vehicle_slots(vehicle):
+    """
+    Test if vehicles don't carry a '__dict__'.
+    """
+    assert not hasattr(vehicle, '__dict__')
+
+    with pytest.raises(AttributeError):
+        vehicle.color = 'red'